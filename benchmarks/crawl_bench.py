@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Measure crawl throughput against the local mock site
+
+Runs Neo's generic spider in a throwaway Scrapy project against
+benchmarks/mock_site.py and reports requests/s, items/s, CPU time and
+peak RSS of the crawl process as JSON:
+
+    python3 benchmarks/crawl_bench.py --pages 200 --latency 0.05 --runs 3 \\
+        --set CONCURRENT_REQUESTS=32 --output after.json --compare before.json
+
+The project's settings.py is generated from the same template and
+defaults as Neo's own (AutoThrottle starting at a 1 s delay, for
+instance), without reading or creating the user's ~/.config/neo; `--set`
+overrides them. The HTTP cache
+is off unless `--cache` is given, and then every run starts with an empty
+cache, so all runs measure the same cold crawl.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+from mock_site import MockSite, add_site_arguments  # noqa: E402
+from src.neo_settings import default_scrapy_settings  # noqa: E402
+from src.project_files import (  # noqa: E402
+    SETTINGS_TEMPLATE, frontier_settings, merge_project_settings, neo_project_settings, sync_project_modules
+)
+
+SUMMARY_KEYS = ['requests_per_sec', 'items_per_sec', 'cpu_sec', 'peak_rss_mb']
+
+
+def parse_value(text):
+    # Aceitar números e booleanos como JSON, o resto como texto
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def create_project(path, settings):
+    (path / "neo_spiders").mkdir(parents=True)
+    (path / "scrapy.cfg").write_text("[settings]\ndefault = neo_spiders.settings\n")
+    (path / "neo_spiders" / "__init__.py").write_text("")
+
+    settings_file = path / "neo_spiders" / "settings.py"
+    settings_file.write_text(SETTINGS_TEMPLATE)
+    sync_project_modules(path)
+    merge_project_settings(settings_file, neo_project_settings(settings))
+
+
+def run_crawl(project, config_file, run, settings):
+    """Run one crawl and return its measurements"""
+    stats_file = project / f"stats-{run}.json"
+    crawl_settings = {
+        **settings,
+        **frontier_settings({'max_depth': 1}, project / "jobs" / str(run)),
+        'NEO_STATS_DUMP': str(stats_file),
+        'LOG_LEVEL': 'WARNING',
+        # Cache novo a cada run: nenhum run é servido pelo anterior
+        'HTTPCACHE_DIR': f"httpcache-{run}",
+    }
+
+    command = [sys.executable, '-m', 'scrapy', 'crawl', 'neo', '-a', f'config_file={config_file}']
+    for key, value in crawl_settings.items():
+        if not isinstance(value, str):
+            value = json.dumps(value)
+        command += ['-s', f'{key}={value}']
+
+    log_file = project / f"crawl-{run}.log"
+    start = time.perf_counter()
+    with open(log_file, 'w') as log:
+        process = subprocess.Popen(command, cwd=project, stdout=log, stderr=subprocess.STDOUT)
+        # wait4 dá o uso de recursos só deste processo
+        _, status, usage = os.wait4(process.pid, 0)
+    wall = time.perf_counter() - start
+
+    if os.waitstatus_to_exitcode(status) != 0 or not stats_file.exists():
+        sys.stderr.write(log_file.read_text()[-4000:])
+        sys.exit(f"❌ Crawl {run} failed, see the log above")
+
+    stats = json.loads(stats_file.read_text())
+    elapsed = stats.get('elapsed_time_seconds') or wall
+    requests = stats.get('downloader/request_count', 0)
+    items = stats.get('item_scraped_count', 0)
+
+    return {
+        'run': run,
+        'requests': requests,
+        'items': items,
+        'errors': stats.get('log_count/ERROR', 0),
+        'crawl_sec': round(elapsed, 3),
+        'wall_sec': round(wall, 3),
+        'requests_per_sec': round(requests / elapsed, 1),
+        'items_per_sec': round(items / elapsed, 1),
+        'cpu_sec': round(usage.ru_utime + usage.ru_stime, 3),
+        # ru_maxrss vem em KiB no Linux
+        'peak_rss_mb': round(usage.ru_maxrss / 1024, 1),
+        'cache_hits': stats.get('httpcache/hit', 0),
+    }
+
+
+def package_version(name):
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def print_comparison(result, baseline_file):
+    baseline = json.loads(Path(baseline_file).read_text())['summary']
+    print(f"📊 Compared with {baseline_file}", file=sys.stderr)
+    for key in SUMMARY_KEYS:
+        before, after = baseline.get(key), result['summary'][key]
+        if before:
+            print(f"   {key:<17} {before:>10} → {after:>10}  ({(after - before) / before:+.1%})",
+                  file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_site_arguments(parser)
+    parser.add_argument('--runs', type=int, default=3, help="crawls to run; the summary is the median")
+    parser.add_argument('--extraction', choices=['compiled', 'css'], default='compiled')
+    parser.add_argument('--cache', action='store_true',
+                        help="crawl with the HTTP cache on (empty for every run)")
+    parser.add_argument('--set', action='append', default=[], metavar='KEY=VALUE',
+                        help="override a Scrapy setting (repeatable)")
+    parser.add_argument('--output', help="write the JSON result to this file instead of stdout")
+    parser.add_argument('--compare', metavar='FILE', help="print changes against an earlier result")
+    args = parser.parse_args()
+
+    neo_settings = default_scrapy_settings()
+    neo_settings['HTTPCACHE_ENABLED'] = args.cache
+    for override in args.set:
+        key, _, value = override.partition('=')
+        neo_settings[key] = parse_value(value)
+
+    # Só as settings do Scrapy vão para o crawl; as NEO_* são do app
+    scrapy_settings = {key: value for key, value in neo_settings.items() if not key.startswith('NEO_')}
+
+    site = MockSite(0, args.pages, args.items, args.page_size, args.latency, args.jitter).start()
+    print(f"🌐 Mock site at {site.url} ({args.pages} pages × {args.items} items)", file=sys.stderr)
+
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="neo-bench-") as tmp:
+        project = Path(tmp)
+        create_project(project, neo_settings)
+
+        config_file = project / "spider.json"
+        config_file.write_text(json.dumps(site.spider_config(extraction=args.extraction)))
+
+        for run in range(1, args.runs + 1):
+            result = run_crawl(project, config_file, run, scrapy_settings)
+            runs.append(result)
+            print(f"   run {run}: {result['requests_per_sec']} req/s, {result['items_per_sec']} items/s, "
+                  f"{result['cpu_sec']} s CPU, {result['peak_rss_mb']} MB", file=sys.stderr)
+
+    site.stop()
+
+    result = {
+        'benchmark': 'crawl',
+        'date': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'scrapy': package_version('scrapy'),
+        'site': {
+            'pages': args.pages,
+            'items': args.items,
+            'page_size': args.page_size,
+            'latency': args.latency,
+            'jitter': args.jitter,
+        },
+        'extraction': args.extraction,
+        'settings': scrapy_settings,
+        'runs': runs,
+        'summary': {key: statistics.median(run[key] for run in runs) for key in SUMMARY_KEYS},
+    }
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+        print(f"✅ Saved {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    if args.compare:
+        print_comparison(result, args.compare)
+
+
+if __name__ == '__main__':
+    main()
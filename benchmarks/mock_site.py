@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Local stand-in site serving synthetic listing pages
+
+The index page links to every listing page; each listing page holds
+`items` products padded to roughly `page_size` bytes. Every response is
+delayed by `latency` seconds (plus optional jitter) to mimic a remote
+server:
+
+    python3 benchmarks/mock_site.py --pages 200 --items 50 --latency 0.05
+"""
+
+import argparse
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ITEM_SELECTOR = "div.product"
+LINK_SELECTOR = "a.page"
+FIELDS = [
+    {'name': 'title', 'selector': 'h2 a::text'},
+    {'name': 'url', 'selector': 'h2 a::attr(href)'},
+    {'name': 'price', 'selector': 'span.price::text'},
+    {'name': 'sku', 'selector': 'span.sku::text'},
+    {'name': 'description', 'selector': 'p.desc::text'},
+]
+
+
+def listing_page(page, items, page_size):
+    products = []
+    for i in range(items):
+        n = page * items + i
+        products.append(
+            f'<div class="product"><h2><a href="/item/{n}">Product {n}</a></h2>'
+            f'<span class="price">{n % 997}.99</span><span class="sku">SKU-{n:08d}</span>'
+            f'<p class="desc">Synthetic product number {n} on page {page}.</p></div>'
+        )
+
+    body = "".join(products)
+    # Preencher até o tamanho pedido, como scripts e menus de páginas reais
+    padding = max(0, page_size - len(body))
+    return (
+        f"<html><head><title>Page {page}</title></head><body>"
+        f"<main>{body}</main><footer><!-- {'x' * padding} --></footer></body></html>"
+    )
+
+
+def index_page(pages):
+    links = "".join(f'<a class="page" href="/page/{n}">{n}</a>' for n in range(pages))
+    return f"<html><body><nav>{links}</nav></body></html>"
+
+
+class MockSite:
+    """Threaded HTTP server for the synthetic site, runnable in-process"""
+
+    def __init__(self, port=0, pages=100, items=50, page_size=50_000, latency=0.0, jitter=0.0):
+        self.pages = pages
+        self.items = items
+        self.page_size = page_size
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+        self.lock = threading.Lock()
+
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                site.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address
+        return f"http://{host}:{port}/"
+
+    def handle(self, request):
+        with self.lock:
+            self.requests += 1
+
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+
+        path = request.path.rstrip('/')
+        if path == '':
+            body = index_page(self.pages)
+        elif path.startswith('/page/') and path[6:].isdigit() and int(path[6:]) < self.pages:
+            body = listing_page(int(path[6:]), self.items, self.page_size)
+        else:
+            request.send_error(404)
+            return
+
+        data = body.encode()
+        request.send_response(200)
+        request.send_header('Content-Type', 'text/html; charset=utf-8')
+        request.send_header('Content-Length', str(len(data)))
+        request.end_headers()
+        request.wfile.write(data)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def spider_config(self, name='mock_site', extraction='compiled'):
+        """Return a Neo spider config that crawls the whole site"""
+        return {
+            'name': name,
+            'start_urls': [self.url],
+            'allowed_domains': ['127.0.0.1'],
+            'item_selector': ITEM_SELECTOR,
+            'fields': FIELDS,
+            'extraction': extraction,
+            'follow_links': {'selector': LINK_SELECTOR, 'max_depth': 1, 'max_per_domain': 0},
+        }
+
+
+def add_site_arguments(parser):
+    parser.add_argument('--pages', type=int, default=100, help="listing pages on the site")
+    parser.add_argument('--items', type=int, default=50, help="items per listing page")
+    parser.add_argument('--page-size', type=int, default=50_000, help="approximate page size in bytes")
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="random extra latency, up to this many seconds")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=8800)
+    add_site_arguments(parser)
+    args = parser.parse_args()
+
+    site = MockSite(args.port, args.pages, args.items, args.page_size, args.latency, args.jitter)
+    print(f"🌐 Serving {args.pages} pages × {args.items} items at {site.url}")
+    try:
+        site.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
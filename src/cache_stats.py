@@ -0,0 +1,63 @@
+import sqlite3
+from pathlib import Path
+
+from .results_store import connect_store
+
+# Arquivo do cache dentro do projeto Scrapy (ver neo_spiders/httpcache.py)
+CACHE_DB = Path(".scrapy") / "httpcache" / "neo_cache.db"
+
+
+def cache_db_path(project_path):
+    return Path(project_path) / CACHE_DB
+
+
+def read_cache_stats(db_path):
+    """Return size and hit/miss totals of the HTTP cache, or None"""
+    if not db_path.exists():
+        return None
+
+    conn = connect_store(db_path)
+    try:
+        entries, stored = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        counters = dict(conn.execute("SELECT name, value FROM counters"))
+    except sqlite3.Error as e:
+        print(f"⚠️  Could not read cache stats: {e}")
+        return None
+    finally:
+        conn.close()
+
+    # Tamanho real em disco inclui o WAL
+    disk = sum(
+        path.stat().st_size
+        for path in (db_path, db_path.with_name(db_path.name + "-wal"))
+        if path.exists()
+    )
+
+    hits = counters.get('hits', 0)
+    misses = counters.get('misses', 0)
+    return {
+        'entries': entries,
+        'stored_bytes': stored,
+        'disk_bytes': disk,
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': hits / (hits + misses) if hits + misses else None,
+        'evictions': counters.get('evictions', 0),
+    }
+
+
+def clear_cache(db_path):
+    """Remove every cached response and reset the counters"""
+    if not db_path.exists():
+        return
+
+    conn = sqlite3.connect(db_path, timeout=10)
+    try:
+        with conn:
+            conn.execute("DELETE FROM responses")
+            conn.execute("DELETE FROM counters")
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
@@ -0,0 +1,73 @@
+import logging
+import logging.handlers
+import re
+import threading
+from collections import deque
+
+LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+
+# Formato padrão do Scrapy: "2025-01-01 12:00:00 [scrapy.core.engine] INFO: ..."
+LEVEL_RE = re.compile(r'\] (DEBUG|INFO|WARNING|ERROR|CRITICAL): ')
+
+MAX_LINES = 2000
+MAX_FILE_BYTES = 10 * 1024 * 1024
+BACKUP_COUNT = 3
+
+
+def level_value(level):
+    """Return the numeric severity of a level name"""
+    return LOG_LEVELS.index(level) if level in LOG_LEVELS else 0
+
+
+class CrawlLog:
+    """Bounded in-memory log of a crawl
+
+    The last MAX_LINES lines are kept in a ring buffer for the live log
+    panel; every line is also written to a rotating per-run log file.
+    """
+
+    def __init__(self, log_path, max_lines=MAX_LINES):
+        self.path = log_path
+        self.lines = deque(maxlen=max_lines)
+        self.total = 0
+        self.errors = 0
+        self.level = 'INFO'
+        self.closed = False
+        self.lock = threading.Lock()
+
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.handler = logging.handlers.RotatingFileHandler(
+            log_path, maxBytes=MAX_FILE_BYTES, backupCount=BACKUP_COUNT,
+            encoding='utf-8'
+        )
+
+    def append(self, line):
+        """Add a line read from the crawl output"""
+        match = LEVEL_RE.search(line)
+        starts_entry = bool(match) or line.startswith('Traceback')
+        if match:
+            self.level = match.group(1)
+        elif starts_entry:
+            self.level = 'ERROR'
+        # Linhas de continuação (tracebacks) herdam o nível anterior
+
+        with self.lock:
+            self.lines.append((self.level, line))
+            self.total += 1
+            if starts_entry and level_value(self.level) >= level_value('ERROR'):
+                self.errors += 1
+
+        self.handler.handle(logging.makeLogRecord({'msg': line}))
+
+    def snapshot(self, min_level='DEBUG'):
+        """Return buffered lines at or above a level"""
+        threshold = level_value(min_level)
+        with self.lock:
+            return [
+                line for level, line in self.lines
+                if level_value(level) >= threshold
+            ]
+
+    def close(self):
+        self.handler.close()
+        self.closed = True
@@ -0,0 +1,155 @@
+import json
+import os
+import socket
+import threading
+from collections import deque
+
+# Janela usada para calcular as taxas
+RATE_WINDOW = 10  # s
+
+STATUS_PREFIX = 'downloader/response_status_count/'
+
+# Contagens do modo delta e seus rótulos
+DELTA_COUNTS = [('inserted', 'new'), ('updated', 'changed'), ('removed', 'removed')]
+
+
+def format_bytes(count):
+    """Format a byte count for display"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(count) < 1024 or unit == 'GB':
+            return f"{count:.0f} {unit}" if unit == 'B' else f"{count:.1f} {unit}"
+        count /= 1024
+
+
+class CrawlStats:
+    """Rolling throughput figures computed from stats snapshots"""
+
+    def __init__(self):
+        self.samples = deque()
+        self.stats = {}
+        self.queue = 0
+        self.inflight = 0
+        self.finished = None
+        self.lock = threading.Lock()
+
+    def update(self, snapshot):
+        """Record a snapshot sent by the stats extension"""
+        stats = snapshot.get('stats', {})
+        sample = (
+            snapshot['time'],
+            stats.get('item_scraped_count', 0),
+            stats.get('downloader/request_count', 0),
+            stats.get('downloader/response_bytes', 0),
+        )
+
+        with self.lock:
+            self.samples.append(sample)
+            while self.samples[-1][0] - self.samples[0][0] > RATE_WINDOW:
+                self.samples.popleft()
+
+            self.stats = stats
+            self.queue = snapshot.get('queue', 0)
+            self.inflight = snapshot.get('inflight', 0)
+            self.finished = snapshot.get('finished')
+
+    def rates(self):
+        """Return (items/s, requests/s, bytes/s) over the rate window"""
+        with self.lock:
+            if len(self.samples) < 2:
+                return 0.0, 0.0, 0.0
+            first, last = self.samples[0], self.samples[-1]
+
+        elapsed = last[0] - first[0] or 1
+        return tuple((last[i] - first[i]) / elapsed for i in (1, 2, 3))
+
+    def status_counts(self):
+        """Return response counts by HTTP status code"""
+        with self.lock:
+            return {
+                key[len(STATUS_PREFIX):]: value
+                for key, value in self.stats.items()
+                if key.startswith(STATUS_PREFIX)
+            }
+
+    def summary(self):
+        """One-line description for a crawl row"""
+        items, requests, data = self.rates()
+        parts = [
+            f"{items:.1f} items/s",
+            f"{requests:.1f} req/s",
+            f"{format_bytes(data)}/s",
+            f"queue {self.queue}",
+            f"in-flight {self.inflight}",
+        ]
+
+        codes = self.status_counts()
+        if codes:
+            parts.append(" ".join(f"{code}×{count}" for code, count in sorted(codes.items())))
+
+        for extra in (self.delta_summary(), self.revalidation_summary()):
+            if extra:
+                parts.append(extra)
+
+        return " · ".join(parts)
+
+    def revalidation_summary(self):
+        """Describe what conditional revalidation saved, or return None"""
+        with self.lock:
+            not_modified = self.stats.get('neo/revalidate/not_modified', 0)
+            saved_bytes = self.stats.get('neo/revalidate/bytes_saved', 0)
+            saved_seconds = self.stats.get('neo/revalidate/seconds_saved', 0)
+
+        if not not_modified:
+            return None
+        return f"{not_modified} unchanged, {format_bytes(saved_bytes)} and {saved_seconds:.0f} s saved"
+
+    def delta_summary(self):
+        """Describe the changes found by a delta crawl, or return None"""
+        with self.lock:
+            if not any(key.startswith('neo/delta/') for key in self.stats):
+                return None
+            counts = [(self.stats.get(f'neo/delta/{key}', 0), label) for key, label in DELTA_COUNTS]
+
+        return ", ".join(f"{count} {label}" for count, label in counts)
+
+
+class StatsReceiver:
+    """Receive stats snapshots from a crawl over a Unix datagram socket"""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.stats = CrawlStats()
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind(self.path)
+        self.sock.settimeout(0.5)
+
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._receive, daemon=True)
+        self._thread.start()
+
+    def _receive(self):
+        while not self._closed.is_set():
+            try:
+                data = self.sock.recv(1024 * 1024)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+
+            try:
+                self.stats.update(json.loads(data))
+            except (ValueError, KeyError):
+                continue
+
+    def close(self):
+        """Stop receiving and remove the socket file"""
+        self._closed.set()
+        self._thread.join(timeout=1)
+        self.sock.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
@@ -0,0 +1,140 @@
+import json
+import queue
+import subprocess
+import sys
+import threading
+
+from .crawl_log import CrawlLog
+
+
+class EngineJob:
+    """Process-like handle for a crawl running inside the shared engine
+
+    Exposes the same `stdout`, `wait()` and `terminate()` used for crawl
+    subprocesses, so jobs are driven the same way in both modes.
+    """
+
+    def __init__(self, engine, job_id):
+        self.engine = engine
+        self.job_id = job_id
+        self.lines = queue.Queue()
+        self.returncode = None
+        self.reason = None
+        self._done = threading.Event()
+
+    @property
+    def stdout(self):
+        while True:
+            line = self.lines.get()
+            if line is None:
+                return
+            yield line
+
+    def _finish(self, reason, failed=False):
+        if self._done.is_set():
+            return
+        self.reason = reason
+        # Qualquer motivo de fechamento do Scrapy conta como crawl concluído
+        self.returncode = 1 if failed else 0
+        self.lines.put(None)
+        self._done.set()
+
+    def terminate(self):
+        self.engine.send({'cmd': 'stop', 'job': self.job_id})
+
+    def wait(self):
+        self._done.wait()
+        return self.returncode
+
+
+class CrawlEngine:
+    """Client for the long-lived crawl engine process
+
+    The engine (`neo_spiders.engine` in the Scrapy project) is started on
+    first use and hosts every crawl on one warm CrawlerRunner.
+    """
+
+    def __init__(self, project_path):
+        self.project_path = project_path
+        self.process = None
+        self.jobs = {}
+        self.lock = threading.Lock()
+
+    def _ensure_running(self):
+        if self.process is not None and self.process.poll() is None:
+            return
+
+        print("🚀 Starting crawl engine")
+        engine_log = CrawlLog(self.project_path / "logs" / "engine.log")
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'neo_spiders.engine'],
+            cwd=str(self.project_path),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+
+        threading.Thread(target=self._read_events, args=(self.process,), daemon=True).start()
+        threading.Thread(target=self._read_log, args=(self.process, engine_log), daemon=True).start()
+
+    def send(self, message):
+        with self.lock:
+            if self.process is None or self.process.poll() is not None:
+                return
+            try:
+                self.process.stdin.write(json.dumps(message) + '\n')
+                self.process.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                print(f"❌ Crawl engine unavailable: {e}")
+
+    def submit(self, job_id, spider_name, settings, args=None):
+        """Start a crawl in the engine and return its handle"""
+        with self.lock:
+            self._ensure_running()
+            job = EngineJob(self, job_id)
+            self.jobs[job_id] = job
+
+        self.send({
+            'cmd': 'crawl',
+            'job': job_id,
+            'spider': spider_name,
+            'settings': settings,
+            'args': args or {},
+        })
+        return job
+
+    def _read_events(self, process):
+        for line in process.stdout:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+
+            job = self.jobs.get(event.get('job'))
+            if job is None:
+                continue
+
+            if event['event'] == 'log':
+                job.lines.put(event['line'])
+            elif event['event'] == 'finished':
+                self.jobs.pop(job.job_id, None)
+                job._finish(event.get('reason'), event.get('failed', False))
+
+        # Engine terminou: encerrar os jobs pendentes
+        print("⚠️  Crawl engine exited")
+        for job in list(self.jobs.values()):
+            job._finish('engine exited', failed=True)
+        self.jobs.clear()
+
+    def _read_log(self, process, engine_log):
+        for line in process.stderr:
+            engine_log.append(line.rstrip('\n'))
+        engine_log.close()
+
+    def shutdown(self):
+        """Ask the engine to finish its crawls and exit"""
+        with self.lock:
+            if self.process is not None and self.process.poll() is None:
+                self.process.stdin.close()
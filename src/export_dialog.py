@@ -0,0 +1,97 @@
+from gi.repository import Gtk, Adw, GLib
+import threading
+import time
+
+from .exporter import ExportCancelled
+
+# Intervalo mínimo entre atualizações da barra de progresso
+PROGRESS_INTERVAL = 0.1  # s
+
+
+class ExportDialog(Adw.Dialog):
+    """Dialog showing the progress of a background export"""
+
+    def __init__(self, exporter, callback, **kwargs):
+        super().__init__(**kwargs)
+
+        self.exporter = exporter
+        self.callback = callback
+        self.set_title("Exporting Results")
+        self.set_content_width(400)
+        self.set_can_close(False)
+
+        self._last_update = 0
+
+        self._build_ui()
+
+        thread = threading.Thread(target=self._run_export, daemon=True)
+        thread.start()
+
+    def _build_ui(self):
+        """Build export progress interface"""
+        content = Adw.ToolbarView()
+
+        header = Adw.HeaderBar()
+        header.set_show_end_title_buttons(False)
+        content.add_top_bar(header)
+
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+        box.set_margin_top(20)
+        box.set_margin_bottom(20)
+        box.set_margin_start(20)
+        box.set_margin_end(20)
+
+        self.file_label = Gtk.Label(label=self.exporter.path.name)
+        self.file_label.add_css_class("heading")
+        box.append(self.file_label)
+
+        self.progress_bar = Gtk.ProgressBar()
+        self.progress_bar.set_show_text(True)
+        box.append(self.progress_bar)
+
+        self.count_label = Gtk.Label(label="0 items")
+        self.count_label.add_css_class("dim-label")
+        box.append(self.count_label)
+
+        cancel_btn = Gtk.Button(label="Cancel")
+        cancel_btn.set_halign(Gtk.Align.CENTER)
+        cancel_btn.add_css_class("pill")
+        cancel_btn.connect("clicked", self.on_cancel_clicked)
+        box.append(cancel_btn)
+
+        content.set_content(box)
+        self.set_child(content)
+
+    def on_cancel_clicked(self, button):
+        """Cancel the running export"""
+        button.set_sensitive(False)
+        self.exporter.cancel()
+
+    def _run_export(self):
+        """Run the exporter on a worker thread"""
+        try:
+            count = self.exporter.run(self._on_progress)
+            GLib.idle_add(self._finish, count, None)
+        except ExportCancelled:
+            GLib.idle_add(self._finish, None, None)
+        except Exception as e:
+            GLib.idle_add(self._finish, None, e)
+
+    def _on_progress(self, fraction, count):
+        """Throttle progress updates to the main loop"""
+        now = time.monotonic()
+        if now - self._last_update < PROGRESS_INTERVAL:
+            return
+        self._last_update = now
+        GLib.idle_add(self._update_progress, fraction, count)
+
+    def _update_progress(self, fraction, count):
+        self.progress_bar.set_fraction(min(fraction, 1.0))
+        self.count_label.set_label(f"{count} items")
+
+    def _finish(self, count, error):
+        """Close the dialog and report the result"""
+        self.set_can_close(True)
+        self.close()
+        if self.callback:
+            self.callback(count, error)
@@ -0,0 +1,98 @@
+import csv
+import json
+import os
+import threading
+from pathlib import Path
+
+EXPORT_FORMATS = {
+    '.json': 'json',
+    '.jsonl': 'jsonl',
+    '.csv': 'csv',
+}
+
+
+class ExportCancelled(Exception):
+    """Raised when an export is cancelled by the user"""
+
+
+class ResultsExporter:
+    """Stream results to a JSON, JSON Lines or CSV file
+
+    `reader` is a callable returning an iterator of (item, progress) pairs,
+    so items are written one at a time and never held in memory together.
+    """
+
+    def __init__(self, reader, path):
+        self.reader = reader
+        self.path = Path(path)
+        self.format = EXPORT_FORMATS.get(self.path.suffix.lower(), 'json')
+        self.count = 0
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Request the export to stop"""
+        self._cancelled.set()
+
+    def run(self, progress_callback=None):
+        """Write the export file and return the number of items written"""
+        tmp_path = self.path.with_name(self.path.name + '.part')
+        report = progress_callback or (lambda fraction, count: None)
+
+        try:
+            with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+                if self.format == 'csv':
+                    self._write_csv(f, report)
+                elif self.format == 'jsonl':
+                    self._write_jsonl(f, report)
+                else:
+                    self._write_json(f, report)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        return self.count
+
+    def _items(self, report, start=0.0, span=1.0):
+        """Iterate source items, checking for cancellation"""
+        for item, fraction in self.reader():
+            if self._cancelled.is_set():
+                raise ExportCancelled()
+            yield item
+            report(start + fraction * span, self.count)
+
+    def _write_json(self, f, report):
+        f.write('[')
+        for item in self._items(report):
+            f.write(',\n' if self.count else '\n')
+            f.write(json.dumps(item, ensure_ascii=False))
+            self.count += 1
+        f.write('\n]\n')
+
+    def _write_jsonl(self, f, report):
+        for item in self._items(report):
+            f.write(json.dumps(item, ensure_ascii=False))
+            f.write('\n')
+            self.count += 1
+
+    def _write_csv(self, f, report):
+        # Primeira passada: cabeçalho com todos os campos encontrados
+        fields = {}
+        total = 0
+        for item in self._items(report, 0.0, 0.5):
+            fields.update(dict.fromkeys(item))
+            total += 1
+
+        writer = csv.DictWriter(f, fieldnames=list(fields), restval='')
+        writer.writeheader()
+
+        for item in self._items(report, 0.5, 0.5):
+            # Run ainda ativo: itens novos podem ter campos fora do cabeçalho
+            if self.count == total:
+                break
+            writer.writerow({
+                key: value if isinstance(value, (str, int, float)) or value is None
+                else json.dumps(value, ensure_ascii=False)
+                for key, value in item.items()
+            })
+            self.count += 1
@@ -1,6 +1,40 @@
 import json
+import sqlite3
+from contextlib import closing
+from datetime import datetime
 from pathlib import Path
 
+from .profiles import profile_settings
+
+SPIDERS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS spiders (
+    name TEXT PRIMARY KEY,
+    config TEXT NOT NULL,
+    created TEXT NOT NULL,
+    updated TEXT NOT NULL
+);
+"""
+
+
+def default_scrapy_settings():
+    """Return the Scrapy and NEO_* settings used until the user saves others"""
+    return {
+        # Perfil 'balanced': concorrência, timeouts, retries etc.
+        **profile_settings('balanced'),
+        'ROBOTSTXT_OBEY': True,
+        'USER_AGENT': 'Neo/1.0 (+https://github.com/user/neo)',
+        'HTTPCACHE_ENABLED': True,
+        'NEO_HTTPCACHE_MAX_MB': 1024,
+        'NEO_REVALIDATE': False,
+        'NEO_RESULTS_STORE': True,
+        'NEO_FEED_COMPRESSION': 'none',
+        'NEO_KEEP_RUNS': 20,
+        'NEO_RESULTS_MAX_GB': 10,
+        'NEO_MAX_CRAWLS': 4,
+        'NEO_CRAWL_MODE': 'subprocess',
+        'NEO_WORKER_POOL_SIZE': 2,
+    }
+
 
 class NeoSettings:
     """Manage Neo application settings"""
@@ -10,26 +44,98 @@ class NeoSettings:
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
         self.spiders_file = self.config_dir / "spiders.json"
+        self.spiders_db = self.config_dir / "spiders.db"
         self.settings_file = self.config_dir / "scrapy_settings.json"
 
+        self._init_spiders_db()
+
+    def _connect_spiders(self):
+        conn = sqlite3.connect(self.spiders_db, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_spiders_db(self):
+        """Create the spider config store and import the old JSON file once"""
+        with closing(self._connect_spiders()) as conn:
+            conn.executescript(SPIDERS_SCHEMA)
+
+            if self.spiders_file.exists():
+                self._migrate_spiders_file(conn)
+
+    def _migrate_spiders_file(self, conn):
+        try:
+            with open(self.spiders_file, 'r') as f:
+                spiders = json.load(f)
+        except (OSError, ValueError) as e:
+            # Deixar o arquivo no lugar para não perder nada
+            print(f"⚠️  Could not migrate {self.spiders_file.name}: {e}")
+            return
+
+        now = datetime.now().isoformat()
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO spiders (name, config, created, updated) VALUES (?, ?, ?, ?)",
+                [
+                    (config['name'], json.dumps(config), config.get('created', now), now)
+                    for config in spiders
+                    if config.get('name')
+                ]
+            )
+
+        self.spiders_file.rename(self.spiders_file.with_suffix('.json.migrated'))
+        print(f"✅ Migrated {len(spiders)} spider config(s) to {self.spiders_db.name}")
+
     def save_spider_config(self, spider_config):
-        """Save spider configuration"""
-        spiders = self.load_spiders_config()
-        spiders.append(spider_config)
+        """Save spider configuration, replacing any config with the same name"""
+        now = datetime.now().isoformat()
+
+        with closing(self._connect_spiders()) as conn, conn:
+            conn.execute(
+                """
+                INSERT INTO spiders (name, config, created, updated) VALUES (?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET config = excluded.config, updated = excluded.updated
+                """,
+                (spider_config['name'], json.dumps(spider_config),
+                 spider_config.get('created', now), now)
+            )
+
+    def get_spider_config(self, name):
+        """Return the configuration of one spider, or None"""
+        with closing(self._connect_spiders()) as conn:
+            row = conn.execute("SELECT config FROM spiders WHERE name = ?", (name,)).fetchone()
+
+        return json.loads(row['config']) if row else None
+
+    def update_spider_config(self, name, changes):
+        """Merge changes into a spider configuration; returns the new config"""
+        with closing(self._connect_spiders()) as conn, conn:
+            # Travar antes de ler para não perder escritas concorrentes
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT config FROM spiders WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                return None
+
+            config = {**json.loads(row['config']), **changes, 'name': name}
+            conn.execute(
+                "UPDATE spiders SET config = ?, updated = ? WHERE name = ?",
+                (json.dumps(config), datetime.now().isoformat(), name)
+            )
 
-        with open(self.spiders_file, 'w') as f:
-            json.dump(spiders, f, indent=2)
+        return config
+
+    def delete_spider_config(self, name):
+        """Remove a spider configuration; returns True if it existed"""
+        with closing(self._connect_spiders()) as conn, conn:
+            cursor = conn.execute("DELETE FROM spiders WHERE name = ?", (name,))
+
+        return cursor.rowcount > 0
 
     def load_spiders_config(self):
         """Load spider configurations"""
-        if not self.spiders_file.exists():
-            return []
+        with closing(self._connect_spiders()) as conn:
+            rows = conn.execute("SELECT config FROM spiders ORDER BY created").fetchall()
 
-        try:
-            with open(self.spiders_file, 'r') as f:
-                return json.load(f)
-        except:
-            return []
+        return [json.loads(row['config']) for row in rows]
 
     def save_scrapy_settings(self, settings):
         """Save Scrapy settings"""
@@ -38,20 +144,14 @@ class NeoSettings:
 
     def load_scrapy_settings(self):
         """Load Scrapy settings"""
-        default_settings = {
-            'CONCURRENT_REQUESTS': 16,
-            'DOWNLOAD_DELAY': 0,
-            'ROBOTSTXT_OBEY': True,
-            'USER_AGENT': 'Neo/1.0 (+https://github.com/user/neo)',
-            'AUTOTHROTTLE_ENABLED': True,
-            'HTTPCACHE_ENABLED': True,
-        }
+        default_settings = default_scrapy_settings()
 
         if not self.settings_file.exists():
             return default_settings
 
+        # Chaves novas ficam com o valor padrão em arquivos antigos
         try:
             with open(self.settings_file, 'r') as f:
-                return json.load(f)
+                return {**default_settings, **json.load(f)}
         except:
             return default_settings
@@ -0,0 +1,67 @@
+# Perfis de desempenho do downloader
+PROFILES = ['polite', 'balanced', 'max_throughput']
+PROFILE_LABELS = ['Polite', 'Balanced', 'Max Throughput']
+
+PROFILE_SETTINGS = {
+    'polite': {
+        'CONCURRENT_REQUESTS': 8,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 2,
+        'CONCURRENT_REQUESTS_PER_IP': 2,
+        'DOWNLOAD_DELAY': 1.0,
+        'DNSCACHE_SIZE': 10000,
+        'REACTOR_THREADPOOL_MAXSIZE': 10,
+        'DOWNLOAD_MAXSIZE': 32 * 1024 * 1024,
+        'DOWNLOAD_WARNSIZE': 8 * 1024 * 1024,
+        'DOWNLOAD_TIMEOUT': 60,
+        'RETRY_ENABLED': True,
+        'RETRY_TIMES': 3,
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 1.0,
+    },
+    'balanced': {
+        'CONCURRENT_REQUESTS': 16,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 8,
+        'CONCURRENT_REQUESTS_PER_IP': 0,
+        'DOWNLOAD_DELAY': 0,
+        'DNSCACHE_SIZE': 10000,
+        'REACTOR_THREADPOOL_MAXSIZE': 10,
+        'DOWNLOAD_MAXSIZE': 64 * 1024 * 1024,
+        'DOWNLOAD_WARNSIZE': 16 * 1024 * 1024,
+        'DOWNLOAD_TIMEOUT': 30,
+        'RETRY_ENABLED': True,
+        'RETRY_TIMES': 2,
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 4.0,
+    },
+    'max_throughput': {
+        'CONCURRENT_REQUESTS': 100,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 32,
+        'CONCURRENT_REQUESTS_PER_IP': 0,
+        'DOWNLOAD_DELAY': 0,
+        'DNSCACHE_SIZE': 50000,
+        'REACTOR_THREADPOOL_MAXSIZE': 20,
+        'DOWNLOAD_MAXSIZE': 16 * 1024 * 1024,
+        'DOWNLOAD_WARNSIZE': 4 * 1024 * 1024,
+        'DOWNLOAD_TIMEOUT': 15,
+        'RETRY_ENABLED': True,
+        'RETRY_TIMES': 1,
+        'AUTOTHROTTLE_ENABLED': False,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 16.0,
+    },
+}
+
+# Chaves controladas pelos perfis
+PROFILE_KEYS = list(PROFILE_SETTINGS['balanced'])
+
+
+def profile_settings(name):
+    """Return a copy of a profile's Scrapy settings"""
+    return dict(PROFILE_SETTINGS[name])
+
+
+def matching_profile(settings):
+    """Return the profile whose values all match `settings`, or None"""
+    for name in PROFILES:
+        if all(settings.get(key) == value for key, value in PROFILE_SETTINGS[name].items()):
+            return name
+    return None
@@ -0,0 +1,193 @@
+import ast
+from pathlib import Path
+
+# Módulos do Neo copiados para dentro do projeto Scrapy
+PROJECT_TEMPLATE_DIR = Path(__file__).parent / "scrapy_project"
+
+# settings.py inicial; neo_project_settings completa o resto
+SETTINGS_TEMPLATE = """# Scrapy settings for neo_spiders project
+
+BOT_NAME = "neo_spiders"
+
+SPIDER_MODULES = ["neo_spiders.spiders"]
+NEWSPIDER_MODULE = "neo_spiders.spiders"
+
+# Obey robots.txt rules
+ROBOTSTXT_OBEY = True
+
+# Configure maximum concurrent requests
+CONCURRENT_REQUESTS = 16
+
+# Configure a delay for requests
+DOWNLOAD_DELAY = 0
+
+# User agent
+USER_AGENT = "Neo/1.0 (+https://github.com/user/neo)"
+
+# AutoThrottle extension
+AUTOTHROTTLE_ENABLED = True
+AUTOTHROTTLE_START_DELAY = 1
+AUTOTHROTTLE_MAX_DELAY = 10
+
+# HTTP Cache
+HTTPCACHE_ENABLED = True
+HTTPCACHE_EXPIRATION_SECS = 86400
+HTTPCACHE_DIR = "httpcache"
+
+REQUEST_FINGERPRINTER_IMPLEMENTATION = "2.7"
+TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
+FEED_EXPORT_ENCODING = "utf-8"
+"""
+
+
+def sync_project_modules(project_path):
+    """Copy Neo's project-side modules into the Scrapy project
+
+    Returns the list of files that were created or updated.
+    """
+    updated = []
+
+    for source in sorted(PROJECT_TEMPLATE_DIR.rglob("*.py")):
+        target = Path(project_path) / source.relative_to(PROJECT_TEMPLATE_DIR)
+        content = source.read_text()
+
+        if target.exists() and target.read_text() == content:
+            continue
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content)
+        updated.append(target)
+
+    return updated
+
+
+def neo_project_settings(settings):
+    """Return the settings.py values Neo's project modules rely on"""
+    # Desligado a não ser que NEO_DEDUP seja definido para o crawl
+    pipelines = {'neo_spiders.pipelines.DedupPipeline': 100}
+    if settings.get('NEO_RESULTS_STORE', True):
+        pipelines['neo_spiders.pipelines.SQLiteStorePipeline'] = 300
+
+    max_mb = settings.get('NEO_HTTPCACHE_MAX_MB', 1024)
+
+    if settings.get('NEO_REVALIDATE', False):
+        # Toda página em cache é conferida com o site; nada expira
+        cache_policy = {
+            'HTTPCACHE_POLICY': 'neo_spiders.httpcache.RevalidatePolicy',
+            'HTTPCACHE_EXPIRATION_SECS': 0,
+        }
+    else:
+        cache_policy = {
+            'HTTPCACHE_POLICY': 'scrapy.extensions.httpcache.DummyPolicy',
+            'HTTPCACHE_EXPIRATION_SECS': 86400,
+        }
+
+    return {
+        # Só o spider genérico; spiders antigos são carregados sob demanda
+        'SPIDER_MODULES': ['neo_spiders.generic'],
+        'ITEM_PIPELINES': pipelines,
+        'EXTENSIONS': {
+            'neo_spiders.extensions.NeoStatsExtension': 500,
+            'neo_spiders.extensions.NeoStatsDump': 510,
+            'neo_spiders.extensions.NeoLatencyStats': 520,
+            'neo_spiders.extensions.NeoFieldStats': 530,
+        },
+        # Cache comprimido num único arquivo, com limite de tamanho
+        'HTTPCACHE_STORAGE': 'neo_spiders.httpcache.SQLiteCacheStorage',
+        'NEO_HTTPCACHE_MAX_BYTES': max_mb * 1024 * 1024,
+        **cache_policy,
+        'DOWNLOADER_MIDDLEWARES': {
+            # Desligado a não ser que NEO_DOMAIN_MAX_REQUESTS seja definido
+            'neo_spiders.frontier.DomainBudgetMiddleware': 50,
+            # Só com RevalidatePolicy; depois do HttpCacheMiddleware (900)
+            'neo_spiders.httpcache.RevalidateStatsMiddleware': 880,
+        },
+    }
+
+
+def frontier_settings(follow_links, job_dir):
+    """Return the crawl settings for a spider that follows links
+
+    Requests are queued on disk under `job_dir` and deduplicated with a
+    Bloom filter, breadth-first, so memory stays flat on deep crawls.
+    """
+    return {
+        'JOBDIR': str(job_dir),
+        'DEPTH_LIMIT': follow_links.get('max_depth', 3),
+        'DEPTH_PRIORITY': 1,
+        'SCHEDULER_DISK_QUEUE': 'scrapy.squeues.PickleFifoDiskQueue',
+        'SCHEDULER_MEMORY_QUEUE': 'scrapy.squeues.FifoMemoryQueue',
+        'DUPEFILTER_CLASS': 'neo_spiders.frontier.BloomDupeFilter',
+        'NEO_DOMAIN_MAX_REQUESTS': follow_links.get('max_per_domain', 0),
+    }
+
+
+def feed_options(compression):
+    """Return the FEEDS options of a run feed written with `compression`
+
+    Compressed feeds go through the frame plugins of neo_spiders.compression,
+    which keep the file readable while the crawl writes it.
+    """
+    options = {'format': 'jsonlines', 'overwrite': True}
+    plugins = {
+        'gzip': 'neo_spiders.compression.GzipFramePlugin',
+        'zstd': 'neo_spiders.compression.ZstdFramePlugin',
+    }
+    if compression in plugins:
+        options['postprocessing'] = [plugins[compression]]
+    return options
+
+
+def replay_settings():
+    """Return the crawl settings that serve every response from the HTTP cache
+
+    Requests missing from the cache are dropped instead of downloaded, so a
+    replay never touches the network and needs no politeness delays.
+    """
+    return {
+        'HTTPCACHE_ENABLED': True,
+        'HTTPCACHE_IGNORE_MISSING': True,
+        'HTTPCACHE_EXPIRATION_SECS': 0,
+        'HTTPCACHE_POLICY': 'scrapy.extensions.httpcache.DummyPolicy',
+        'ROBOTSTXT_OBEY': False,
+        'CONCURRENT_REQUESTS': 64,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 64,
+        'DOWNLOAD_DELAY': 0,
+        'AUTOTHROTTLE_ENABLED': False,
+        'RETRY_ENABLED': False,
+        # Replays não alteram o estado do modo delta
+        'NEO_DELTA': False,
+    }
+
+
+def merge_project_settings(settings_file, values):
+    """Set top-level assignments in settings.py, keeping everything else
+
+    Existing assignments are replaced in place (including multi-line
+    ones) and missing names are appended at the end of the file.
+    """
+    source = settings_file.read_text()
+    lines = source.splitlines()
+
+    # Localizar atribuições de nível superior
+    spans = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            if isinstance(target, ast.Name) and target.id in values:
+                spans[target.id] = (node.lineno - 1, node.end_lineno)
+
+    # Substituir de baixo para cima para manter os números de linha
+    for name, (start, end) in sorted(spans.items(), key=lambda s: s[1], reverse=True):
+        lines[start:end] = [f"{name} = {values[name]!r}"]
+
+    missing = [name for name in values if name not in spans]
+    if missing:
+        if lines and lines[-1].strip():
+            lines.append("")
+        for name in missing:
+            lines.append(f"{name} = {values[name]!r}")
+
+    content = "\n".join(lines) + "\n"
+    if content != source:
+        settings_file.write_text(content)
@@ -0,0 +1,108 @@
+import json
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from .project_files import replay_settings
+
+# Contagens gravadas pela extensão NeoFieldStats
+FIELD_PREFIX = 'neo/field/'
+
+
+class ReplayCancelled(Exception):
+    """Raised when a replay is cancelled"""
+
+
+def field_counts(stats):
+    """Return the item count and the non-empty values of each field"""
+    return {
+        'items': stats.get('item_scraped_count', 0),
+        'fields': {
+            key[len(FIELD_PREFIX):]: value
+            for key, value in stats.items()
+            if key.startswith(FIELD_PREFIX)
+        },
+    }
+
+
+def last_run_counts(stats_dir):
+    """Return the field counts of the newest saved crawl stats, or None"""
+    # Run IDs começam com a data, então a ordem é cronológica
+    for path in sorted(Path(stats_dir).glob("*.json"), reverse=True):
+        try:
+            with open(path, 'r') as f:
+                return field_counts(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+class ReplayRunner:
+    """Re-run a spider's extraction on cached responses only
+
+    The spider reads its config when the crawl starts, so a replay right
+    after saving new selectors shows what they extract, without any
+    network requests, item pipelines or feed output.
+    """
+
+    def __init__(self, project_path, spider_name, spider_args, crawl_settings, command_builder):
+        self.project_path = project_path
+        self.spider_name = spider_name
+        self.spider_args = spider_args
+        self.crawl_settings = crawl_settings
+        self.command_builder = command_builder
+        self.process = None
+        self._cancelled = False
+
+    def cancel(self):
+        """Terminate the running replay"""
+        self._cancelled = True
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+
+    def run(self):
+        """Replay the crawl and return its field counts"""
+        self._cancelled = False
+
+        with tempfile.TemporaryDirectory(prefix="neo-replay-") as tmp:
+            stats_file = Path(tmp) / "stats.json"
+
+            settings = {
+                **self.crawl_settings,
+                **replay_settings(),
+                'ITEM_PIPELINES': {},
+                'FEEDS': {},
+                'LOG_LEVEL': 'WARNING',
+                'NEO_STATS_DUMP': str(stats_file),
+            }
+            if 'JOBDIR' in settings:
+                settings['JOBDIR'] = str(Path(tmp) / "job")
+
+            start = time.monotonic()
+            self.process = subprocess.Popen(
+                self.command_builder(self.spider_name, settings, self.spider_args),
+                cwd=str(self.project_path),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            self.process.wait()
+
+            if self._cancelled:
+                raise ReplayCancelled()
+            if not stats_file.exists():
+                raise RuntimeError("Replay crawl failed")
+
+            with open(stats_file, 'r') as f:
+                stats = json.load(f)
+
+        if not stats.get('httpcache/hit'):
+            raise RuntimeError("No cached responses for this spider; run it once with the HTTP cache on")
+
+        result = field_counts(stats)
+        result['cached'] = stats['httpcache/hit']
+        result['missing'] = stats.get('httpcache/ignore', 0)
+        result['seconds'] = time.monotonic() - start
+
+        print(f"⏪ Replayed: {result['items']} items from {result['cached']} cached pages")
+        return result
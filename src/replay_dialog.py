@@ -0,0 +1,174 @@
+from gi.repository import Gtk, Adw, GLib
+import threading
+
+from .replay import ReplayCancelled
+
+
+def format_change(before, after):
+    """Describe a count going from `before` to `after`"""
+    if before is None:
+        return f"{after}"
+    if before == after:
+        return f"{after} (unchanged)"
+    return f"{before} → {after} ({after - before:+d})"
+
+
+class ReplayDialog(Adw.Dialog):
+    """Dialog for editing selectors and replaying them on cached pages"""
+
+    def __init__(self, runner, config, baseline, save_callback, **kwargs):
+        super().__init__(**kwargs)
+
+        self.runner = runner
+        self.config = config
+        self.baseline = baseline
+        self.save_callback = save_callback
+        self.running = False
+        self.set_title(f"Replay {config['name']}")
+        self.set_content_width(560)
+        self.set_content_height(600)
+
+        self.field_rows = []
+        self.result_rows = []
+
+        self._build_ui()
+        self.connect("closed", self.on_closed)
+
+    def _build_ui(self):
+        """Build replay interface"""
+        content = Adw.ToolbarView()
+
+        header = Adw.HeaderBar()
+        header.set_show_title(False)
+
+        close_btn = Gtk.Button(label="Close")
+        close_btn.connect("clicked", lambda b: self.close())
+        header.pack_start(close_btn)
+
+        self.replay_btn = Gtk.Button(label="Replay")
+        self.replay_btn.add_css_class("suggested-action")
+        self.replay_btn.set_tooltip_text("Save the selectors and run them on the cached pages")
+        self.replay_btn.connect("clicked", self.on_replay_clicked)
+        header.pack_end(self.replay_btn)
+
+        content.add_top_bar(header)
+
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_vexpand(True)
+
+        prefs_page = Adw.PreferencesPage()
+
+        # Seletores editáveis
+        selectors_group = Adw.PreferencesGroup()
+        selectors_group.set_title("Selectors")
+        selectors_group.set_description("Replays use only cached responses and never hit the network")
+
+        self.item_selector_row = Adw.EntryRow()
+        self.item_selector_row.set_title("Item Selector (CSS)")
+        self.item_selector_row.set_text(self.config.get('item_selector', ''))
+        selectors_group.add(self.item_selector_row)
+
+        for field in self.config.get('fields', []):
+            row = Adw.EntryRow()
+            row.set_title(field['name'])
+            row.set_text(field['selector'])
+            selectors_group.add(row)
+            self.field_rows.append((field['name'], row))
+
+        prefs_page.add(selectors_group)
+
+        # Contagens antes e depois
+        self.results_group = Adw.PreferencesGroup()
+        self.results_group.set_title("Values per Field")
+        if self.baseline is None:
+            self.results_group.set_description("No earlier run to compare with")
+        else:
+            self.results_group.set_description(f"Last crawl: {self.baseline['items']} items")
+
+        self.spinner = Gtk.Spinner()
+        self.results_group.set_header_suffix(self.spinner)
+
+        prefs_page.add(self.results_group)
+
+        scrolled.set_child(prefs_page)
+        content.set_content(scrolled)
+        self.set_child(content)
+
+    def on_replay_clicked(self, button):
+        """Save the edited selectors and replay the crawl"""
+        item_selector = self.item_selector_row.get_text().strip()
+        if not item_selector:
+            print("❌ Item selector required")
+            return
+
+        fields = []
+        for name, row in self.field_rows:
+            selector = row.get_text().strip()
+            if not selector:
+                print(f"❌ Selector required for field '{name}'")
+                return
+            fields.append({'name': name, 'selector': selector})
+
+        self.save_callback({'item_selector': item_selector, 'fields': fields})
+
+        self.running = True
+        self.replay_btn.set_sensitive(False)
+        self.spinner.set_spinning(True)
+        self.results_group.set_description("Replaying cached pages...")
+
+        thread = threading.Thread(target=self._run_replay, daemon=True)
+        thread.start()
+
+    def on_closed(self, dialog):
+        if self.running:
+            self.runner.cancel()
+
+    def _run_replay(self):
+        """Run the replay on a worker thread"""
+        try:
+            result = self.runner.run()
+            GLib.idle_add(self._show_result, result)
+        except ReplayCancelled:
+            pass
+        except Exception as e:
+            GLib.idle_add(self._show_error, e)
+
+    def _show_result(self, result):
+        self._replay_finished()
+
+        before = self.baseline or {'items': None, 'fields': {}}
+        description = f"Items: {format_change(before['items'], result['items'])} · " \
+                      f"{result['cached']} cached pages in {result['seconds']:.1f} s"
+        if result['missing']:
+            description += f" · {result['missing']} not cached"
+        self.results_group.set_description(description)
+
+        for row in self.result_rows:
+            self.results_group.remove(row)
+        self.result_rows = []
+
+        names = [name for name, _ in self.field_rows]
+        names += [name for name in before['fields'] if name not in names]
+        for name in names:
+            after = result['fields'].get(name, 0)
+            previous = before['fields'].get(name, 0) if self.baseline else None
+
+            row = Adw.ActionRow()
+            row.set_title(name)
+            row.set_subtitle(format_change(previous, after))
+            if after == 0:
+                row.add_css_class("error")
+            self.results_group.add(row)
+            self.result_rows.append(row)
+
+        # A próxima rodada compara com esta
+        self.baseline = result
+
+    def _show_error(self, error):
+        self._replay_finished()
+        self.results_group.set_description(f"Replay failed: {error}")
+
+    def _replay_finished(self):
+        self.running = False
+        self.replay_btn.set_sensitive(True)
+        self.spinner.set_spinning(False)
@@ -0,0 +1,443 @@
+import gzip
+import json
+import os
+import zlib
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Linhas por bloco gzip nos feeds compactados
+BLOCK_LINES = 1000
+BLOCK_CACHE_SIZE = 8
+
+# Extensão do arquivo de cada run, por compressão (NEO_FEED_COMPRESSION)
+FEED_SUFFIXES = {
+    'none': '.jsonl',
+    'gzip': '.jsonl.gz',
+    'zstd': '.jsonl.zst',
+}
+
+CHUNK_SIZE = 64 * 1024
+
+# Arquivo corrompido ou truncado no meio de um frame
+DECOMPRESS_ERRORS = (OSError, EOFError, zlib.error)
+if zstandard is not None:
+    DECOMPRESS_ERRORS += (zstandard.ZstdError,)
+
+
+class FeedTail:
+    """Incrementally read a JSON Lines feed that is still being written"""
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+        self.errors = 0
+
+    def reset(self):
+        """Start reading again from the beginning of the file"""
+        self.offset = 0
+        self.errors = 0
+
+    def read_new_lines(self, max_lines=None):
+        """Return (offset, line) pairs for lines appended since the last call
+
+        Only complete lines are consumed: a trailing line without a newline
+        is left for the next call, since Scrapy may still be writing it.
+        """
+        lines = []
+
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return lines
+
+        with f:
+            # Arquivo truncado ou recriado
+            f.seek(0, 2)
+            if f.tell() < self.offset:
+                self.reset()
+
+            f.seek(self.offset)
+            while max_lines is None or len(lines) < max_lines:
+                line = f.readline()
+                if not line.endswith(b'\n'):
+                    break
+
+                offset = self.offset
+                self.offset += len(line)
+                if line.strip():
+                    lines.append((offset, line))
+
+        return lines
+
+    def read_new(self, max_items=None):
+        """Parse lines appended since the last call"""
+        items = []
+
+        for offset, line in self.read_new_lines(max_items):
+            try:
+                items.append(json.loads(line))
+            except ValueError as e:
+                self.errors += 1
+                print(f"⚠️  Failed to parse line: {e}")
+
+        return items
+
+
+def read_line_at(f, offset):
+    """Parse the feed line starting at a byte offset of an open file"""
+    f.seek(offset)
+    line = f.readline()
+
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def zstd_available():
+    return zstandard is not None
+
+
+def is_compressed(path):
+    return path.suffix in ('.gz', '.zst')
+
+
+def frame_decompressor(path):
+    """Return a factory of decompressors for one gzip member or zstd frame"""
+    if path.suffix == '.zst':
+        if zstandard is None:
+            raise RuntimeError("Reading zstd feeds needs the 'zstandard' package")
+        return lambda: zstandard.ZstdDecompressor().decompressobj()
+    return lambda: zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+
+def read_frames(f, new_decompressor, offset=0):
+    """Yield (start, end, data) for each complete frame from a byte offset
+
+    Stops at a frame that is not fully written yet, so a feed still being
+    compressed by the crawl can be read up to its last complete frame.
+    """
+    f.seek(offset)
+    start = position = offset
+    decompressor = new_decompressor()
+    parts = []
+    pending = b''
+
+    while True:
+        chunk = pending or f.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        pending = b''
+
+        parts.append(decompressor.decompress(chunk))
+        if not decompressor.eof:
+            position += len(chunk)
+            continue
+
+        # Sobra do chunk pertence ao próximo frame
+        pending = decompressor.unused_data
+        position += len(chunk) - len(pending)
+        yield start, position, b''.join(parts)
+
+        start = position
+        decompressor = new_decompressor()
+        parts = []
+
+
+def frame_lines(data):
+    return [line for line in data.splitlines() if line.strip()]
+
+
+def iter_feed(path):
+    """Yield (item, progress) for every valid line of a feed file"""
+    size = os.path.getsize(path) or 1
+
+    def parse(line):
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
+
+    with open(path, 'rb') as f:
+        # Progresso medido no arquivo em disco, comprimido ou não
+        if is_compressed(path):
+            for start, end, data in read_frames(f, frame_decompressor(path)):
+                for line in frame_lines(data):
+                    item = parse(line)
+                    if item is not None:
+                        yield item, end / size
+            return
+
+        for line in f:
+            if line.strip():
+                item = parse(line)
+                if item is not None:
+                    yield item, f.tell() / size
+
+
+def feed_index_path(path):
+    """Return the block index file of a compacted feed"""
+    return path.with_name(path.name + '.idx')
+
+
+def compact_feed(source, target):
+    """Rewrite a JSON Lines feed as independent gzip blocks
+
+    Every BLOCK_LINES lines are compressed as a separate gzip member, so the
+    file is still a plain .gz for other tools, and the sidecar index holds
+    each block's byte offset for random access. Returns the line count.
+    """
+    offsets = []
+    block = []
+    lines = 0
+    tmp_target = target.with_name(target.name + '.part')
+
+    with open(source, 'rb') as src, open(tmp_target, 'wb') as out:
+        def write_block():
+            offsets.append(out.tell())
+            out.write(gzip.compress(b''.join(block), compresslevel=6))
+            block.clear()
+
+        for line in src:
+            if not line.strip():
+                continue
+            if not line.endswith(b'\n'):
+                line += b'\n'
+            block.append(line)
+            lines += 1
+            if len(block) == BLOCK_LINES:
+                write_block()
+
+        if block:
+            write_block()
+        # Fim do último bloco
+        offsets.append(out.tell())
+
+    index_file = feed_index_path(target)
+    tmp_index = index_file.with_name(index_file.name + '.part')
+    with open(tmp_index, 'w') as f:
+        json.dump({'lines': lines, 'block_lines': BLOCK_LINES, 'offsets': offsets}, f)
+
+    os.replace(tmp_index, index_file)
+    os.replace(tmp_target, target)
+    return lines
+
+
+class FeedSource:
+    """Results read straight from a JSON Lines feed
+
+    Only the byte offset of each line is kept in memory; items are decoded
+    on demand.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.tail = FeedTail(path)
+        self.offsets = array('q')
+        self._file = None
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def exists(self):
+        return self.path.exists()
+
+    def poll(self, max_items=None):
+        """Index lines appended to the feed since the last call
+
+        Returns the number of new items, or -1 when the file was recreated
+        and the previous index had to be dropped.
+        """
+        lines = self.tail.read_new_lines(max_items)
+        if not lines:
+            return 0
+
+        reset = bool(self.offsets) and lines[0][0] <= self.offsets[-1]
+        if reset:
+            self.offsets = array('q')
+            self.close()
+
+        self.offsets.extend(offset for offset, line in lines)
+        return -1 if reset else len(lines)
+
+    def get(self, position):
+        """Return the item at a position"""
+        if self._file is None:
+            self._file = open(self.path, 'rb')
+        return read_line_at(self._file, self.offsets[position])
+
+    def iter_items(self):
+        return iter_feed(self.path)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class FrameFeedSource:
+    """Results read from a gzip or zstd feed made of independent frames
+
+    Feeds written by neo_spiders.compression and compacted by
+    `compact_feed` are indexed frame by frame as they grow. Only the frame
+    holding a requested item is decompressed again, and the last few
+    frames are kept decoded.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.new_decompressor = frame_decompressor(path)
+        self.count = 0
+        self.blocks = OrderedDict()
+        self.errors = 0
+        self._file = None
+        self._reset_index()
+
+    def _reset_index(self):
+        # Offset do fim do último frame completo
+        self.offset = 0
+        self.indexed = 0
+        self.starts = array('q')
+        self.ends = array('q')
+        # Posição do primeiro item de cada frame
+        self.first_items = array('q')
+        self.blocks.clear()
+
+    def __len__(self):
+        return self.count
+
+    def exists(self):
+        return self.path.exists()
+
+    def poll(self, max_items=None):
+        """Index frames appended to the feed since the last call
+
+        Returns the number of new items, or -1 when the file was recreated
+        and the previous index had to be dropped.
+        """
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+
+        reset = size < self.offset
+        if reset:
+            self._reset_index()
+            self.count = 0
+            self.close()
+
+        if max_items is None or self.indexed - self.count < max_items:
+            try:
+                with open(self.path, 'rb') as f:
+                    for start, end, data in read_frames(f, self.new_decompressor, self.offset):
+                        lines = frame_lines(data)
+                        self.starts.append(start)
+                        self.ends.append(end)
+                        self.first_items.append(self.indexed)
+                        self.blocks[len(self.starts) - 1] = lines
+                        self._trim_blocks()
+
+                        self.offset = end
+                        self.indexed += len(lines)
+                        if max_items is not None and self.indexed - self.count >= max_items:
+                            break
+            except DECOMPRESS_ERRORS as e:
+                # Só avisa uma vez; o próximo poll tenta de novo
+                self.errors += 1
+                if self.errors == 1:
+                    print(f"⚠️  Failed to read {self.path.name}: {e}")
+
+        new = self.indexed - self.count
+        if max_items is not None:
+            new = min(new, max_items)
+        self.count += new
+        return -1 if reset else new
+
+    def get(self, position):
+        """Return the item at a position"""
+        number = bisect_right(self.first_items, position) - 1
+        lines = self.blocks.get(number)
+
+        if lines is None:
+            lines = self._read_block(number)
+            self.blocks[number] = lines
+            self._trim_blocks()
+        else:
+            self.blocks.move_to_end(number)
+
+        index = position - self.first_items[number]
+        if index >= len(lines):
+            return None
+
+        try:
+            return json.loads(lines[index])
+        except ValueError:
+            return None
+
+    def _trim_blocks(self):
+        if len(self.blocks) > BLOCK_CACHE_SIZE:
+            self.blocks.popitem(last=False)
+
+    def _read_block(self, number):
+        if self._file is None:
+            self._file = open(self.path, 'rb')
+
+        start, end = self.starts[number], self.ends[number]
+        self._file.seek(start)
+        decompressor = self.new_decompressor()
+        return frame_lines(decompressor.decompress(self._file.read(end - start)))
+
+    def iter_items(self):
+        return iter_feed(self.path)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class CompactFeedSource(FrameFeedSource):
+    """Results read from a feed compacted by `compact_feed`
+
+    The block index written next to the feed replaces the scan, so the
+    whole run is available at once.
+    """
+
+    def poll(self, max_items=None):
+        """Index the feed; it is complete, so everything comes at once"""
+        if not self.starts:
+            try:
+                with open(feed_index_path(self.path), 'r') as f:
+                    index = json.load(f)
+            except (OSError, ValueError):
+                return 0
+
+            offsets = index['offsets']
+            self.starts.extend(offsets[:-1])
+            self.ends.extend(offsets[1:])
+            self.first_items.extend(range(0, index['lines'], index['block_lines']))
+            self.indexed = index['lines']
+
+        new = self.indexed - self.count
+        if max_items is not None:
+            new = min(new, max_items)
+        if new <= 0:
+            return 0
+
+        self.count += new
+        return new
+
+
+def open_feed_source(path):
+    """Return the source reading a run feed, by its file type"""
+    if not is_compressed(path):
+        return FeedSource(path)
+    if feed_index_path(path).exists():
+        return CompactFeedSource(path)
+    return FrameFeedSource(path)
@@ -0,0 +1,99 @@
+from gi.repository import GObject, Gio
+from collections import OrderedDict
+import json
+
+# Quantos itens decodificados manter em memória
+ROW_CACHE_SIZE = 512
+
+
+class ResultRow(GObject.Object):
+    """A single scraped item shown in the results grid"""
+
+    __gtype_name__ = 'NeoResultRow'
+
+    def __init__(self, position, item):
+        super().__init__()
+        self.position = position
+        self.item = item
+
+    def get_text(self, field):
+        """Return the display text of a field"""
+        # Linha inválida no feed
+        if self.item is None:
+            return "—"
+
+        value = self.item.get(field)
+        if value is None:
+            return ""
+        if isinstance(value, str):
+            return value
+        return json.dumps(value, ensure_ascii=False)
+
+
+class ResultsModel(GObject.Object, Gio.ListModel):
+    """List model over a results source (feed file or results store)
+
+    The source only keeps what it needs to locate an item; items are
+    decoded when GTK asks for a visible row and held in a small LRU cache.
+    """
+
+    __gtype_name__ = 'NeoResultsModel'
+
+    def __init__(self, source):
+        super().__init__()
+        self.source = source
+        self.count = 0
+        self.cache = OrderedDict()
+
+    def do_get_item_type(self):
+        return ResultRow.__gtype__
+
+    def do_get_n_items(self):
+        return self.count
+
+    def do_get_item(self, position):
+        if position >= self.count:
+            return None
+
+        row = self.cache.get(position)
+        if row is not None:
+            self.cache.move_to_end(position)
+            return row
+
+        row = ResultRow(position, self.source.get(position))
+        self.cache[position] = row
+        if len(self.cache) > ROW_CACHE_SIZE:
+            self.cache.popitem(last=False)
+
+        return row
+
+    def poll(self, max_items=None):
+        """Pick up new items from the source and notify the view"""
+        new = self.source.poll(max_items)
+
+        # Fonte recriada: substituir tudo
+        if new < 0:
+            removed = self.count
+            self.count = len(self.source)
+            self.cache.clear()
+            self.items_changed(0, removed, self.count)
+            return self.count
+
+        if new:
+            start = self.count
+            self.count += new
+            self.items_changed(start, 0, new)
+
+        return new
+
+    def first_item(self):
+        """Return the first decodable item, if any"""
+        for position in range(min(self.count, 10)):
+            item = self.source.get(position)
+            if item is not None:
+                return item
+        return None
+
+    def close(self):
+        """Release the source's file handles"""
+        self.source.close()
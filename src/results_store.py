@@ -0,0 +1,151 @@
+import json
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+
+# Itens lidos por consulta
+PAGE_SIZE = 200
+PAGE_CACHE_SIZE = 8
+
+
+def connect_store(db_path):
+    """Open a read-only connection to a spider's results database"""
+    # as_uri() escapa '?', '#' e '%' do caminho
+    conn = sqlite3.connect(f"{Path(db_path).absolute().as_uri()}?mode=ro", uri=True)
+    conn.execute("PRAGMA query_only=ON")
+    return conn
+
+
+def list_runs(db_path):
+    """Return the runs stored in a results database, newest first"""
+    if not db_path.exists():
+        return []
+
+    conn = connect_store(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT run_id, started, finished, status, item_count "
+            "FROM runs ORDER BY started DESC"
+        ).fetchall()
+    except sqlite3.Error:
+        return []
+    finally:
+        conn.close()
+
+    return [
+        {
+            'run_id': run_id,
+            'started': started,
+            'finished': finished,
+            'status': status,
+            'item_count': item_count,
+        }
+        for run_id, started, finished, status, item_count in rows
+    ]
+
+
+class StoreSource:
+    """Results of one run, read from the SQLite results store
+
+    The item count comes from the runs table and rows are fetched a page
+    at a time through the (run_id, seq) index, so opening a run costs the
+    same whatever its size.
+    """
+
+    def __init__(self, db_path, run_id):
+        self.path = db_path
+        self.run_id = run_id
+        self.count = 0
+        self.pages = OrderedDict()
+        self._conn = None
+
+    def __len__(self):
+        return self.count
+
+    def exists(self):
+        return self.path.exists()
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = connect_store(self.path)
+        return self._conn
+
+    def poll(self, max_items=None):
+        """Pick up items committed since the last call"""
+        if not self.exists():
+            return 0
+
+        try:
+            row = self._connection().execute(
+                "SELECT item_count FROM runs WHERE run_id = ?", (self.run_id,)
+            ).fetchone()
+        except sqlite3.Error:
+            # Banco ainda sendo criado pelo pipeline
+            self.close()
+            return 0
+
+        total = row[0] if row else 0
+        new = total - self.count
+        if max_items is not None:
+            new = min(new, max_items)
+        if new <= 0:
+            return 0
+
+        # A última página pode ter sido lida incompleta
+        self.pages.pop(self.count // PAGE_SIZE, None)
+        self.count += new
+        return new
+
+    def get(self, position):
+        """Return the item at a position"""
+        page = position // PAGE_SIZE
+        items = self.pages.get(page)
+
+        if items is None:
+            items = self._fetch(self._connection(), page * PAGE_SIZE, PAGE_SIZE)
+            self.pages[page] = items
+            if len(self.pages) > PAGE_CACHE_SIZE:
+                self.pages.popitem(last=False)
+        else:
+            self.pages.move_to_end(page)
+
+        index = position - page * PAGE_SIZE
+        return items[index] if index < len(items) else None
+
+    def _fetch(self, conn, start, limit):
+        rows = conn.execute(
+            "SELECT data FROM items WHERE run_id = ? AND seq >= ? "
+            "ORDER BY seq LIMIT ?",
+            (self.run_id, start, limit)
+        ).fetchall()
+
+        items = []
+        for (data,) in rows:
+            try:
+                items.append(json.loads(data))
+            except ValueError:
+                items.append(None)
+        return items
+
+    def iter_items(self):
+        """Yield (item, progress) for every item, using its own connection"""
+        conn = connect_store(self.path)
+        total = self.count or 1
+
+        try:
+            start = 0
+            while start < self.count:
+                items = self._fetch(conn, start, PAGE_SIZE * 5)
+                if not items:
+                    break
+                start += len(items)
+                for item in items:
+                    if item is not None:
+                        yield item, start / total
+        finally:
+            conn.close()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,165 @@
+import sqlite3
+
+from .results_feed import FEED_SUFFIXES, compact_feed, feed_index_path
+
+# Runs mais recentes de cada spider mantidos sem compressão
+PLAIN_RUNS = 2
+
+GB = 1024 * 1024 * 1024
+
+
+def run_feeds(spider_dir):
+    """Return {run_id: path} for the run feeds of one spider"""
+    runs = {}
+    # Se a compactação foi interrompida, o arquivo original vale
+    for suffix in FEED_SUFFIXES.values():
+        for path in spider_dir.glob(f"*{suffix}"):
+            runs.setdefault(path.name[:-len(suffix)], path)
+    return runs
+
+
+def list_feed_runs(results_dir):
+    """Return the run feeds of every spider, newest first"""
+    runs = []
+    if not results_dir.is_dir():
+        return runs
+
+    for spider_dir in results_dir.iterdir():
+        if not spider_dir.is_dir():
+            continue
+        for run_id, path in run_feeds(spider_dir).items():
+            runs.append({'spider': spider_dir.name, 'run_id': run_id, 'path': path})
+
+    # Run IDs começam com a data, então a ordem é cronológica
+    return sorted(runs, key=lambda run: run['run_id'], reverse=True)
+
+
+def feed_size(path):
+    size = path.stat().st_size
+    index_file = feed_index_path(path)
+    if index_file.exists():
+        size += index_file.stat().st_size
+    return size
+
+
+def remove_feed(path):
+    """Delete a run feed and its block index; returns the bytes freed"""
+    try:
+        size = feed_size(path)
+    except FileNotFoundError:
+        return 0
+
+    path.unlink(missing_ok=True)
+    feed_index_path(path).unlink(missing_ok=True)
+    return size
+
+
+def prune_files(directory, pattern, keep, active):
+    """Delete the files of all but the newest `keep` runs in a directory"""
+    if not keep or not directory.is_dir():
+        return 0
+
+    # Inclui backups do RotatingFileHandler (<run_id>.log.1 ...)
+    by_run = {}
+    for path in directory.glob(pattern + "*"):
+        by_run.setdefault(path.name.split('.')[0], []).append(path)
+
+    removed = 0
+    for run_id in sorted(by_run, reverse=True)[keep:]:
+        if run_id in active:
+            continue
+        for path in by_run[run_id]:
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+def prune_store_runs(db_path, keep, active):
+    """Delete all but the newest `keep` runs of a results database"""
+    if not keep or not db_path.exists():
+        return 0
+
+    conn = sqlite3.connect(db_path, timeout=10)
+    try:
+        old = [
+            run_id for (run_id,) in conn.execute(
+                "SELECT run_id FROM runs ORDER BY started DESC LIMIT -1 OFFSET ?", (keep,)
+            )
+            if run_id not in active
+        ]
+        # Páginas liberadas são reaproveitadas pelos próximos runs
+        with conn:
+            conn.executemany("DELETE FROM items WHERE run_id = ?", [(run_id,) for run_id in old])
+            conn.executemany("DELETE FROM runs WHERE run_id = ?", [(run_id,) for run_id in old])
+        return len(old)
+    except sqlite3.Error as e:
+        print(f"⚠️  Could not prune {db_path.name}: {e}")
+        return 0
+    finally:
+        conn.close()
+
+
+def apply_retention(project_path, keep_runs, max_bytes, active=()):
+    """Apply the results retention policy to a Neo project
+
+    Keeps the newest `keep_runs` runs of each spider (0 keeps all), gzips
+    run feeds older than the newest PLAIN_RUNS, then deletes the oldest
+    feeds while all of them take more than `max_bytes` (0 for no limit).
+    The newest run of a spider and runs in `active` are never deleted.
+    """
+    results_dir = project_path / "results"
+    active = set(active)
+    summary = {'deleted': 0, 'compacted': 0, 'freed': 0}
+
+    by_spider = {}
+    for run in list_feed_runs(results_dir):
+        by_spider.setdefault(run['spider'], []).append(run)
+
+    for spider, runs in by_spider.items():
+        for position, run in enumerate(runs):
+            if run['run_id'] in active:
+                continue
+
+            path = run['path']
+            if keep_runs and position >= keep_runs:
+                summary['freed'] += remove_feed(path)
+                summary['deleted'] += 1
+            elif position >= PLAIN_RUNS and path.suffix == '.jsonl':
+                before = path.stat().st_size
+                target = path.with_name(path.name + '.gz')
+                compact_feed(path, target)
+                path.unlink()
+                summary['freed'] += before - feed_size(target)
+                summary['compacted'] += 1
+
+    # Banco de resultados, logs e estatísticas seguem o mesmo limite
+    if results_dir.is_dir():
+        for db_path in results_dir.glob("*.db"):
+            # Estado do DedupPipeline e do modo delta vale para todos os runs
+            if len(db_path.suffixes) == 1:
+                prune_store_runs(db_path, keep_runs, active)
+    for kind, pattern in (("logs", "*.log"), ("stats", "*.json")):
+        directory = project_path / kind
+        if directory.is_dir():
+            for spider_dir in directory.iterdir():
+                prune_files(spider_dir, pattern, keep_runs, active)
+
+    if max_bytes:
+        runs = list_feed_runs(results_dir)
+        total = sum(feed_size(run['path']) for run in runs)
+
+        newest = {}
+        for run in runs:
+            newest.setdefault(run['spider'], run['run_id'])
+
+        for run in reversed(runs):
+            if total <= max_bytes:
+                break
+            if run['run_id'] in active or newest[run['spider']] == run['run_id']:
+                continue
+            freed = remove_feed(run['path'])
+            total -= freed
+            summary['freed'] += freed
+            summary['deleted'] += 1
+
+    return summary
@@ -0,0 +1,112 @@
+import heapq
+import itertools
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+
+
+class CrawlScheduler:
+    """Run crawl jobs with a cap on simultaneous crawl processes
+
+    Pending jobs wait in a priority queue (higher priority first, FIFO
+    within a priority) that is saved to disk, so queued jobs survive an
+    application restart. `launch` is called with each job that gets a
+    slot and must call `job_finished` when the crawl ends.
+    """
+
+    def __init__(self, queue_file, launch, max_running=4):
+        self.queue_file = queue_file
+        self.launch = launch
+        self.max_running = max(1, max_running)
+        self.pending = []
+        self.running = {}
+        self.counter = itertools.count()
+        self.lock = threading.RLock()
+
+        self._load()
+
+    def _load(self):
+        """Restore jobs that were still queued when Neo was closed"""
+        if not self.queue_file.exists():
+            return
+
+        try:
+            with open(self.queue_file, 'r') as f:
+                jobs = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not restore crawl queue: {e}")
+            return
+
+        for job in jobs:
+            heapq.heappush(self.pending, (-job.get('priority', 0), next(self.counter), job))
+
+    def _save(self):
+        """Persist pending jobs atomically"""
+        jobs = [job for _, _, job in sorted(self.pending)]
+        tmp_file = self.queue_file.with_suffix('.tmp')
+
+        with open(tmp_file, 'w') as f:
+            json.dump(jobs, f, indent=2)
+        os.replace(tmp_file, self.queue_file)
+
+    def submit(self, spider_name, priority=0, **options):
+        """Queue a crawl job and start it if a slot is free"""
+        job = {
+            'id': uuid.uuid4().hex[:8],
+            'spider': spider_name,
+            'priority': priority,
+            'submitted': datetime.now().isoformat(),
+            **options,
+        }
+
+        with self.lock:
+            heapq.heappush(self.pending, (-priority, next(self.counter), job))
+            self._save()
+
+        self.dispatch()
+        return job
+
+    def pending_jobs(self):
+        """Return queued jobs in the order they will run"""
+        with self.lock:
+            return [job for _, _, job in sorted(self.pending)]
+
+    def cancel(self, job_id):
+        """Remove a queued job; returns False if it is not pending"""
+        with self.lock:
+            for index, (_, _, job) in enumerate(self.pending):
+                if job['id'] == job_id:
+                    self.pending.pop(index)
+                    heapq.heapify(self.pending)
+                    self._save()
+                    return True
+        return False
+
+    def set_max_running(self, max_running):
+        """Change the number of simultaneous crawls"""
+        with self.lock:
+            self.max_running = max(1, max_running)
+        self.dispatch()
+
+    def job_finished(self, job_id):
+        """Free the slot of a finished job and start the next ones"""
+        with self.lock:
+            self.running.pop(job_id, None)
+        self.dispatch()
+
+    def dispatch(self):
+        """Start queued jobs while slots are available"""
+        started = []
+
+        with self.lock:
+            while self.pending and len(self.running) < self.max_running:
+                _, _, job = heapq.heappop(self.pending)
+                self.running[job['id']] = job
+                started.append(job)
+            if started:
+                self._save()
+
+        for job in started:
+            self.launch(job)
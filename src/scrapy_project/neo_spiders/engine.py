@@ -0,0 +1,182 @@
+# Long-lived crawl engine for neo_spiders project
+# Managed by Neo: this file is overwritten when Neo starts.
+#
+# Run with `python -m neo_spiders.engine` from the project directory. Jobs
+# arrive on stdin as JSON lines:
+#
+#   {"cmd": "crawl", "job": "<id>", "spider": "<name>", "settings": {...}, "args": {...}}
+#   {"cmd": "stop", "job": "<id>"}
+#
+# and events are written to stdout as JSON lines:
+#
+#   {"event": "started" | "log" | "finished", "job": "<id>", ...}
+#
+# "finished" carries the close reason and `"failed": true` when the crawl
+# could not run at all.
+#
+# Every crawl shares one warm reactor and one spider loader, so a job
+# starts without paying for interpreter startup and project imports.
+# settings.py is read again for each job, so settings saved in Neo apply
+# to the next crawl; only reactor-wide ones (TWISTED_REACTOR, thread pool,
+# DNS) need an engine restart.
+
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import sys
+import threading
+
+from scrapy.utils.project import get_project_settings
+from scrapy.utils.reactor import install_reactor
+
+settings = get_project_settings()
+install_reactor(settings.get('TWISTED_REACTOR'))
+
+from twisted.internet import reactor  # noqa: E402
+from twisted.python.failure import Failure  # noqa: E402
+
+from scrapy.crawler import Crawler, CrawlerRunner  # noqa: E402
+from scrapy.spiderloader import SpiderLoader  # noqa: E402
+from scrapy.utils.log import configure_logging  # noqa: E402
+
+LOG_FORMAT = '%(asctime)s [%(name)s] %(levelname)s: %(message)s'
+
+output_lock = threading.Lock()
+
+
+def project_settings():
+    """Return the project settings as settings.py holds them now"""
+    module = sys.modules.get(os.environ.get('SCRAPY_SETTINGS_MODULE', ''))
+    if module is not None:
+        # .pyc com mesmo tamanho e mtime do fonte seria reaproveitado
+        cached = importlib.util.cache_from_source(module.__file__)
+        if os.path.exists(cached):
+            os.remove(cached)
+        importlib.reload(module)
+    return get_project_settings()
+
+
+def emit(event, job, **data):
+    """Write an event line to Neo"""
+    line = json.dumps({'event': event, 'job': job, **data}, default=str)
+    with output_lock:
+        sys.stdout.write(line + '\n')
+        sys.stdout.flush()
+
+
+class JobLogHandler(logging.Handler):
+    """Forward log records emitted by one crawl's spider to Neo"""
+
+    def __init__(self, job_id, crawler):
+        super().__init__()
+        self.job_id = job_id
+        self.crawler = crawler
+        self.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    def filter(self, record):
+        spider = getattr(record, 'spider', None)
+        return spider is not None and spider is self.crawler.spider
+
+    def emit(self, record):
+        emit('log', self.job_id, line=self.format(record))
+
+
+class Engine:
+    """Run crawl jobs concurrently on a single CrawlerRunner"""
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.runner = CrawlerRunner(settings)
+        self.crawlers = {}
+
+    def crawl(self, job_id, spider_name, job_settings, args):
+        try:
+            self.settings = project_settings()
+        except Exception as e:
+            # settings.py com erro: manter os últimos válidos
+            logging.getLogger(__name__).error("Could not reload settings.py: %s", e)
+        crawl_settings = self.settings.copy()
+        crawl_settings.setdict(job_settings, priority='cmdline')
+
+        # Spiders antigos (um módulo por spider) vêm de outro SPIDER_MODULES
+        if 'SPIDER_MODULES' in job_settings:
+            spider_loader = SpiderLoader.from_settings(crawl_settings)
+        else:
+            spider_loader = self.runner.spider_loader
+
+        try:
+            spidercls = spider_loader.load(spider_name)
+        except KeyError:
+            emit('finished', job_id, reason=f"spider not found: {spider_name}", failed=True)
+            return
+
+        crawler = Crawler(spidercls, crawl_settings)
+        handler = JobLogHandler(job_id, crawler)
+        logging.getLogger().addHandler(handler)
+        self.crawlers[job_id] = crawler
+
+        def finished(result):
+            logging.getLogger().removeHandler(handler)
+            self.crawlers.pop(job_id, None)
+
+            if isinstance(result, Failure):
+                reason = str(result.value)
+            elif crawler.stats is not None:
+                reason = crawler.stats.get_value('finish_reason', 'finished')
+            else:
+                reason = "finished"
+            emit('finished', job_id, reason=reason, failed=isinstance(result, Failure))
+
+        emit('started', job_id)
+        deferred = self.runner.crawl(crawler, **args)
+        deferred.addBoth(finished)
+
+    def stop(self, job_id):
+        crawler = self.crawlers.get(job_id)
+        if crawler is not None:
+            crawler.stop()
+
+    def handle(self, message):
+        if message.get('cmd') == 'crawl':
+            self.crawl(
+                message['job'], message['spider'],
+                message.get('settings', {}), message.get('args', {})
+            )
+        elif message.get('cmd') == 'stop':
+            self.stop(message['job'])
+
+    def shutdown(self):
+        deferred = self.runner.stop()
+        deferred.addBoth(lambda _: reactor.stop())
+
+
+def read_commands(engine):
+    """Read commands from Neo until stdin is closed"""
+    for line in sys.stdin:
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        reactor.callFromThread(engine.handle, message)
+
+    reactor.callFromThread(engine.shutdown)
+
+
+def main():
+    # Log geral do engine vai para stderr; cada job recebe o seu via stdout
+    configure_logging(settings, install_root_handler=False)
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(logging.Formatter(LOG_FORMAT))
+    stream.addFilter(lambda record: getattr(record, 'spider', None) is None)
+    logging.getLogger().addHandler(stream)
+    logging.getLogger().setLevel(settings.get('LOG_LEVEL', 'DEBUG'))
+
+    engine = Engine(settings)
+    threading.Thread(target=read_commands, args=(engine,), daemon=True).start()
+    reactor.run(installSignalHandlers=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+# Extensions for neo_spiders project
+# Managed by Neo: this file is overwritten when Neo starts.
+
+import json
+import socket
+import time
+
+from itemadapter import ItemAdapter
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+from twisted.internet import task
+
+
+class NeoStatsExtension:
+    """Send the stats collector's counters to Neo at a fixed interval
+
+    Snapshots are JSON datagrams sent to the Unix socket named by the
+    NEO_STATS_SOCKET setting. Sending never blocks the crawl: if Neo is not
+    listening, snapshots are simply dropped.
+    """
+
+    def __init__(self, crawler, address, interval):
+        self.crawler = crawler
+        self.address = address
+        self.interval = interval
+        self.sock = None
+        self.task = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        address = crawler.settings.get('NEO_STATS_SOCKET')
+        if not address:
+            raise NotConfigured
+
+        ext = cls(crawler, address, crawler.settings.getfloat('NEO_STATS_INTERVAL', 1.0))
+        crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        return ext
+
+    def spider_opened(self, spider):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+
+        self.task = task.LoopingCall(self.send)
+        self.task.start(self.interval, now=True)
+
+    def spider_closed(self, spider, reason):
+        if self.task and self.task.running:
+            self.task.stop()
+
+        self.send(finished=reason)
+        self.sock.close()
+
+    def send(self, finished=None):
+        snapshot = {
+            'time': time.time(),
+            'stats': self.crawler.stats.get_stats(),
+            'queue': self._queue_size(),
+            'inflight': self._inflight(),
+        }
+        if finished:
+            snapshot['finished'] = finished
+
+        try:
+            self.sock.sendto(json.dumps(snapshot, default=str).encode(), self.address)
+        except OSError:
+            # Neo não está ouvindo ou o buffer está cheio
+            pass
+
+    def _queue_size(self):
+        engine = self.crawler.engine
+        slot = getattr(engine, '_slot', None) or getattr(engine, 'slot', None)
+        if slot is None:
+            return 0
+        try:
+            return len(slot.scheduler)
+        except TypeError:
+            return 0
+
+    def _inflight(self):
+        engine = self.crawler.engine
+        return len(engine.downloader.active) if engine else 0
+
+
+class NeoStatsDump:
+    """Write the final crawl stats to the JSON file named by NEO_STATS_DUMP
+
+    Used by benchmarks and probe crawls that need the stats of a finished
+    crawl without parsing its log.
+    """
+
+    def __init__(self, crawler, path):
+        self.crawler = crawler
+        self.path = path
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        path = crawler.settings.get('NEO_STATS_DUMP')
+        if not path:
+            raise NotConfigured
+
+        ext = cls(crawler, path)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        return ext
+
+    def spider_closed(self, spider, reason):
+        stats = dict(self.crawler.stats.get_stats())
+        stats['finish_reason'] = reason
+
+        with open(self.path, 'w') as f:
+            json.dump(stats, f, default=str, indent=2)
+
+
+class NeoLatencyStats:
+    """Add download latency totals to the crawl stats
+
+    Keeps `neo/latency/count`, `neo/latency/total` and `neo/latency/max`
+    (seconds) for responses that came from the network.
+    """
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        ext = cls(crawler.stats)
+        crawler.signals.connect(ext.response_received, signal=signals.response_received)
+        return ext
+
+    def response_received(self, response, request, spider):
+        latency = request.meta.get('download_latency')
+        if latency is None:
+            return
+
+        self.stats.inc_value('neo/latency/count')
+        self.stats.inc_value('neo/latency/total', latency, start=0.0)
+        self.stats.max_value('neo/latency/max', latency)
+
+
+class NeoFieldStats:
+    """Count, per field, the scraped items where the field has a value
+
+    Kept as `neo/field/<name>` stats so Neo can compare how many values
+    each selector produced between two runs.
+    """
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        ext = cls(crawler.stats)
+        crawler.signals.connect(ext.item_scraped, signal=signals.item_scraped)
+        return ext
+
+    def item_scraped(self, item, response, spider):
+        for name, value in ItemAdapter(item).items():
+            if value not in (None, '', [], {}):
+                self.stats.inc_value(f'neo/field/{name}')
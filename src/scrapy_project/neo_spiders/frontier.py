@@ -0,0 +1,139 @@
+# Bounded-memory crawl frontier for neo_spiders project
+# Managed by Neo: this file is overwritten when Neo starts.
+#
+# Scrapy's RFPDupeFilter keeps every request fingerprint in a Python set,
+# which grows without limit on large crawls. BloomDupeFilter keeps a fixed
+# size Bloom filter instead, memory-mapped from the job directory when
+# JOBDIR is set. Requests are queued on disk through JOBDIR as well, so a
+# link-following crawl runs in bounded RAM.
+#
+# A Bloom filter can report false positives: with the default settings
+# about 1 in 1000 new URLs is wrongly treated as already seen and skipped.
+#
+# Settings:
+#   NEO_BLOOM_CAPACITY    expected number of distinct requests (10 million)
+#   NEO_BLOOM_ERROR_RATE  false positive rate at that capacity (0.001)
+#   NEO_DOMAIN_MAX_REQUESTS  requests allowed per domain, 0 for no limit
+
+import logging
+import math
+import mmap
+from collections import Counter
+from pathlib import Path
+from urllib.parse import urlparse
+
+from scrapy.dupefilters import BaseDupeFilter
+from scrapy.exceptions import IgnoreRequest, NotConfigured
+from scrapy.utils.job import job_dir
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over bytes keys
+
+    `size` bits with `hashes` probes per key, derived from the key by
+    double hashing. The bits live in a bytearray, or in a memory-mapped
+    file when `path` is given.
+    """
+
+    def __init__(self, capacity, error_rate, path=None):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        nbytes = (self.size + 7) // 8
+
+        self.file = None
+        if path is None:
+            self.bits = bytearray(nbytes)
+        else:
+            # Arquivo esparso; o kernel decide quantas páginas ficam na RAM
+            self.file = open(path, 'a+b')
+            if self.file.seek(0, 2) < nbytes:
+                self.file.truncate(nbytes)
+            self.bits = mmap.mmap(self.file.fileno(), nbytes)
+
+    def _positions(self, key):
+        # Fingerprints já são hashes: basta fatiar em dois inteiros
+        h1 = int.from_bytes(key[:8], 'little')
+        h2 = int.from_bytes(key[8:16], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key):
+        """Add a key; returns True if it was (probably) already present"""
+        present = True
+        for position in self._positions(key):
+            byte, bit = divmod(position, 8)
+            mask = 1 << bit
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                present = False
+        return present
+
+    def close(self):
+        if self.file is not None:
+            self.bits.close()
+            self.file.close()
+
+
+class BloomDupeFilter(BaseDupeFilter):
+    """Duplicate request filter backed by a Bloom filter"""
+
+    def __init__(self, fingerprinter, capacity, error_rate, path=None, debug=False):
+        self.fingerprinter = fingerprinter
+        self.seen = BloomFilter(capacity, error_rate, path)
+        self.debug = debug
+        self.logdupes = True
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        path = job_dir(settings)
+        return cls(
+            crawler.request_fingerprinter,
+            capacity=settings.getint('NEO_BLOOM_CAPACITY', 10_000_000),
+            error_rate=settings.getfloat('NEO_BLOOM_ERROR_RATE', 0.001),
+            path=Path(path, 'requests.bloom') if path else None,
+            debug=settings.getbool('DUPEFILTER_DEBUG'),
+        )
+
+    def request_seen(self, request):
+        return self.seen.add(self.fingerprinter.fingerprint(request))
+
+    def close(self, reason):
+        self.seen.close()
+
+    def log(self, request, spider):
+        if self.debug:
+            logger.debug("Filtered duplicate request: %(request)s", {'request': request},
+                         extra={'spider': spider})
+        elif self.logdupes:
+            logger.debug("Filtered duplicate request: %(request)s - no more duplicates will be shown",
+                         {'request': request}, extra={'spider': spider})
+            self.logdupes = False
+
+        spider.crawler.stats.inc_value('dupefilter/filtered')
+
+
+class DomainBudgetMiddleware:
+    """Downloader middleware dropping requests past a per-domain budget"""
+
+    def __init__(self, stats, max_requests):
+        self.stats = stats
+        self.max_requests = max_requests
+        self.counts = Counter()
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        max_requests = crawler.settings.getint('NEO_DOMAIN_MAX_REQUESTS', 0)
+        if max_requests <= 0:
+            raise NotConfigured
+        return cls(crawler.stats, max_requests)
+
+    def process_request(self, request, spider):
+        domain = urlparse(request.url).hostname or ''
+        if self.counts[domain] >= self.max_requests:
+            self.stats.inc_value('neo/frontier/domain_limited')
+            raise IgnoreRequest(f"Request budget for {domain} used up")
+
+        self.counts[domain] += 1
+        return None
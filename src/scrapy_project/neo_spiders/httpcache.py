@@ -0,0 +1,330 @@
+# HTTP cache storage for neo_spiders project
+# Managed by Neo: this file is overwritten when Neo starts.
+#
+# Scrapy's filesystem storage writes several small files per response and
+# never removes any. SQLiteCacheStorage keeps zlib-compressed responses in
+# one SQLite file (HTTPCACHE_DIR/neo_cache.db) shared by all spiders, and
+# evicts the least recently used entries once the stored bytes pass
+# NEO_HTTPCACHE_MAX_BYTES. Hit and miss totals are kept in the same file so
+# Neo can show them.
+#
+# With HTTPCACHE_POLICY set to RevalidatePolicy, recrawls ask the site
+# whether each cached page changed (If-None-Match / If-Modified-Since) and
+# reuse the cached body on 304; RevalidateStatsMiddleware refreshes the
+# cached entry and reports the bytes and download time that saved.
+
+import logging
+import sqlite3
+import time
+import zlib
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+from scrapy.extensions.httpcache import RFC2616Policy
+from scrapy.http import Headers
+from scrapy.responsetypes import responsetypes
+from scrapy.utils.misc import load_object
+from scrapy.utils.project import data_path
+from w3lib.http import headers_dict_to_raw, headers_raw_to_dict
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = "neo_cache.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    spider TEXT NOT NULL,
+    fingerprint BLOB NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers BLOB NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored REAL NOT NULL,
+    accessed REAL NOT NULL,
+    latency REAL,
+    PRIMARY KEY (spider, fingerprint)
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Escritas ficam em memória e vão ao banco numa transação curta a cada
+# intervalo. Nenhuma transação fica aberta entre callbacks: outro crawl no
+# mesmo reactor (ou em outro processo) ficaria esperando o lock.
+COMMIT_INTERVAL = 1.0  # s
+# Com quantos novos bytes o tamanho total é conferido de novo
+EVICTION_CHECK_BYTES = 4 * 1024 * 1024
+# Ao passar do limite, remover até sobrar esta fração
+EVICTION_TARGET = 0.9
+# Cabeçalhos de um 304 que substituem os da resposta em cache
+REVALIDATION_HEADERS = (b'ETag', b'Last-Modified', b'Date', b'Expires', b'Cache-Control')
+
+
+def open_cache(path):
+    conn = sqlite3.connect(path, timeout=30)
+    # auto_vacuum só vale se definido antes de criar as tabelas
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+class SQLiteCacheStorage:
+    """HTTPCACHE_STORAGE keeping compressed responses in one SQLite file"""
+
+    def __init__(self, settings):
+        self.cachedir = data_path(settings['HTTPCACHE_DIR'], createdir=True)
+        self.expiration_secs = settings.getint('HTTPCACHE_EXPIRATION_SECS')
+        self.max_bytes = settings.getint('NEO_HTTPCACHE_MAX_BYTES', 1024 * 1024 * 1024)
+        self.level = settings.getint('NEO_HTTPCACHE_COMPRESSION', 6)
+        self.conn = None
+
+    def open_spider(self, spider):
+        self.fingerprinter = spider.crawler.request_fingerprinter
+        self.conn = open_cache(f"{self.cachedir}/{CACHE_FILE}")
+
+        self.hits = 0
+        self.misses = 0
+        self.accessed = []
+        # (spider, fingerprint) -> linha ainda não gravada
+        self.pending = {}
+        self.refreshed = []
+        self.new_bytes = 0
+        self.last_commit = time.monotonic()
+
+        logger.debug("Using SQLite cache storage in %(cachedir)s", {'cachedir': self.cachedir},
+                     extra={'spider': spider})
+
+    def close_spider(self, spider):
+        self._commit()
+        self._evict()
+        self.conn.close()
+
+    def retrieve_response(self, spider, request):
+        """Return the cached response, or None on a miss"""
+        fingerprint = self.fingerprinter.fingerprint(request)
+        if (spider.name, fingerprint) in self.pending:
+            self._commit()
+
+        row = self.conn.execute(
+            "SELECT url, status, headers, body, stored, latency FROM responses "
+            "WHERE spider = ? AND fingerprint = ?",
+            (spider.name, fingerprint)
+        ).fetchone()
+
+        if row is None or (self.expiration_secs > 0 and time.time() - row[4] > self.expiration_secs):
+            self.misses += 1
+            self._maybe_commit()
+            return None
+
+        url, status, raw_headers, body, stored, latency = row
+        headers = Headers(headers_raw_to_dict(zlib.decompress(raw_headers)))
+        body = zlib.decompress(body)
+
+        self.hits += 1
+        self.accessed.append((time.time(), spider.name, fingerprint))
+        self._maybe_commit()
+
+        request.meta['cache_timestamp'] = stored
+        # Tempo do download original, para estimar o que a revalidação poupa
+        request.meta['neo_cache_latency'] = latency
+        respcls = responsetypes.from_args(headers=headers, url=url, body=body)
+        return respcls(url=url, headers=headers, status=status, body=body)
+
+    def store_response(self, spider, request, response):
+        """Store a response, compressed"""
+        if 'cached' in response.flags:
+            # Scrapy recente grava de novo a resposta revalidada com 304: o
+            # corpo não mudou, só os cabeçalhos. Nas versões que não gravam,
+            # RevalidateStatsMiddleware faz a atualização.
+            self.refresh_response(spider.name, self.fingerprinter.fingerprint(request), response.headers)
+            request.meta['neo_cache_refreshed'] = True
+            return
+
+        headers = zlib.compress(headers_dict_to_raw(response.headers), self.level)
+        body = zlib.compress(response.body, self.level)
+        size = len(headers) + len(body)
+        now = time.time()
+
+        fingerprint = self.fingerprinter.fingerprint(request)
+        self.pending[(spider.name, fingerprint)] = (
+            spider.name, fingerprint, response.url, response.status,
+            headers, body, size, now, now, request.meta.get('download_latency')
+        )
+
+        self.new_bytes += size
+        if self.new_bytes >= EVICTION_CHECK_BYTES:
+            self._commit()
+            self._evict()
+        else:
+            self._maybe_commit()
+
+    def refresh_response(self, spider_name, fingerprint, headers):
+        """Mark a cached response as just revalidated, with new headers"""
+        now = time.time()
+        headers = zlib.compress(headers_dict_to_raw(headers), self.level)
+        self.refreshed.append((headers, now, now, spider_name, fingerprint))
+        self._maybe_commit()
+
+    def _maybe_commit(self):
+        if time.monotonic() - self.last_commit >= COMMIT_INTERVAL:
+            self._commit()
+
+    def _commit(self):
+        """Write buffered responses, access times and counters at once"""
+        self.last_commit = time.monotonic()
+        if not (self.pending or self.refreshed or self.accessed or self.hits or self.misses):
+            return
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self.pending.values()
+            )
+            self.conn.executemany(
+                "UPDATE responses SET headers = ?, stored = ?, accessed = ? WHERE spider = ? AND fingerprint = ?",
+                self.refreshed
+            )
+            self.conn.executemany(
+                "UPDATE responses SET accessed = ? WHERE spider = ? AND fingerprint = ?",
+                self.accessed
+            )
+            for name, value in (('hits', self.hits), ('misses', self.misses)):
+                if value:
+                    self.conn.execute(
+                        "INSERT INTO counters VALUES (?, ?) "
+                        "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                        (name, value)
+                    )
+
+        self.pending = {}
+        self.refreshed = []
+        self.accessed = []
+        self.hits = self.misses = 0
+
+    def _evict(self):
+        """Drop least recently used responses while over the size limit"""
+        self.new_bytes = 0
+        if self.max_bytes <= 0:
+            return
+
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = total - self.max_bytes * EVICTION_TARGET
+        freed = 0
+        doomed = []
+        # Percorrer pelo índice, sem carregar a tabela toda
+        cursor = self.conn.execute("SELECT rowid, size FROM responses ORDER BY accessed")
+        for rowid, size in cursor:
+            if freed >= target:
+                break
+            doomed.append((rowid,))
+            freed += size
+        cursor.close()
+
+        evicted = len(doomed)
+        with self.conn:
+            self.conn.executemany("DELETE FROM responses WHERE rowid = ?", doomed)
+            self.conn.execute(
+                "INSERT INTO counters VALUES ('evictions', ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                (evicted,)
+            )
+        # Devolver as páginas livres ao sistema
+        self.conn.execute("PRAGMA incremental_vacuum").fetchall()
+
+        logger.info("HTTP cache over %(max)d bytes: evicted %(count)d responses (%(freed)d bytes)",
+                    {'max': self.max_bytes, 'count': evicted, 'freed': freed})
+
+
+class RevalidatePolicy(RFC2616Policy):
+    """Cache policy that checks every cached page with the site before use
+
+    Every response is stored, as with DummyPolicy, but a cached page is
+    only reused after a conditional request with its ETag / Last-Modified
+    gets a 304. Pages without validators are downloaded again.
+    """
+
+    def should_cache_response(self, response, request):
+        return response.status != 304
+
+    def is_cached_response_fresh(self, cachedresponse, request):
+        self._set_conditional_validators(request, cachedresponse)
+        return False
+
+    def is_cached_response_valid(self, cachedresponse, response, request):
+        if b'If-None-Match' in request.headers or b'If-Modified-Since' in request.headers:
+            if response.status == 304:
+                request.meta['neo_revalidation'] = 'not_modified'
+                # Validadores novos valem para a próxima revalidação
+                for name in REVALIDATION_HEADERS:
+                    if name in response.headers:
+                        cachedresponse.headers[name] = response.headers[name]
+            elif response.status < 500:
+                request.meta['neo_revalidation'] = 'modified'
+        return super().is_cached_response_valid(cachedresponse, response, request)
+
+
+class RevalidateStatsMiddleware:
+    """Downloader middleware finishing and counting conditional revalidation
+
+    Keeps `neo/revalidate/not_modified`, `neo/revalidate/modified`,
+    `neo/revalidate/bytes_saved` (cached body sizes) and
+    `neo/revalidate/seconds_saved` (original download time minus the time
+    of the 304). Runs after HttpCacheMiddleware has swapped in the cached
+    response, and refreshes the cached entry when Scrapy did not store it
+    again.
+    """
+
+    def __init__(self, stats, cache=None):
+        self.stats = stats
+        self.cache = cache
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool('HTTPCACHE_ENABLED') or \
+                not issubclass(load_object(settings['HTTPCACHE_POLICY']), RevalidatePolicy):
+            raise NotConfigured
+
+        cache = None
+        if issubclass(load_object(settings['HTTPCACHE_STORAGE']), SQLiteCacheStorage):
+            cache = SQLiteCacheStorage(settings)
+
+        middleware = cls(crawler.stats, cache)
+        if cache is not None:
+            crawler.signals.connect(middleware.spider_opened, signal=signals.spider_opened)
+            crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
+
+    def spider_opened(self, spider):
+        self.cache.open_spider(spider)
+
+    def spider_closed(self, spider):
+        self.cache.close_spider(spider)
+
+    def process_response(self, request, response, spider):
+        outcome = request.meta.get('neo_revalidation')
+        if outcome == 'modified':
+            self.stats.inc_value('neo/revalidate/modified')
+        elif outcome == 'not_modified':
+            self.stats.inc_value('neo/revalidate/not_modified')
+            if self.cache is not None and not request.meta.get('neo_cache_refreshed'):
+                self.cache.refresh_response(
+                    spider.name, self.cache.fingerprinter.fingerprint(request), response.headers
+                )
+            self.stats.inc_value('neo/revalidate/bytes_saved', len(response.body))
+
+            original = request.meta.get('neo_cache_latency')
+            latency = request.meta.get('download_latency')
+            if original is not None and latency is not None:
+                self.stats.inc_value('neo/revalidate/seconds_saved', max(0.0, original - latency), start=0.0)
+        return response
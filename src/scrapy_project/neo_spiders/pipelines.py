@@ -0,0 +1,199 @@
+# Item pipelines for neo_spiders project
+# Managed by Neo: this file is overwritten when Neo starts.
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from itemadapter import ItemAdapter
+from scrapy.exceptions import DropItem, NotConfigured
+from twisted.internet import task
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    spider TEXT NOT NULL,
+    started REAL NOT NULL,
+    finished REAL,
+    status TEXT NOT NULL DEFAULT 'running',
+    item_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS runs_started ON runs (started);
+
+CREATE TABLE IF NOT EXISTS items (
+    run_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS items_run_seq ON items (run_id, seq);
+"""
+
+
+class SQLiteStorePipeline:
+    """Store items in a per-spider SQLite database, one row per item per run"""
+
+    def __init__(self, results_dir, run_id, batch_size, flush_interval):
+        self.results_dir = Path(results_dir)
+        self.run_id = run_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.conn = None
+        self.buffer = []
+        self.count = 0
+        self.last_flush = time.monotonic()
+        self.flush_task = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        return cls(
+            results_dir=settings.get('NEO_RESULTS_DIR', 'results'),
+            run_id=settings.get('NEO_RUN_ID') or time.strftime('%Y%m%d-%H%M%S'),
+            batch_size=settings.getint('NEO_STORE_BATCH_SIZE', 500),
+            flush_interval=settings.getfloat('NEO_STORE_FLUSH_INTERVAL', 1.0),
+        )
+
+    def open_spider(self, spider):
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        db_path = self.results_dir / f"{spider.name}.db"
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO runs (run_id, spider, started) VALUES (?, ?, ?)",
+                (self.run_id, spider.name, time.time())
+            )
+            # Reexecução com o mesmo run_id começa do zero
+            self.conn.execute("DELETE FROM items WHERE run_id = ?", (self.run_id,))
+
+        # Itens de uma rajada seguida de pausa não ficam presos no buffer
+        self.flush_task = task.LoopingCall(self._flush_stale)
+        self.flush_task.start(self.flush_interval, now=False)
+
+    def process_item(self, item, spider):
+        data = json.dumps(ItemAdapter(item).asdict(), ensure_ascii=False, default=str)
+        self.buffer.append((self.run_id, self.count, data))
+        self.count += 1
+
+        # Lotes cheios, ou itens parados há muito tempo no buffer
+        if (len(self.buffer) >= self.batch_size
+                or time.monotonic() - self.last_flush >= self.flush_interval):
+            self.flush()
+
+        return item
+
+    def _flush_stale(self):
+        if time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write buffered items in a single transaction"""
+        if not self.buffer:
+            return
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO items (run_id, seq, data) VALUES (?, ?, ?)",
+                self.buffer
+            )
+            self.conn.execute(
+                "UPDATE runs SET item_count = ? WHERE run_id = ?",
+                (self.count, self.run_id)
+            )
+        self.buffer = []
+        self.last_flush = time.monotonic()
+
+    def close_spider(self, spider):
+        if self.flush_task is not None and self.flush_task.running:
+            self.flush_task.stop()
+        self.flush()
+
+        with self.conn:
+            self.conn.execute(
+                "UPDATE runs SET finished = ?, status = 'finished' WHERE run_id = ?",
+                (time.time(), self.run_id)
+            )
+        self.conn.close()
+
+
+class DedupPipeline:
+    """Drop items whose key fields were already seen, in this run or before
+
+    Fingerprints are 64-bit BLAKE2b digests of the NEO_DEDUP_KEYS fields, or
+    of the whole item when no keys are set. They are kept as the integer
+    keys of a per-spider SQLite table, about ten bytes each on disk, so the
+    set persists between runs without being loaded into memory.
+    """
+
+    def __init__(self, results_dir, keys, flush_interval, stats):
+        self.results_dir = Path(results_dir)
+        self.keys = keys
+        self.flush_interval = flush_interval
+        self.stats = stats
+        self.conn = None
+        self.last_flush = time.monotonic()
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool('NEO_DEDUP'):
+            raise NotConfigured
+
+        return cls(
+            results_dir=settings.get('NEO_RESULTS_DIR', 'results'),
+            keys=settings.getlist('NEO_DEDUP_KEYS'),
+            flush_interval=settings.getfloat('NEO_STORE_FLUSH_INTERVAL', 1.0),
+            stats=crawler.stats,
+        )
+
+    def open_spider(self, spider):
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.results_dir / f"{spider.name}.seen.db")
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS seen (fingerprint INTEGER PRIMARY KEY)")
+
+    def fingerprint(self, item):
+        """Return the item's fingerprint, or None if it has no key values"""
+        data = ItemAdapter(item).asdict()
+        if self.keys:
+            data = {key: data.get(key) for key in self.keys}
+            if all(value in (None, '', []) for value in data.values()):
+                return None
+
+        encoded = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str).encode()
+        digest = hashlib.blake2b(encoded, digest_size=8).digest()
+        return int.from_bytes(digest, 'big', signed=True)
+
+    def process_item(self, item, spider):
+        fingerprint = self.fingerprint(item)
+        if fingerprint is None:
+            # Sem valores nas chaves não há como comparar
+            self.stats.inc_value('neo/dedup/no_key')
+            return item
+
+        cursor = self.conn.execute("INSERT OR IGNORE INTO seen VALUES (?)", (fingerprint,))
+        if time.monotonic() - self.last_flush >= self.flush_interval:
+            self.conn.commit()
+            self.last_flush = time.monotonic()
+
+        if cursor.rowcount == 0:
+            self.stats.inc_value('neo/dedup/dropped')
+            # log_level só existe no Scrapy 2.13+; versões antigas ignoram
+            error = DropItem("Duplicate item")
+            error.log_level = 'DEBUG'
+            raise error
+
+        self.stats.inc_value('neo/dedup/unique')
+        return item
+
+    def close_spider(self, spider):
+        self.conn.commit()
+        self.conn.close()
@@ -0,0 +1,58 @@
+# Pre-warmed crawl worker for neo_spiders project
+# Managed by Neo: this file is overwritten when Neo starts.
+#
+# Run with `python -m neo_spiders.worker` from the project directory. The
+# worker imports Scrapy, Twisted and lxml, loads the project settings and
+# spiders, installs the reactor, and then waits for a single job on stdin:
+#
+#   {"spider": "<name>", "settings": {...}, "args": {...}}
+#
+# The crawl then runs exactly as `scrapy crawl` would, logging to stderr,
+# and the worker exits with 1 if it could not be started. An empty stdin
+# (Neo closed the pipe) makes the worker exit quietly.
+
+import json
+import sys
+
+from scrapy.utils.project import get_project_settings
+from scrapy.utils.reactor import install_reactor
+
+settings = get_project_settings()
+install_reactor(settings.get('TWISTED_REACTOR'))
+
+import lxml.etree  # noqa: E402,F401
+from scrapy.crawler import Crawler, CrawlerProcess  # noqa: E402
+from scrapy.spiderloader import SpiderLoader  # noqa: E402
+
+
+def main():
+    process = CrawlerProcess(settings)
+
+    line = sys.stdin.readline()
+    if not line.strip():
+        return
+
+    job = json.loads(line)
+
+    crawl_settings = settings.copy()
+    crawl_settings.setdict(job.get('settings', {}), priority='cmdline')
+
+    # Spiders antigos (um módulo por spider) vêm de outro SPIDER_MODULES
+    if 'SPIDER_MODULES' in job.get('settings', {}):
+        spider_loader = SpiderLoader.from_settings(crawl_settings)
+    else:
+        spider_loader = process.spider_loader
+
+    spidercls = spider_loader.load(job['spider'])
+    failures = []
+    deferred = process.crawl(Crawler(spidercls, crawl_settings), **job.get('args', {}))
+    deferred.addErrback(failures.append)
+    process.start()
+
+    if failures:
+        sys.stderr.write(f"Crawl failed: {failures[0].getErrorMessage()}\n")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,23 +1,44 @@
-from gi.repository import Gtk, Adw
+from gi.repository import Gtk, Adw, GLib, GObject
 from pathlib import Path
+import threading
 
 from .neo_settings import NeoSettings
+from .project_files import neo_project_settings, merge_project_settings
+from .profiles import PROFILES, PROFILE_LABELS, profile_settings, matching_profile
+from .cache_stats import cache_db_path, read_cache_stats, clear_cache
+from .crawl_stats import format_bytes
+from .results_feed import zstd_available
+
+MB = 1024 * 1024
+
+PROJECT_PATH = Path.home() / ".config" / "neo" / "scrapy_project"
+
+# Modos de execução de crawls e seus rótulos
+CRAWL_MODES = ['subprocess', 'pool', 'engine']
+CRAWL_MODE_LABELS = ['Separate process per crawl', 'Pre-warmed worker pool', 'Shared engine']
+
+# Compressão dos arquivos de resultados; zstd só com o pacote zstandard
+FEED_COMPRESSIONS = ['none', 'gzip', 'zstd'] if zstd_available() else ['none', 'gzip']
+FEED_COMPRESSION_LABELS = ['None', 'gzip', 'zstd'][:len(FEED_COMPRESSIONS)]
 
 
 class ScrapySettingsDialog(Adw.Dialog):
     """Dialog for configuring Scrapy settings"""
 
-    def __init__(self, **kwargs):
+    def __init__(self, callback=None, **kwargs):
         super().__init__(**kwargs)
 
+        self.callback = callback
         self.set_title("Scrapy Settings")
         self.set_content_width(600)
         self.set_content_height(600)
 
         self.settings_manager = NeoSettings()
         self.settings = self.settings_manager.load_scrapy_settings()
+        self._applying_profile = False
 
         self._build_ui()
+        self._sync_profile_row()
 
     def _build_ui(self):
         """Build settings interface"""
@@ -49,6 +70,12 @@ class ScrapySettingsDialog(Adw.Dialog):
         perf_group.set_title("Performance")
         perf_group.set_margin_top(20)
 
+        self.profile_row = Adw.ComboRow()
+        self.profile_row.set_title("Performance Profile")
+        self.profile_row.set_subtitle("Presets for the values below")
+        self.profile_row.set_model(Gtk.StringList.new(PROFILE_LABELS + ['Custom']))
+        perf_group.add(self.profile_row)
+
         self.concurrent_row = Adw.SpinRow()
         self.concurrent_row.set_title("Concurrent Requests")
         self.concurrent_row.set_subtitle("Number of parallel requests")
@@ -76,6 +103,57 @@ class ScrapySettingsDialog(Adw.Dialog):
         self.autothrottle_row.set_active(self.settings['AUTOTHROTTLE_ENABLED'])
         perf_group.add(self.autothrottle_row)
 
+        # Ajustes finos do downloader
+        advanced_row = Adw.ExpanderRow()
+        advanced_row.set_title("Advanced")
+        advanced_row.set_subtitle("Per-domain limits, timeouts, retries and sizes")
+        perf_group.add(advanced_row)
+
+        self.per_domain_row = self._spin_row(
+            advanced_row, "Requests per Domain", "Parallel requests to one domain",
+            self.settings['CONCURRENT_REQUESTS_PER_DOMAIN'], 1, 256, 1
+        )
+        self.per_ip_row = self._spin_row(
+            advanced_row, "Requests per IP", "Limit per IP instead of per domain; 0 to disable",
+            self.settings['CONCURRENT_REQUESTS_PER_IP'], 0, 256, 1
+        )
+        self.target_row = self._spin_row(
+            advanced_row, "Auto Throttle Target", "Average parallel requests per remote server",
+            self.settings['AUTOTHROTTLE_TARGET_CONCURRENCY'], 0.5, 64, 0.5, digits=1
+        )
+        self.timeout_row = self._spin_row(
+            advanced_row, "Download Timeout", "Seconds before a request is given up",
+            self.settings['DOWNLOAD_TIMEOUT'], 1, 600, 5
+        )
+        self.retry_row = self._spin_row(
+            advanced_row, "Retries", "Times a failed request is retried; 0 to disable",
+            self.settings['RETRY_TIMES'] if self.settings['RETRY_ENABLED'] else 0, 0, 10, 1
+        )
+        self.maxsize_row = self._spin_row(
+            advanced_row, "Max Response Size", "MB; larger responses are dropped, 0 for no limit",
+            self.settings['DOWNLOAD_MAXSIZE'] // MB, 0, 4096, 8
+        )
+        self.warnsize_row = self._spin_row(
+            advanced_row, "Warn Response Size", "MB; larger responses are logged, 0 for no warning",
+            self.settings['DOWNLOAD_WARNSIZE'] // MB, 0, 4096, 8
+        )
+        self.dns_row = self._spin_row(
+            advanced_row, "DNS Cache Size", "Host names kept in the DNS cache",
+            self.settings['DNSCACHE_SIZE'], 0, 1_000_000, 1000
+        )
+        self.threadpool_row = self._spin_row(
+            advanced_row, "Thread Pool Size", "Threads for DNS lookups and file I/O",
+            self.settings['REACTOR_THREADPOOL_MAXSIZE'], 1, 100, 1
+        )
+
+        # Editar um valor passa o perfil para "Custom"
+        self.profile_row.connect("notify::selected", self.on_profile_selected)
+        for row in (self.concurrent_row, self.delay_row, self.per_domain_row, self.per_ip_row,
+                    self.target_row, self.timeout_row, self.retry_row, self.maxsize_row,
+                    self.warnsize_row, self.dns_row, self.threadpool_row):
+            row.connect("notify::value", self.on_profile_value_changed)
+        self.autothrottle_row.connect("notify::active", self.on_profile_value_changed)
+
         prefs_page.add(perf_group)
 
         # Behavior
@@ -94,8 +172,116 @@ class ScrapySettingsDialog(Adw.Dialog):
         self.cache_row.set_active(self.settings['HTTPCACHE_ENABLED'])
         behavior_group.add(self.cache_row)
 
+        self.revalidate_row = Adw.SwitchRow()
+        self.revalidate_row.set_title("Revalidate Cached Pages")
+        self.revalidate_row.set_subtitle("Recrawls ask the site if pages changed and skip unchanged ones")
+        self.revalidate_row.set_active(self.settings['NEO_REVALIDATE'])
+        self.cache_row.bind_property("active", self.revalidate_row, "sensitive",
+                                     GObject.BindingFlags.SYNC_CREATE)
+        behavior_group.add(self.revalidate_row)
+
+        self.cache_size_row = Adw.SpinRow()
+        self.cache_size_row.set_title("Cache Size Limit (MB)")
+        self.cache_size_row.set_subtitle("Least recently used responses are evicted beyond this")
+        adjustment = Gtk.Adjustment(
+            value=self.settings['NEO_HTTPCACHE_MAX_MB'],
+            lower=16, upper=1024 * 1024, step_increment=256
+        )
+        self.cache_size_row.set_adjustment(adjustment)
+        self.cache_row.bind_property("active", self.cache_size_row, "sensitive",
+                                     GObject.BindingFlags.SYNC_CREATE)
+        behavior_group.add(self.cache_size_row)
+
+        self.cache_stats_row = Adw.ActionRow()
+        self.cache_stats_row.set_title("Cache Usage")
+        self.cache_stats_row.set_subtitle("Reading...")
+
+        self.clear_cache_btn = Gtk.Button(label="Clear")
+        self.clear_cache_btn.set_valign(Gtk.Align.CENTER)
+        self.clear_cache_btn.add_css_class("destructive-action")
+        self.clear_cache_btn.set_sensitive(False)
+        self.clear_cache_btn.connect("clicked", self.on_clear_cache_clicked)
+        self.cache_stats_row.add_suffix(self.clear_cache_btn)
+        behavior_group.add(self.cache_stats_row)
+
+        self._load_cache_stats()
+
         prefs_page.add(behavior_group)
 
+        # Results
+        results_group = Adw.PreferencesGroup()
+        results_group.set_title("Results")
+
+        self.store_row = Adw.SwitchRow()
+        self.store_row.set_title("Results Database")
+        self.store_row.set_subtitle("Store items in SQLite for instant browsing and export")
+        self.store_row.set_active(self.settings['NEO_RESULTS_STORE'])
+        results_group.add(self.store_row)
+
+        self.compression_row = Adw.ComboRow()
+        self.compression_row.set_title("Result Files Compression")
+        self.compression_row.set_subtitle("Compress results as they are written; they still show live")
+        self.compression_row.set_model(Gtk.StringList.new(FEED_COMPRESSION_LABELS))
+        if self.settings['NEO_FEED_COMPRESSION'] in FEED_COMPRESSIONS:
+            self.compression_row.set_selected(FEED_COMPRESSIONS.index(self.settings['NEO_FEED_COMPRESSION']))
+        results_group.add(self.compression_row)
+
+        self.keep_runs_row = Adw.SpinRow()
+        self.keep_runs_row.set_title("Runs Kept per Spider")
+        self.keep_runs_row.set_subtitle("Older runs are deleted; 0 keeps every run")
+        adjustment = Gtk.Adjustment(
+            value=self.settings['NEO_KEEP_RUNS'],
+            lower=0, upper=10000, step_increment=1
+        )
+        self.keep_runs_row.set_adjustment(adjustment)
+        results_group.add(self.keep_runs_row)
+
+        self.results_size_row = Adw.SpinRow()
+        self.results_size_row.set_title("Result Files Limit (GB)")
+        self.results_size_row.set_subtitle("Oldest runs are deleted beyond this; 0 for no limit")
+        adjustment = Gtk.Adjustment(
+            value=self.settings['NEO_RESULTS_MAX_GB'],
+            lower=0, upper=10000, step_increment=1
+        )
+        self.results_size_row.set_adjustment(adjustment)
+        results_group.add(self.results_size_row)
+
+        prefs_page.add(results_group)
+
+        # Crawl jobs
+        jobs_group = Adw.PreferencesGroup()
+        jobs_group.set_title("Crawl Jobs")
+
+        self.max_crawls_row = Adw.SpinRow()
+        self.max_crawls_row.set_title("Simultaneous Crawls")
+        self.max_crawls_row.set_subtitle("Further crawls wait in the queue")
+        adjustment = Gtk.Adjustment(
+            value=self.settings['NEO_MAX_CRAWLS'],
+            lower=1, upper=32, step_increment=1
+        )
+        self.max_crawls_row.set_adjustment(adjustment)
+        jobs_group.add(self.max_crawls_row)
+
+        self.mode_row = Adw.ComboRow()
+        self.mode_row.set_title("Crawl Engine")
+        self.mode_row.set_subtitle("Warm workers and the shared engine start crawls much faster")
+        self.mode_row.set_model(Gtk.StringList.new(CRAWL_MODE_LABELS))
+        if self.settings['NEO_CRAWL_MODE'] in CRAWL_MODES:
+            self.mode_row.set_selected(CRAWL_MODES.index(self.settings['NEO_CRAWL_MODE']))
+        jobs_group.add(self.mode_row)
+
+        self.pool_row = Adw.SpinRow()
+        self.pool_row.set_title("Warm Workers")
+        self.pool_row.set_subtitle("Idle crawl workers kept ready in pool mode")
+        adjustment = Gtk.Adjustment(
+            value=self.settings['NEO_WORKER_POOL_SIZE'],
+            lower=1, upper=16, step_increment=1
+        )
+        self.pool_row.set_adjustment(adjustment)
+        jobs_group.add(self.pool_row)
+
+        prefs_page.add(jobs_group)
+
         # User Agent
         ua_group = Adw.PreferencesGroup()
         ua_group.set_title("Identity")
@@ -111,53 +297,144 @@ class ScrapySettingsDialog(Adw.Dialog):
         content.set_content(scrolled)
         self.set_child(content)
 
+    def _load_cache_stats(self):
+        """Read the cache stats on a worker thread"""
+        db_path = cache_db_path(PROJECT_PATH)
+
+        def worker():
+            stats = read_cache_stats(db_path)
+            GLib.idle_add(self._show_cache_stats, stats)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _show_cache_stats(self, stats):
+        if not stats or not stats['entries']:
+            self.cache_stats_row.set_subtitle("Empty")
+            self.clear_cache_btn.set_sensitive(False)
+            return
+
+        details = [
+            f"{stats['entries']} responses",
+            f"{format_bytes(stats['disk_bytes'])} on disk",
+        ]
+        if stats['hit_ratio'] is not None:
+            details.append(f"{stats['hit_ratio']:.0%} hits")
+        if stats['evictions']:
+            details.append(f"{stats['evictions']} evicted")
+        self.cache_stats_row.set_subtitle(" · ".join(details))
+        self.clear_cache_btn.set_sensitive(True)
+
+    def on_clear_cache_clicked(self, button):
+        """Empty the HTTP cache"""
+        button.set_sensitive(False)
+        self.cache_stats_row.set_subtitle("Clearing...")
+        db_path = cache_db_path(PROJECT_PATH)
+
+        def worker():
+            try:
+                clear_cache(db_path)
+                print("🧹 HTTP cache cleared")
+            except Exception as e:
+                print(f"❌ Could not clear cache: {e}")
+            stats = read_cache_stats(db_path)
+            GLib.idle_add(self._show_cache_stats, stats)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _spin_row(self, parent, title, subtitle, value, lower, upper, step, digits=0):
+        row = Adw.SpinRow()
+        row.set_title(title)
+        row.set_subtitle(subtitle)
+        row.set_digits(digits)
+        row.set_adjustment(Gtk.Adjustment(value=value, lower=lower, upper=upper, step_increment=step))
+        parent.add_row(row)
+        return row
+
+    def _profile_values(self):
+        """Read the profile-controlled settings from the rows"""
+        retries = int(self.retry_row.get_value())
+        return {
+            'CONCURRENT_REQUESTS': int(self.concurrent_row.get_value()),
+            'CONCURRENT_REQUESTS_PER_DOMAIN': int(self.per_domain_row.get_value()),
+            'CONCURRENT_REQUESTS_PER_IP': int(self.per_ip_row.get_value()),
+            'DOWNLOAD_DELAY': round(self.delay_row.get_value(), 1),
+            'DNSCACHE_SIZE': int(self.dns_row.get_value()),
+            'REACTOR_THREADPOOL_MAXSIZE': int(self.threadpool_row.get_value()),
+            'DOWNLOAD_MAXSIZE': int(self.maxsize_row.get_value()) * MB,
+            'DOWNLOAD_WARNSIZE': int(self.warnsize_row.get_value()) * MB,
+            'DOWNLOAD_TIMEOUT': int(self.timeout_row.get_value()),
+            'RETRY_ENABLED': retries > 0,
+            'RETRY_TIMES': retries if retries > 0 else self.settings['RETRY_TIMES'],
+            'AUTOTHROTTLE_ENABLED': self.autothrottle_row.get_active(),
+            'AUTOTHROTTLE_TARGET_CONCURRENCY': round(self.target_row.get_value(), 1),
+        }
+
+    def _sync_profile_row(self):
+        """Select the profile matching the current values, or Custom"""
+        profile = matching_profile(self._profile_values())
+        self._applying_profile = True
+        self.profile_row.set_selected(PROFILES.index(profile) if profile else len(PROFILES))
+        self._applying_profile = False
+
+    def on_profile_selected(self, row, pspec):
+        """Fill the rows with the selected profile's values"""
+        if self._applying_profile or row.get_selected() >= len(PROFILES):
+            return
+
+        values = profile_settings(PROFILES[row.get_selected()])
+
+        self._applying_profile = True
+        self.concurrent_row.set_value(values['CONCURRENT_REQUESTS'])
+        self.per_domain_row.set_value(values['CONCURRENT_REQUESTS_PER_DOMAIN'])
+        self.per_ip_row.set_value(values['CONCURRENT_REQUESTS_PER_IP'])
+        self.delay_row.set_value(values['DOWNLOAD_DELAY'])
+        self.dns_row.set_value(values['DNSCACHE_SIZE'])
+        self.threadpool_row.set_value(values['REACTOR_THREADPOOL_MAXSIZE'])
+        self.maxsize_row.set_value(values['DOWNLOAD_MAXSIZE'] // MB)
+        self.warnsize_row.set_value(values['DOWNLOAD_WARNSIZE'] // MB)
+        self.timeout_row.set_value(values['DOWNLOAD_TIMEOUT'])
+        self.retry_row.set_value(values['RETRY_TIMES'] if values['RETRY_ENABLED'] else 0)
+        self.autothrottle_row.set_active(values['AUTOTHROTTLE_ENABLED'])
+        self.target_row.set_value(values['AUTOTHROTTLE_TARGET_CONCURRENCY'])
+        self._applying_profile = False
+
+    def on_profile_value_changed(self, row, pspec):
+        if not self._applying_profile:
+            self._sync_profile_row()
+
     def on_save_clicked(self, button):
         """Save settings"""
-        self.settings['CONCURRENT_REQUESTS'] = int(self.concurrent_row.get_value())
-        self.settings['DOWNLOAD_DELAY'] = self.delay_row.get_value()
-        self.settings['AUTOTHROTTLE_ENABLED'] = self.autothrottle_row.get_active()
+        self.settings.update(self._profile_values())
         self.settings['ROBOTSTXT_OBEY'] = self.robotstxt_row.get_active()
         self.settings['HTTPCACHE_ENABLED'] = self.cache_row.get_active()
+        self.settings['NEO_HTTPCACHE_MAX_MB'] = int(self.cache_size_row.get_value())
+        self.settings['NEO_REVALIDATE'] = self.revalidate_row.get_active()
         self.settings['USER_AGENT'] = self.ua_row.get_text()
+        self.settings['NEO_RESULTS_STORE'] = self.store_row.get_active()
+        self.settings['NEO_FEED_COMPRESSION'] = FEED_COMPRESSIONS[self.compression_row.get_selected()]
+        self.settings['NEO_KEEP_RUNS'] = int(self.keep_runs_row.get_value())
+        self.settings['NEO_RESULTS_MAX_GB'] = int(self.results_size_row.get_value())
+        self.settings['NEO_MAX_CRAWLS'] = int(self.max_crawls_row.get_value())
+        self.settings['NEO_CRAWL_MODE'] = CRAWL_MODES[self.mode_row.get_selected()]
+        self.settings['NEO_WORKER_POOL_SIZE'] = int(self.pool_row.get_value())
 
         self.settings_manager.save_scrapy_settings(self.settings)
         self._apply_to_scrapy_project()
 
+        if self.callback:
+            self.callback(self.settings)
         self.close()
 
     def _apply_to_scrapy_project(self):
-        """Apply settings to Scrapy settings.py"""
-        project_path = Path.home() / ".config" / "neo" / "scrapy_project" / "neo_spiders"
-        settings_file = project_path / "settings.py"
+        """Merge settings into Scrapy settings.py, keeping everything else"""
+        settings_file = PROJECT_PATH / "neo_spiders" / "settings.py"
 
         if not settings_file.exists():
             return
 
-        settings_content = f'''# Scrapy settings for neo_spiders project
-# Generated by Neo
-
-BOT_NAME = "neo_spiders"
-
-SPIDER_MODULES = ["neo_spiders.spiders"]
-NEWSPIDER_MODULE = "neo_spiders.spiders"
-
-ROBOTSTXT_OBEY = {self.settings['ROBOTSTXT_OBEY']}
-CONCURRENT_REQUESTS = {self.settings['CONCURRENT_REQUESTS']}
-DOWNLOAD_DELAY = {self.settings['DOWNLOAD_DELAY']}
-USER_AGENT = "{self.settings['USER_AGENT']}"
-
-AUTOTHROTTLE_ENABLED = {self.settings['AUTOTHROTTLE_ENABLED']}
-AUTOTHROTTLE_START_DELAY = 1
-AUTOTHROTTLE_MAX_DELAY = 10
-
-HTTPCACHE_ENABLED = {self.settings['HTTPCACHE_ENABLED']}
-HTTPCACHE_EXPIRATION_SECS = 86400
-HTTPCACHE_DIR = "httpcache"
-
-REQUEST_FINGERPRINTER_IMPLEMENTATION = "2.7"
-TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
-FEED_EXPORT_ENCODING = "utf-8"
-'''
+        # Chaves NEO_* são do app, não do Scrapy
+        values = {key: value for key, value in self.settings.items() if not key.startswith('NEO_')}
+        values.update(neo_project_settings(self.settings))
 
-        settings_file.write_text(settings_content)
+        merge_project_settings(settings_file, values)
         print("✅ Scrapy settings applied")
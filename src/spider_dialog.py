@@ -1,4 +1,4 @@
-from gi.repository import Gtk, Adw, GLib
+from gi.repository import Gtk, Adw, GLib, GObject
 from datetime import datetime
 
 from .field_dialog import FieldDialog
@@ -84,8 +84,73 @@ class SpiderDialog(Adw.Dialog):
         self.selector_row.get_delegate().set_placeholder_text("div.item, article")
         basic_group.add(self.selector_row)
 
+        self.compiled_row = Adw.SwitchRow()
+        self.compiled_row.set_title("Compiled Extraction")
+        self.compiled_row.set_subtitle("Compile selectors to XPath once instead of per item")
+        self.compiled_row.set_active(False)
+        basic_group.add(self.compiled_row)
+
+        self.dedup_row = Adw.SwitchRow()
+        self.dedup_row.set_title("Drop Duplicate Items")
+        self.dedup_row.set_subtitle("Skip items already scraped, in this run or earlier ones")
+        basic_group.add(self.dedup_row)
+
+        self.dedup_keys_row = Adw.EntryRow()
+        self.dedup_keys_row.set_title("Duplicate Key Fields")
+        self.dedup_keys_row.get_delegate().set_placeholder_text("url, sku (empty compares whole items)")
+        self.dedup_row.bind_property("active", self.dedup_keys_row, "sensitive", GObject.BindingFlags.SYNC_CREATE)
+        basic_group.add(self.dedup_keys_row)
+
+        self.delta_row = Adw.SwitchRow()
+        self.delta_row.set_title("Delta Mode")
+        self.delta_row.set_subtitle("Only emit items inserted, changed or removed since the last run")
+        basic_group.add(self.delta_row)
+
+        self.delta_keys_row = Adw.EntryRow()
+        self.delta_keys_row.set_title("Delta Key Fields")
+        self.delta_keys_row.get_delegate().set_placeholder_text("url, sku")
+        self.delta_row.bind_property("active", self.delta_keys_row, "sensitive", GObject.BindingFlags.SYNC_CREATE)
+        basic_group.add(self.delta_keys_row)
+
         form_box.append(basic_group)
 
+        # Link following
+        follow_group = Adw.PreferencesGroup()
+        follow_group.set_title("Link Following")
+        follow_group.set_description("Crawl beyond the start URL, with a disk-backed queue")
+        follow_group.set_margin_top(10)
+        follow_group.set_margin_start(20)
+        follow_group.set_margin_end(20)
+
+        self.follow_row = Adw.SwitchRow()
+        self.follow_row.set_title("Follow Links")
+        follow_group.add(self.follow_row)
+
+        self.link_selector_row = Adw.EntryRow()
+        self.link_selector_row.set_title("Link Selector (CSS)")
+        self.link_selector_row.get_delegate().set_placeholder_text("a.next, .pagination a")
+        follow_group.add(self.link_selector_row)
+
+        self.depth_row = Adw.SpinRow()
+        self.depth_row.set_title("Max Depth")
+        self.depth_row.set_subtitle("Links away from the start URL")
+        self.depth_row.set_adjustment(Gtk.Adjustment(value=3, lower=1, upper=100, step_increment=1))
+        follow_group.add(self.depth_row)
+
+        self.domain_budget_row = Adw.SpinRow()
+        self.domain_budget_row.set_title("Max Pages per Domain")
+        self.domain_budget_row.set_subtitle("0 for no limit")
+        self.domain_budget_row.set_adjustment(
+            Gtk.Adjustment(value=0, lower=0, upper=10_000_000, step_increment=100)
+        )
+        follow_group.add(self.domain_budget_row)
+
+        # Opções só valem com o switch ligado
+        for row in (self.link_selector_row, self.depth_row, self.domain_budget_row):
+            self.follow_row.bind_property("active", row, "sensitive", GObject.BindingFlags.SYNC_CREATE)
+
+        form_box.append(follow_group)
+
         # Fields
         fields_group = Adw.PreferencesGroup()
         fields_group.set_title("Data Fields")
@@ -149,6 +214,16 @@ class SpiderDialog(Adw.Dialog):
         self.fields.remove(field_data)
         self.fields_listbox.remove(row)
 
+    def _key_fields(self, row):
+        """Parse a comma-separated list of field names, or None if invalid"""
+        keys = [key.strip() for key in row.get_text().split(',') if key.strip()]
+        field_names = {field['name'] for field in self.fields}
+        unknown = [key for key in keys if key not in field_names]
+        if unknown:
+            print(f"❌ Unknown key fields: {', '.join(unknown)}")
+            return None
+        return keys
+
     def on_create_clicked(self, button):
         """Create spider"""
         name = self.name_row.get_text().strip()
@@ -160,6 +235,36 @@ class SpiderDialog(Adw.Dialog):
             print("❌ Fill all fields")
             return
 
+        follow_links = None
+        if self.follow_row.get_active():
+            link_selector = self.link_selector_row.get_text().strip()
+            if not link_selector:
+                print("❌ Link selector required to follow links")
+                return
+
+            follow_links = {
+                'selector': link_selector,
+                'max_depth': int(self.depth_row.get_value()),
+                'max_per_domain': int(self.domain_budget_row.get_value()),
+            }
+
+        dedup = None
+        if self.dedup_row.get_active():
+            keys = self._key_fields(self.dedup_keys_row)
+            if keys is None:
+                return
+            dedup = {'keys': keys}
+
+        delta = None
+        if self.delta_row.get_active():
+            keys = self._key_fields(self.delta_keys_row)
+            if keys is None:
+                return
+            if not keys:
+                print("❌ Delta mode needs at least one key field")
+                return
+            delta = {'keys': keys}
+
         # Validar nome do spider
         safe_name = name.lower().replace(' ', '_').replace('-', '_')
         safe_name = ''.join(c for c in safe_name if c.isalnum() or c == '_')
@@ -179,6 +284,10 @@ class SpiderDialog(Adw.Dialog):
             'allowed_domains': [domain],
             'item_selector': item_selector,
             'fields': self.fields,
+            'extraction': 'compiled' if self.compiled_row.get_active() else 'css',
+            'follow_links': follow_links,
+            'dedup': dedup,
+            'delta': delta,
             'created': datetime.now().isoformat()
         }
 
@@ -0,0 +1,124 @@
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+NAME_RE = re.compile(r'name\s*=\s*["\'](.+?)["\']')
+
+
+class SpiderIndex:
+    """Spider names found in the project's spider modules
+
+    Entries are keyed by file path and only re-read when the file's mtime
+    changes. The index is saved between runs, so startup only has to stat
+    the spider files instead of reading them all.
+    """
+
+    def __init__(self, spiders_dir, index_file):
+        self.spiders_dir = Path(spiders_dir)
+        self.index_file = index_file
+        self.entries = {}
+        self.lock = threading.Lock()
+
+        self._load()
+
+    def _load(self):
+        if not self.index_file.exists():
+            return
+
+        try:
+            with open(self.index_file, 'r') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Rebuilding spider index: {e}")
+            self.entries = {}
+
+    def _save(self):
+        tmp_file = self.index_file.with_suffix('.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(self.entries, f)
+        os.replace(tmp_file, self.index_file)
+
+    def _read_entry(self, path, mtime):
+        try:
+            content = Path(path).read_text()
+        except OSError:
+            return None
+
+        match = NAME_RE.search(content)
+        return {
+            'mtime': mtime,
+            'name': match.group(1) if match else None,
+            'class': Path(path).stem,
+        }
+
+    def refresh(self):
+        """Bring the whole index up to date with the spiders directory"""
+        if not self.spiders_dir.exists():
+            return
+
+        with self.lock:
+            seen = set()
+            changed = False
+
+            for entry in os.scandir(self.spiders_dir):
+                if not entry.name.endswith('.py') or entry.name == '__init__.py':
+                    continue
+
+                seen.add(entry.path)
+                mtime = entry.stat().st_mtime_ns
+                cached = self.entries.get(entry.path)
+                if cached is not None and cached['mtime'] == mtime:
+                    continue
+
+                self.entries[entry.path] = self._read_entry(entry.path, mtime)
+                changed = True
+
+            for path in set(self.entries) - seen:
+                del self.entries[path]
+                changed = True
+
+            if changed:
+                self._save()
+
+    def update_file(self, path):
+        """Re-index a single file; returns True if its entry changed"""
+        path = str(path)
+
+        with self.lock:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                if self.entries.pop(path, None) is None:
+                    return False
+                self._save()
+                return True
+
+            cached = self.entries.get(path)
+            if cached is not None and cached['mtime'] == mtime:
+                return False
+
+            self.entries[path] = self._read_entry(path, mtime)
+            self._save()
+            return True
+
+    def get(self, path):
+        """Return the spider defined in a file, if any"""
+        entry = self.entries.get(str(path))
+        if entry is None or not entry.get('name'):
+            return None
+
+        return {
+            'name': entry['name'],
+            'file': str(path),
+            'class': entry['class'],
+        }
+
+    def spiders(self):
+        """Return all indexed spiders sorted by name"""
+        with self.lock:
+            paths = list(self.entries)
+
+        spiders = [spider for spider in map(self.get, paths) if spider]
+        return sorted(spiders, key=lambda spider: spider['name'])
@@ -0,0 +1,46 @@
+import json
+import threading
+import time
+from datetime import datetime
+
+
+class StartupTimer:
+    """Record how long each startup phase takes
+
+    Phases are stored as offsets from the moment the timer was created, so
+    work done on the main thread and on background threads can be compared
+    on the same time line.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = []
+        self.lock = threading.Lock()
+
+    def mark(self, phase):
+        """Record that a phase has just finished"""
+        elapsed = (time.perf_counter() - self.start) * 1000
+        with self.lock:
+            self.marks.append((phase, elapsed))
+
+    def report(self, log_file=None):
+        """Print the timings and append them to a JSON Lines log"""
+        with self.lock:
+            marks = list(self.marks)
+
+        print("⏱️  Startup timings")
+        for phase, elapsed in marks:
+            print(f"   {elapsed:8.1f} ms  {phase}")
+
+        if log_file is None:
+            return
+
+        entry = {
+            'date': datetime.now().isoformat(),
+            'phases': {phase: round(elapsed, 1) for phase, elapsed in marks},
+        }
+        try:
+            with open(log_file, 'a') as f:
+                f.write(json.dumps(entry) + '\n')
+        except OSError as e:
+            print(f"⚠️  Could not save startup timings: {e}")
@@ -0,0 +1,147 @@
+from gi.repository import Gtk, Adw, GLib
+import threading
+
+from .tuner import TuneCancelled
+
+
+class TuneDialog(Adw.Dialog):
+    """Dialog running concurrency probes and offering the recommendation"""
+
+    def __init__(self, tuner, spider_name, callback, **kwargs):
+        super().__init__(**kwargs)
+
+        self.tuner = tuner
+        self.callback = callback
+        self.recommendation = None
+        self.set_title(f"Tune {spider_name}")
+        self.set_content_width(460)
+        self.set_can_close(False)
+
+        self._build_ui()
+
+        thread = threading.Thread(target=self._run_tuner, daemon=True)
+        thread.start()
+
+    def _build_ui(self):
+        """Build tuning progress interface"""
+        content = Adw.ToolbarView()
+
+        header = Adw.HeaderBar()
+        header.set_show_end_title_buttons(False)
+        content.add_top_bar(header)
+
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+        box.set_margin_top(20)
+        box.set_margin_bottom(20)
+        box.set_margin_start(20)
+        box.set_margin_end(20)
+
+        self.status_label = Gtk.Label(
+            label=f"Probing {len(self.tuner.levels)} concurrency levels, "
+                  f"{self.tuner.probe_seconds} s each"
+        )
+        self.status_label.set_wrap(True)
+        box.append(self.status_label)
+
+        self.progress_bar = Gtk.ProgressBar()
+        box.append(self.progress_bar)
+
+        self.probes_listbox = Gtk.ListBox()
+        self.probes_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
+        self.probes_listbox.add_css_class("boxed-list")
+        box.append(self.probes_listbox)
+
+        self.buttons_box = Gtk.Box(spacing=12)
+        self.buttons_box.set_halign(Gtk.Align.CENTER)
+
+        self.cancel_btn = Gtk.Button(label="Cancel")
+        self.cancel_btn.add_css_class("pill")
+        self.cancel_btn.connect("clicked", self.on_cancel_clicked)
+        self.buttons_box.append(self.cancel_btn)
+
+        self.spider_btn = Gtk.Button(label="Apply to Spider")
+        self.spider_btn.add_css_class("pill")
+        self.spider_btn.add_css_class("suggested-action")
+        self.spider_btn.connect("clicked", self.on_apply_clicked, 'spider')
+        self.spider_btn.set_visible(False)
+        self.buttons_box.append(self.spider_btn)
+
+        self.global_btn = Gtk.Button(label="Apply Globally")
+        self.global_btn.add_css_class("pill")
+        self.global_btn.connect("clicked", self.on_apply_clicked, 'global')
+        self.global_btn.set_visible(False)
+        self.buttons_box.append(self.global_btn)
+
+        box.append(self.buttons_box)
+
+        content.set_content(box)
+        self.set_child(content)
+
+    def on_cancel_clicked(self, button):
+        """Cancel the probes, or close once they are done"""
+        if self.recommendation is not None:
+            self._close()
+            return
+
+        button.set_sensitive(False)
+        self.status_label.set_label("Cancelling...")
+        self.tuner.cancel()
+
+    def on_apply_clicked(self, button, scope):
+        """Hand the recommended settings to the window"""
+        self._close()
+        if self.callback:
+            self.callback(self.recommendation['settings'], scope)
+
+    def _run_tuner(self):
+        """Run the probes on a worker thread"""
+        try:
+            recommendation = self.tuner.run(self._on_probe)
+            GLib.idle_add(self._show_recommendation, recommendation)
+        except TuneCancelled:
+            GLib.idle_add(self._close)
+        except Exception as e:
+            GLib.idle_add(self._show_error, e)
+
+    def _on_probe(self, fraction, result):
+        GLib.idle_add(self._add_probe_row, fraction, result)
+
+    def _add_probe_row(self, fraction, result):
+        row = Adw.ActionRow()
+        row.set_title(f"{result['level']} concurrent")
+
+        details = [f"{result['throughput']:.1f} req/s"]
+        if result['latency'] is not None:
+            details.append(f"{result['latency'] * 1000:.0f} ms")
+        details.append(f"{result['error_rate']:.1%} errors")
+        if result['throttle_rate']:
+            details.append(f"{result['throttle_rate']:.1%} 429")
+        row.set_subtitle(" · ".join(details))
+
+        self.probes_listbox.append(row)
+        self.progress_bar.set_fraction(fraction)
+
+    def _show_recommendation(self, recommendation):
+        self.recommendation = recommendation
+        settings = recommendation['settings']
+
+        self.progress_bar.set_fraction(1.0)
+        self.status_label.set_label(
+            f"Recommended: {settings['CONCURRENT_REQUESTS']} concurrent requests, "
+            f"{settings['DOWNLOAD_DELAY']} s delay\n{recommendation['reason']}"
+        )
+
+        self.cancel_btn.set_label("Close")
+        self.cancel_btn.set_sensitive(True)
+        self.spider_btn.set_visible(True)
+        self.global_btn.set_visible(True)
+
+    def _show_error(self, error):
+        self.recommendation = {}
+        self.status_label.set_label(f"Tuning failed: {error}")
+        self.cancel_btn.set_label("Close")
+        self.cancel_btn.set_sensitive(True)
+
+    def _close(self):
+        self.set_can_close(True)
+        self.close()
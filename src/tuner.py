@@ -0,0 +1,182 @@
+import json
+import subprocess
+import tempfile
+from pathlib import Path
+
+# Níveis de concorrência testados, em ordem
+TUNE_LEVELS = [1, 2, 4, 8, 16, 32, 64]
+PROBE_SECONDS = 15
+
+# Critérios para parar de subir a concorrência
+MIN_GAIN = 0.10
+MAX_ERROR_RATE = 0.02
+MAX_LATENCY_GROWTH = 2.0
+
+
+class TuneCancelled(Exception):
+    """Raised when a tuning run is cancelled"""
+
+
+def probe_result(level, stats):
+    """Summarize the stats of one probe crawl"""
+    requests = stats.get('downloader/request_count', 0)
+    responses = stats.get('response_received_count', 0)
+    elapsed = stats.get('elapsed_time_seconds') or 1
+
+    server_errors = sum(
+        count for key, count in stats.items()
+        if key.startswith('downloader/response_status_count/5')
+    )
+    errors = stats.get('downloader/exception_count', 0) + server_errors
+    throttled = stats.get('downloader/response_status_count/429', 0)
+
+    latency_count = stats.get('neo/latency/count', 0)
+    latency = stats.get('neo/latency/total', 0) / latency_count if latency_count else None
+
+    return {
+        'level': level,
+        'requests': requests,
+        'throughput': responses / elapsed,
+        'latency': latency,
+        'error_rate': errors / requests if requests else 0,
+        'throttle_rate': throttled / requests if requests else 0,
+    }
+
+
+def is_healthy(result):
+    return result['error_rate'] <= MAX_ERROR_RATE and result['throttle_rate'] == 0
+
+
+class ConcurrencyTuner:
+    """Find the concurrency where a spider's throughput stops improving
+
+    Runs short probe crawls at increasing CONCURRENT_REQUESTS levels and
+    stops as soon as throughput no longer grows by MIN_GAIN, latency
+    degrades, or the site starts answering with errors or 429s.
+    """
+
+    def __init__(self, project_path, spider_name, spider_args, crawl_settings, command_builder,
+                 levels=TUNE_LEVELS, probe_seconds=PROBE_SECONDS):
+        self.project_path = project_path
+        self.spider_name = spider_name
+        self.spider_args = spider_args
+        self.crawl_settings = crawl_settings
+        self.command_builder = command_builder
+        self.levels = levels
+        self.probe_seconds = probe_seconds
+        self.results = []
+        self.process = None
+        self._cancelled = False
+
+    def cancel(self):
+        """Stop after the running probe is terminated"""
+        self._cancelled = True
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+
+    def run(self, progress_callback=None):
+        """Run the probes and return the recommended settings"""
+        self.results = []
+
+        for level in self.levels:
+            result = self._probe(level)
+            self.results.append(result)
+            if progress_callback:
+                progress_callback(len(self.results) / len(self.levels), result)
+
+            if self._should_stop():
+                break
+
+        return self.recommend()
+
+    def _probe(self, level):
+        if self._cancelled:
+            raise TuneCancelled()
+
+        with tempfile.TemporaryDirectory(prefix="neo-tune-") as tmp:
+            stats_file = Path(tmp) / "stats.json"
+
+            # Sem cache, atrasos ou saída: só medir o site
+            probe_settings = {
+                **self.crawl_settings,
+                'CONCURRENT_REQUESTS': level,
+                'CONCURRENT_REQUESTS_PER_DOMAIN': level,
+                'DOWNLOAD_DELAY': 0,
+                'AUTOTHROTTLE_ENABLED': False,
+                'HTTPCACHE_ENABLED': False,
+                'RETRY_ENABLED': False,
+                'CLOSESPIDER_TIMEOUT': self.probe_seconds,
+                'ITEM_PIPELINES': {},
+                'FEEDS': {},
+                'NEO_DELTA': False,
+                'LOG_LEVEL': 'WARNING',
+                'NEO_STATS_DUMP': str(stats_file),
+            }
+            if 'JOBDIR' in probe_settings:
+                probe_settings['JOBDIR'] = str(Path(tmp) / "job")
+
+            self.process = subprocess.Popen(
+                self.command_builder(self.spider_name, probe_settings, self.spider_args),
+                cwd=str(self.project_path),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            self.process.wait()
+
+            if self._cancelled:
+                raise TuneCancelled()
+            if not stats_file.exists():
+                raise RuntimeError(f"Probe crawl at concurrency {level} failed")
+
+            with open(stats_file, 'r') as f:
+                stats = json.load(f)
+
+        result = probe_result(level, stats)
+        if result['requests'] == 0:
+            raise RuntimeError("Probe crawl made no requests")
+
+        print(f"🎛️  Concurrency {level}: {result['throughput']:.1f} req/s")
+        return result
+
+    def _should_stop(self):
+        last = self.results[-1]
+        if not is_healthy(last):
+            return True
+        if len(self.results) == 1:
+            return False
+
+        baseline = self.results[0]
+        if last['latency'] and baseline['latency'] and \
+                last['latency'] > baseline['latency'] * MAX_LATENCY_GROWTH:
+            return True
+
+        best = max(result['throughput'] for result in self.results[:-1])
+        return last['throughput'] < best * (1 + MIN_GAIN)
+
+    def recommend(self):
+        """Pick the lowest healthy level within MIN_GAIN of the best throughput"""
+        healthy = [result for result in self.results if is_healthy(result)]
+
+        if not healthy:
+            # Mesmo uma requisição por vez incomoda o site
+            latency = self.results[0]['latency'] or 1.0
+            return {
+                'settings': {
+                    'CONCURRENT_REQUESTS': 1,
+                    'CONCURRENT_REQUESTS_PER_DOMAIN': 1,
+                    'DOWNLOAD_DELAY': round(max(1.0, latency), 1),
+                },
+                'reason': "The site returned errors or 429s even at concurrency 1",
+            }
+
+        best = max(result['throughput'] for result in healthy)
+        chosen = next(result for result in healthy if result['throughput'] >= best * (1 - MIN_GAIN))
+
+        return {
+            'settings': {
+                'CONCURRENT_REQUESTS': chosen['level'],
+                'CONCURRENT_REQUESTS_PER_DOMAIN': chosen['level'],
+                'DOWNLOAD_DELAY': 0,
+            },
+            'reason': f"{chosen['throughput']:.1f} requests/s at concurrency {chosen['level']}",
+        }
@@ -1,5 +1,7 @@
 from gi.repository import Gtk, Adw, GLib, Gio
 import json
+import importlib.util
+import shutil
 import subprocess
 import threading
 import sys
@@ -10,6 +12,36 @@ from datetime import datetime
 from .spider_dialog import SpiderDialog
 from .settings_dialog import ScrapySettingsDialog
 from .neo_settings import NeoSettings
+from .results_model import ResultsModel
+from .crawl_log import CrawlLog, LOG_LEVELS
+from .crawl_stats import StatsReceiver, format_bytes
+from .scheduler import CrawlScheduler
+from .engine import CrawlEngine
+from .worker_pool import WorkerPool
+from .results_feed import FEED_SUFFIXES, open_feed_source, zstd_available
+from .results_store import StoreSource, list_runs
+from .retention import apply_retention, list_feed_runs, run_feeds, GB
+from .project_files import sync_project_modules, neo_project_settings, merge_project_settings, frontier_settings, \
+    feed_options, SETTINGS_TEMPLATE
+from .exporter import ResultsExporter
+from .export_dialog import ExportDialog
+from .startup_timer import StartupTimer
+from .tuner import ConcurrencyTuner
+from .profiles import PROFILES, PROFILE_LABELS, profile_settings
+from .tune_dialog import TuneDialog
+from .spider_index import SpiderIndex
+from .replay import ReplayRunner, last_run_counts
+from .replay_dialog import ReplayDialog
+
+# Leitura incremental do feed de resultados
+RESULTS_POLL_INTERVAL = 500  # ms
+RESULTS_BATCH_SIZE = 500
+
+# Atualização do painel de log
+LOG_REFRESH_INTERVAL = 500  # ms
+
+# Atualização das estatísticas dos crawls
+STATS_REFRESH_INTERVAL = 1000  # ms
 
 
 class NeoWindow(Adw.ApplicationWindow):
@@ -18,47 +50,157 @@ class NeoWindow(Adw.ApplicationWindow):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+        self.startup_timer = StartupTimer()
         self.neo_settings = NeoSettings()
         self.set_default_size(1000, 700)
         self.set_title("Neo")
 
-        # DEBUG: Imprimir info do ambiente
-        self.debug_environment()
-
-        # Verificar Scrapy
-        if not self.check_scrapy_installation():
-            missing_page = self.show_scrapy_missing_page()
-            self.set_content(missing_page)
-            return
-
         # Scrapy project path
         self.project_path = Path.home() / ".config" / "neo" / "scrapy_project"
-        self.ensure_scrapy_project()
-
-        # Limpar spiders inválidos
-        self.clean_invalid_spiders()
 
         # Estado
         self.spiders = []
+        self.spider_rows = {}
+        self.spiders_monitor = None
         self.active_crawls = {}
+        self.results_model = None
+        self.results_fields = []
+        self.results_spider = None
+        self.results_run_id = None
+        self.results_timer = None
+        self.results_runs = []
+        self._selecting_run = False
+        self.retention_lock = threading.Lock()
+        self.log_shown = None
+        self.log_shown_total = -1
+        self.log_timer = None
+        self.crawl_rows = {}
+        self.crawl_stats = {}
+        self.stats_timer = None
+
+        # Índice de spiders, salvo entre execuções
+        self.spider_index = SpiderIndex(
+            self.project_path / "neo_spiders" / "spiders",
+            self.neo_settings.config_dir / "spider_index.json"
+        )
+
+        # Engine compartilhado, iniciado no primeiro uso
+        self.crawl_engine = CrawlEngine(self.project_path)
+
+        # Workers pré-aquecidos, iniciados quando o projeto estiver pronto
+        scrapy_settings = self.neo_settings.load_scrapy_settings()
+        self.worker_pool = WorkerPool(self.project_path, scrapy_settings['NEO_WORKER_POOL_SIZE'])
+        self.connect("close-request", self.on_close_request)
+
+        # Fila de crawls, restaurada entre execuções
+        self.scheduler = CrawlScheduler(
+            self.neo_settings.config_dir / "crawl_queue.json",
+            self._launch_job,
+            scrapy_settings['NEO_MAX_CRAWLS']
+        )
 
         self._build_ui()
-        self._load_spiders()
+        self.startup_timer.mark("ui built")
+        self.connect("map", self._on_first_map)
+
+        # Verificações pesadas rodam fora da thread principal
+        thread = threading.Thread(target=self._prepare_environment, daemon=True)
+        thread.start()
+
+    def _on_first_map(self, window):
+        """Record when the window is first shown"""
+        self.startup_timer.mark("window shown")
+        self.disconnect_by_func(self._on_first_map)
+
+    def _prepare_environment(self):
+        """Check Scrapy and prepare the project without blocking the UI"""
+        try:
+            if not self.check_scrapy_installation():
+                self.startup_timer.mark("scrapy check")
+                GLib.idle_add(self._on_environment_ready, False, [])
+                return
+            self.startup_timer.mark("scrapy check")
+
+            self.ensure_scrapy_project()
+            self.startup_timer.mark("project ready")
+
+            # Limpar spiders inválidos
+            self.clean_invalid_spiders()
+            self.startup_timer.mark("invalid spiders cleaned")
+
+            # Runs antigos: compactar e apagar conforme a política
+            self._apply_retention()
+            self.startup_timer.mark("results retention")
+
+            spiders = self._scan_spiders()
+            self.startup_timer.mark("spiders scanned")
+        except Exception as e:
+            # Ex.: settings.py editado à mão com erro de sintaxe
+            print(f"❌ Error preparing Neo: {e}")
+            GLib.idle_add(self._on_environment_failed, e)
+            return
+
+        GLib.idle_add(self._on_environment_ready, True, spiders)
+
+    def _on_environment_failed(self, error):
+        """Replace the loading state with the startup error"""
+        self.loading_page.set_icon_name("dialog-error-symbolic")
+        self.loading_page.set_title("Could Not Prepare Neo")
+        self.loading_page.set_description(
+            f"{error}\n\nCheck the Scrapy project in {self.project_path} and restart Neo."
+        )
+        self.loading_page.set_child(None)
+        self._report_startup()
+
+    def _on_environment_ready(self, scrapy_found, spiders):
+        """Leave the loading state once startup checks are done"""
+        if not scrapy_found:
+            print("❌ Scrapy not found in Python path!")
+            missing_page = self.show_scrapy_missing_page()
+            self.set_content(missing_page)
+            self._report_startup()
+            return
+
+        self.toolbar_view.set_content(self.view_stack)
+        self.new_spider_btn.set_sensitive(True)
+
+        self.spiders = spiders
+        self._update_spiders_list()
+        self._watch_spiders_dir()
+        self._refresh_results_runs()
+
+        if self.neo_settings.load_scrapy_settings()['NEO_CRAWL_MODE'] == 'pool':
+            self.worker_pool.fill()
+
+        for job in self.scheduler.pending_jobs():
+            self._add_crawl_to_ui(job)
+        self.scheduler.dispatch()
+
+        self.startup_timer.mark("ready")
+        self._report_startup()
+
+    def _report_startup(self):
+        self.startup_timer.report(self.neo_settings.config_dir / "startup_timings.jsonl")
+
+    def on_close_request(self, window):
+        """Let the crawl engine and idle workers exit with the window"""
+        self.crawl_engine.shutdown()
+        self.worker_pool.shutdown()
+        return False
 
     def debug_environment(self):
-        """Debug: print environment info"""
-        print("=" * 50)
-        print("DEBUG: Environment Information")
-        print("=" * 50)
-        print(f"Python executable: {sys.executable}")
-        print(f"Python version: {sys.version}")
+        """Collect environment info for the diagnostics report"""
+        lines = [
+            f"Python executable: {sys.executable}",
+            f"Python version: {sys.version}",
+        ]
 
         try:
             import scrapy
-            print(f"✅ Scrapy version: {scrapy.__version__}")
-            print(f"   Scrapy location: {scrapy.__file__}")
+            lines.append(f"✅ Scrapy version: {scrapy.__version__}")
+            lines.append(f"   Scrapy location: {scrapy.__file__}")
         except ImportError as e:
-            print(f"❌ Scrapy not found: {e}")
+            lines.append(f"❌ Scrapy not found: {e}")
 
         # Testar comando
         try:
@@ -68,20 +210,42 @@ class NeoWindow(Adw.ApplicationWindow):
                 text=True,
                 timeout=5
             )
-            print(f"✅ Scrapy command works:")
-            print(f"   {result.stdout.strip()}")
+            lines.append(f"✅ Scrapy command works:")
+            lines.append(f"   {result.stdout.strip()}")
         except Exception as e:
-            print(f"❌ Scrapy command failed: {e}")
+            lines.append(f"❌ Scrapy command failed: {e}")
 
+        lines.append(f"Project: {self.project_path}")
+
+        print("=" * 50)
+        print("DEBUG: Environment Information")
         print("=" * 50)
+        for line in lines:
+            print(line)
+        print("=" * 50)
+
+        return "\n".join(lines)
+
+    def on_diagnostics(self, action, param):
+        """Run environment diagnostics on request"""
+        self.show_toast("Running diagnostics...")
+
+        def run():
+            report = self.debug_environment()
+            GLib.idle_add(self._show_diagnostics, report)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _show_diagnostics(self, report):
+        dialog = Adw.AlertDialog()
+        dialog.set_heading("Diagnostics")
+        dialog.set_body(report)
+        dialog.add_response("close", "Close")
+        dialog.present(self)
 
     def check_scrapy_installation(self):
-        """Check if Scrapy is installed"""
-        try:
-            import scrapy
-            return True
-        except ImportError:
-            return False
+        """Check if Scrapy is installed, without importing it"""
+        return importlib.util.find_spec('scrapy') is not None
 
     def show_scrapy_missing_page(self):
         """Show page when Scrapy is not installed"""
@@ -124,41 +288,17 @@ project = neo_spiders
         if not settings_file.exists():
             print("⚠️  settings.py not found, creating...")
 
-            settings_content = """# Scrapy settings for neo_spiders project
-
-BOT_NAME = "neo_spiders"
-
-SPIDER_MODULES = ["neo_spiders.spiders"]
-NEWSPIDER_MODULE = "neo_spiders.spiders"
-
-# Obey robots.txt rules
-ROBOTSTXT_OBEY = True
-
-# Configure maximum concurrent requests
-CONCURRENT_REQUESTS = 16
-
-# Configure a delay for requests
-DOWNLOAD_DELAY = 0
-
-# User agent
-USER_AGENT = "Neo/1.0 (+https://github.com/user/neo)"
-
-# AutoThrottle extension
-AUTOTHROTTLE_ENABLED = True
-AUTOTHROTTLE_START_DELAY = 1
-AUTOTHROTTLE_MAX_DELAY = 10
+            settings_file.write_text(SETTINGS_TEMPLATE)
+            print("✅ Created settings.py")
 
-# HTTP Cache
-HTTPCACHE_ENABLED = True
-HTTPCACHE_EXPIRATION_SECS = 86400
-HTTPCACHE_DIR = "httpcache"
+        # Módulos do Neo (pipelines etc.) e settings que dependem deles
+        for updated in sync_project_modules(self.project_path):
+            print(f"✅ Updated {updated.relative_to(self.project_path)}")
 
-REQUEST_FINGERPRINTER_IMPLEMENTATION = "2.7"
-TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
-FEED_EXPORT_ENCODING = "utf-8"
-"""
-            settings_file.write_text(settings_content)
-            print("✅ Created settings.py")
+        merge_project_settings(
+            settings_file,
+            neo_project_settings(self.neo_settings.load_scrapy_settings())
+        )
 
         # Verificar __init__.py em spiders
         spiders_init = project_dir / "spiders" / "__init__.py"
@@ -200,10 +340,6 @@ FEED_EXPORT_ENCODING = "utf-8"
     def ensure_scrapy_project(self):
         """Ensure Scrapy project exists"""
 
-        if not self.check_scrapy_installation():
-            print("❌ Scrapy not found in Python path!")
-            return
-
         if not self.project_path.exists():
             print("🕷️  Creating Scrapy project...")
             self.project_path.parent.mkdir(parents=True, exist_ok=True)
@@ -233,16 +369,18 @@ FEED_EXPORT_ENCODING = "utf-8"
         # Header
         self.header = Adw.HeaderBar()
 
-        # New Spider button
-        new_spider_btn = Gtk.Button()
-        new_spider_btn.set_icon_name("list-add-symbolic")
-        new_spider_btn.set_tooltip_text("Create New Spider")
-        new_spider_btn.connect("clicked", self.on_new_spider)
-        self.header.pack_start(new_spider_btn)
+        # New Spider button (habilitado quando o projeto estiver pronto)
+        self.new_spider_btn = Gtk.Button()
+        self.new_spider_btn.set_icon_name("list-add-symbolic")
+        self.new_spider_btn.set_tooltip_text("Create New Spider")
+        self.new_spider_btn.set_sensitive(False)
+        self.new_spider_btn.connect("clicked", self.on_new_spider)
+        self.header.pack_start(self.new_spider_btn)
 
         # Menu
         menu = Gio.Menu()
         menu.append("Settings", "win.settings")
+        menu.append("Diagnostics", "win.diagnostics")
         menu.append("About", "app.about")
 
         menu_button = Gtk.MenuButton()
@@ -255,6 +393,10 @@ FEED_EXPORT_ENCODING = "utf-8"
         settings_action.connect("activate", self.on_settings)
         self.add_action(settings_action)
 
+        diagnostics_action = Gio.SimpleAction.new("diagnostics", None)
+        diagnostics_action.connect("activate", self.on_diagnostics)
+        self.add_action(diagnostics_action)
+
         # View Switcher Title
         self.view_switcher_title = Adw.ViewSwitcherTitle()
         self.header.set_title_widget(self.view_switcher_title)
@@ -286,13 +428,22 @@ FEED_EXPORT_ENCODING = "utf-8"
         # Toast Overlay
         self.toast_overlay = Adw.ToastOverlay()
 
+        # Loading state, shown while startup checks run
+        self.loading_page = Adw.StatusPage()
+        self.loading_page.set_title("Preparing Neo")
+        self.loading_page.set_description("Checking Scrapy and loading spiders...")
+        loading_spinner = Gtk.Spinner()
+        loading_spinner.set_spinning(True)
+        loading_spinner.set_size_request(32, 32)
+        self.loading_page.set_child(loading_spinner)
+
         # Toolbar View
-        toolbar_view = Adw.ToolbarView()
-        toolbar_view.add_top_bar(self.header)
-        toolbar_view.set_content(self.view_stack)
-        toolbar_view.add_bottom_bar(self.view_switcher_bar)
+        self.toolbar_view = Adw.ToolbarView()
+        self.toolbar_view.add_top_bar(self.header)
+        self.toolbar_view.set_content(self.loading_page)
+        self.toolbar_view.add_bottom_bar(self.view_switcher_bar)
 
-        self.toast_overlay.set_child(toolbar_view)
+        self.toast_overlay.set_child(self.toolbar_view)
 
         # Breakpoint
         breakpoint = Adw.Breakpoint.new(
@@ -395,6 +546,39 @@ FEED_EXPORT_ENCODING = "utf-8"
 
         box.append(crawls_group)
 
+        # Live log
+        log_group = Adw.PreferencesGroup()
+        log_group.set_title("Live Log")
+        log_group.set_margin_top(10)
+        log_group.set_margin_start(20)
+        log_group.set_margin_end(20)
+        log_group.set_margin_bottom(20)
+
+        self.log_level_dropdown = Gtk.DropDown.new_from_strings(LOG_LEVELS)
+        self.log_level_dropdown.set_selected(LOG_LEVELS.index('INFO'))
+        self.log_level_dropdown.set_valign(Gtk.Align.CENTER)
+        self.log_level_dropdown.set_tooltip_text("Minimum log level")
+        self.log_level_dropdown.connect("notify::selected", self.on_log_level_changed)
+        log_group.set_header_suffix(self.log_level_dropdown)
+
+        log_scrolled = Gtk.ScrolledWindow()
+        log_scrolled.set_min_content_height(200)
+
+        self.log_view = Gtk.TextView()
+        self.log_view.set_editable(False)
+        self.log_view.set_monospace(True)
+        self.log_view.set_wrap_mode(Gtk.WrapMode.WORD_CHAR)
+        self.log_view.set_top_margin(12)
+        self.log_view.set_bottom_margin(12)
+        self.log_view.set_left_margin(12)
+        self.log_view.set_right_margin(12)
+        self.log_view.get_buffer().set_text("// Crawl output will appear here")
+
+        log_scrolled.set_child(self.log_view)
+        log_group.add(log_scrolled)
+
+        box.append(log_group)
+
         clamp.set_child(box)
         return clamp
 
@@ -414,6 +598,13 @@ FEED_EXPORT_ENCODING = "utf-8"
         filter_row = Adw.ActionRow()
         filter_row.set_title("Results")
 
+        # Cada run tem seu próprio arquivo; só o run escolhido é aberto
+        self.runs_dropdown = Gtk.DropDown.new_from_strings([])
+        self.runs_dropdown.set_valign(Gtk.Align.CENTER)
+        self.runs_dropdown.set_tooltip_text("Crawl run to show")
+        self.runs_dropdown.connect("notify::selected", self.on_results_run_selected)
+        filter_row.add_suffix(self.runs_dropdown)
+
         export_btn = Gtk.Button(label="Export")
         export_btn.set_valign(Gtk.Align.CENTER)
         export_btn.connect("clicked", self.on_export_results)
@@ -430,30 +621,82 @@ FEED_EXPORT_ENCODING = "utf-8"
         results_group.set_margin_end(20)
         results_group.set_margin_bottom(20)
 
+        self.results_stack = Gtk.Stack()
+
+        self.results_status = Adw.StatusPage()
+        self.results_status.set_icon_name("folder-documents-symbolic")
+        self.results_status.set_title("No Results Yet")
+        self.results_status.set_description("Start a crawl to see items here")
+        self.results_stack.add_named(self.results_status, "status")
+
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_vexpand(True)
         scrolled.set_min_content_height(400)
 
-        self.results_view = Gtk.TextView()
-        self.results_view.set_editable(False)
-        self.results_view.set_monospace(True)
-        self.results_view.set_wrap_mode(Gtk.WrapMode.WORD)
-        self.results_view.set_top_margin(12)
-        self.results_view.set_bottom_margin(12)
-        self.results_view.set_left_margin(12)
-        self.results_view.set_right_margin(12)
-
-        buffer = self.results_view.get_buffer()
-        buffer.set_text('// No results yet\n// Start a crawl to see items here')
+        # Linhas são criadas apenas quando visíveis
+        self.results_selection = Gtk.NoSelection()
+        self.results_view = Gtk.ColumnView(model=self.results_selection)
+        self.results_view.set_show_row_separators(True)
+        self.results_view.set_show_column_separators(True)
+        self.results_view.add_css_class("data-table")
 
         scrolled.set_child(self.results_view)
-        results_group.add(scrolled)
+        self.results_stack.add_named(scrolled, "items")
+
+        results_group.add(self.results_stack)
 
         box.append(results_group)
 
         clamp.set_child(box)
         return clamp
 
+    def _show_results_status(self, title, description):
+        """Show a message instead of the results grid"""
+        self.results_status.set_title(title)
+        self.results_status.set_description(description)
+        self.results_stack.set_visible_child_name("status")
+
+    def _set_results_columns(self, fields):
+        """Rebuild the results grid columns"""
+        columns = self.results_view.get_columns()
+        while columns.get_n_items():
+            self.results_view.remove_column(columns.get_item(0))
+
+        for field in fields:
+            factory = Gtk.SignalListItemFactory()
+            factory.connect("setup", self._on_result_cell_setup)
+            factory.connect("bind", self._on_result_cell_bind, field)
+
+            column = Gtk.ColumnViewColumn(title=field, factory=factory)
+            column.set_resizable(True)
+            column.set_expand(True)
+            self.results_view.append_column(column)
+
+        self.results_fields = list(fields)
+
+    def _on_result_cell_setup(self, factory, list_item):
+        """Create a results cell widget"""
+        label = Gtk.Inscription()
+        label.set_xalign(0)
+        label.set_text_overflow(Gtk.InscriptionOverflow.ELLIPSIZE_END)
+        list_item.set_child(label)
+
+    def _on_result_cell_bind(self, factory, list_item, field):
+        """Fill a results cell with a field value"""
+        row = list_item.get_item()
+        list_item.get_child().set_text(row.get_text(field))
+
+    def _spider_fields(self, name):
+        """Return configured field names of a spider"""
+        config = self.neo_settings.get_spider_config(name)
+        if config is None:
+            return []
+
+        fields = [field['name'] for field in config.get('fields', [])]
+        if config.get('delta'):
+            fields.append('_delta')
+        return fields
+
     def on_new_spider(self, button):
         """Create new spider"""
         dialog = SpiderDialog(callback=self.on_spider_created)
@@ -493,99 +736,125 @@ FEED_EXPORT_ENCODING = "utf-8"
         class_words = safe_name.split('_')
         spider_config['class_name'] = ''.join(word.capitalize() for word in class_words) + 'Spider'
 
-        spider_code = self._generate_spider_code(spider_config)
-
-        # Save spider
-        spiders_dir = self.project_path / "neo_spiders" / "spiders"
-        spiders_dir.mkdir(parents=True, exist_ok=True)
-
-        spider_file = spiders_dir / f"{safe_name}.py"
-
         # Verificar se já existe
-        if spider_file.exists():
+        if safe_name in self.spider_rows or self.neo_settings.get_spider_config(safe_name):
             self.show_toast(f"Spider '{safe_name}' already exists")
-            print(f"⚠️  Spider file already exists: {spider_file}")
+            print(f"⚠️  Spider already exists: {safe_name}")
             return
 
-        spider_file.write_text(spider_code)
+        # Config é lida pelo spider genérico na hora do crawl
+        self.neo_settings.save_spider_config(spider_config)
 
         print(f"✅ Spider created: {safe_name}")
-        print(f"   File: {spider_file}")
         self.show_toast(f"Spider '{safe_name}' created successfully")
 
-        # Save config
-        self.neo_settings.save_spider_config(spider_config)
+        self._add_spider_row(self._config_spider(spider_config))
 
-        self._load_spiders()
+    def _scan_spiders(self):
+        """List configured spiders plus older one-module-per-spider ones"""
+        spiders = [self._config_spider(config) for config in self.neo_settings.load_spiders_config()]
+        names = {spider['name'] for spider in spiders}
 
-    def _generate_spider_code(self, config):
-        """Generate Scrapy spider Python code"""
-        code = f'''import scrapy
+        # Módulos gerados por versões antigas sem config correspondente
+        self.spider_index.refresh()
+        spiders += [spider for spider in self.spider_index.spiders() if spider['name'] not in names]
 
-class {config['class_name']}(scrapy.Spider):
-    name = "{config['name']}"
-    allowed_domains = {config['allowed_domains']}
-    start_urls = {config['start_urls']}
+        return sorted(spiders, key=lambda spider: spider['name'])
 
-    custom_settings = {{
-        'FEED_FORMAT': 'jsonlines',
-        'FEED_URI': 'results_{config['name']}.jsonl',
-    }}
+    def _config_spider(self, config):
+        return {
+            'name': config['name'],
+            'file': None,
+            'class': config.get('class_name', 'NeoSpider'),
+        }
 
-    def parse(self, response):
-        """Extract data using CSS selectors"""
-        items = response.css('{config['item_selector']}')
+    def _update_spiders_list(self):
+        """Update UI with spiders"""
+        while child := self.spiders_listbox.get_first_child():
+            self.spiders_listbox.remove(child)
+        self.spider_rows = {}
 
-        for item in items:
-            yield {{
-'''
+        for spider in self.spiders:
+            row = self._create_spider_row(spider)
+            self.spiders_listbox.append(row)
+            self.spider_rows[spider['name']] = row
 
-        for field in config['fields']:
-            code += f"                '{field['name']}': item.css('{field['selector']}').get(),\n"
+        self._update_spiders_status()
 
-        code += '''            }
-'''
+    def _update_spiders_status(self):
+        count = len(self.spiders)
+        self.spiders_status.set_subtitle(f"{count} spider(s) ready")
 
-        return code
+    def _watch_spiders_dir(self):
+        """Follow changes to the spider modules without rescanning them all"""
+        if self.spiders_monitor is not None:
+            return
 
-    def _load_spiders(self):
-        """Load spiders list from Scrapy project"""
         spiders_dir = self.project_path / "neo_spiders" / "spiders"
+        spiders_dir.mkdir(parents=True, exist_ok=True)
 
-        if not spiders_dir.exists():
+        try:
+            self.spiders_monitor = Gio.File.new_for_path(str(spiders_dir)).monitor_directory(
+                Gio.FileMonitorFlags.WATCH_MOVES, None
+            )
+        except GLib.Error as e:
+            print(f"⚠️  Could not watch spiders directory: {e.message}")
             return
 
-        self.spiders = []
+        self.spiders_monitor.connect("changed", self._on_spiders_dir_changed)
+
+    def _on_spiders_dir_changed(self, monitor, file, other_file, event_type):
+        """Update the rows of spider files that were edited, added or removed"""
+        if event_type in (
+            Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+            Gio.FileMonitorEvent.CREATED,
+            Gio.FileMonitorEvent.DELETED,
+            Gio.FileMonitorEvent.MOVED_IN,
+            Gio.FileMonitorEvent.MOVED_OUT,
+        ):
+            paths = [file.get_path()]
+        elif event_type == Gio.FileMonitorEvent.RENAMED:
+            paths = [file.get_path(), other_file.get_path()]
+        else:
+            return
 
-        for spider_file in spiders_dir.glob("*.py"):
-            if spider_file.name == "__init__.py":
-                continue
+        for path in paths:
+            if path.endswith('.py') and not path.endswith('__init__.py'):
+                self._on_spider_file_changed(path)
 
-            content = spider_file.read_text()
+    def _on_spider_file_changed(self, path):
+        """Re-index one spider file and replace only its row"""
+        path = str(path)
+        if not self.spider_index.update_file(path):
+            return
 
-            import re
-            match = re.search(r'name\s*=\s*["\'](.+?)["\']', content)
-            if match:
-                spider_name = match.group(1)
-                self.spiders.append({
-                    'name': spider_name,
-                    'file': str(spider_file),
-                    'class': spider_file.stem
-                })
+        for spider in self.spiders:
+            if spider['file'] == path:
+                self._remove_spider_row(spider['name'])
+                break
 
-        self._update_spiders_list()
+        spider = self.spider_index.get(path)
+        if spider is not None and spider['name'] not in self.spider_rows:
+            self._add_spider_row(spider)
 
-    def _update_spiders_list(self):
-        """Update UI with spiders"""
-        while child := self.spiders_listbox.get_first_child():
-            self.spiders_listbox.remove(child)
+    def _add_spider_row(self, spider):
+        # Manter a lista ordenada por nome
+        position = sum(1 for other in self.spiders if other['name'] < spider['name'])
+        self.spiders.insert(position, spider)
 
-        for spider in self.spiders:
-            row = self._create_spider_row(spider)
-            self.spiders_listbox.append(row)
+        row = self._create_spider_row(spider)
+        self.spiders_listbox.insert(row, position)
+        self.spider_rows[spider['name']] = row
 
-        count = len(self.spiders)
-        self.spiders_status.set_subtitle(f"{count} spider(s) ready")
+        self._update_spiders_status()
+
+    def _remove_spider_row(self, name):
+        row = self.spider_rows.pop(name, None)
+        if row is not None:
+            self.spiders_listbox.remove(row)
+        self.spiders = [spider for spider in self.spiders if spider['name'] != name]
+
+        self._update_spiders_status()
 
     def _create_spider_row(self, spider):
         """Create spider row"""
@@ -601,217 +870,664 @@ class {config['class_name']}(scrapy.Spider):
         start_btn.set_tooltip_text("Start crawl")
         start_btn.add_css_class("suggested-action")
         start_btn.add_css_class("circular")
-        start_btn.connect("clicked", self.on_start_crawl, spider)
+
+        # Perfil de desempenho só para o próximo crawl
+        profile_dropdown = Gtk.DropDown.new_from_strings(["Default"] + PROFILE_LABELS)
+        profile_dropdown.set_valign(Gtk.Align.CENTER)
+        profile_dropdown.set_tooltip_text("Performance profile for this crawl")
+        row.add_suffix(profile_dropdown)
+
+        start_btn.connect("clicked", self.on_start_crawl, spider, profile_dropdown)
+
+        # Tuner só para spiders com config (spider genérico)
+        if spider['file'] is None:
+            tune_btn = Gtk.Button()
+            tune_btn.set_icon_name("emblem-system-symbolic")
+            tune_btn.set_valign(Gtk.Align.CENTER)
+            tune_btn.set_tooltip_text("Tune concurrency")
+            tune_btn.add_css_class("flat")
+            tune_btn.add_css_class("circular")
+            tune_btn.connect("clicked", self.on_tune_spider, spider)
+            row.add_suffix(tune_btn)
+
+            replay_btn = Gtk.Button()
+            replay_btn.set_icon_name("media-seek-backward-symbolic")
+            replay_btn.set_valign(Gtk.Align.CENTER)
+            replay_btn.set_tooltip_text("Edit selectors and replay from cache")
+            replay_btn.add_css_class("flat")
+            replay_btn.add_css_class("circular")
+            replay_btn.connect("clicked", self.on_replay_spider, spider)
+            row.add_suffix(replay_btn)
+
         row.add_suffix(start_btn)
 
         return row
 
-    def on_start_crawl(self, button, spider):
-        """Start spider crawl"""
-        print(f"🕷️  Starting crawl: {spider['name']}")
-        self.show_toast(f"Starting {spider['name']}...")
+    def on_tune_spider(self, button, spider):
+        """Probe a spider at increasing concurrency and offer the best settings"""
+        name = spider['name']
+        run_id = f"tune-{datetime.now():%Y%m%d-%H%M%S}"
+        spider_name, spider_args, crawl_settings = self._spider_launch(name, run_id)
 
-        def run_spider():
-            try:
-                # Diretório de trabalho deve ser o PAI do neo_spiders
-                work_dir = str(self.project_path)
+        tuner = ConcurrencyTuner(
+            self.project_path, spider_name, spider_args, crawl_settings, self._crawl_command
+        )
+        dialog = TuneDialog(
+            tuner, name,
+            callback=lambda settings, scope: self._on_tune_applied(name, settings, scope)
+        )
+        dialog.present(self)
+
+    def on_replay_spider(self, button, spider):
+        """Iterate on a spider's selectors against its cached responses"""
+        name = spider['name']
+        config = self.neo_settings.get_spider_config(name)
+        if config is None:
+            return
+
+        run_id = f"replay-{datetime.now():%Y%m%d-%H%M%S}"
+        spider_name, spider_args, crawl_settings = self._spider_launch(name, run_id)
+
+        runner = ReplayRunner(
+            self.project_path, spider_name, spider_args, crawl_settings, self._crawl_command
+        )
+        dialog = ReplayDialog(
+            runner, config, last_run_counts(self.project_path / "stats" / name),
+            save_callback=lambda changes: self.neo_settings.update_spider_config(name, changes)
+        )
+        dialog.present(self)
+
+    def _on_tune_applied(self, name, settings, scope):
+        """Save tuned settings for one spider or for all of them"""
+        if scope == 'spider':
+            config = self.neo_settings.get_spider_config(name) or {}
+            self.neo_settings.update_spider_config(name, {'settings': {**config.get('settings', {}), **settings}})
+            self.show_toast(f"Tuned settings saved for {name}")
+        else:
+            scrapy_settings = self.neo_settings.load_scrapy_settings()
+            scrapy_settings.update(settings)
+            self.neo_settings.save_scrapy_settings(scrapy_settings)
+            merge_project_settings(self.project_path / "neo_spiders" / "settings.py", settings)
+            self._reload_project_settings(scrapy_settings)
+            self.show_toast("Tuned settings saved for all spiders")
+
+        print(f"🎛️  Applied {settings} ({scope})")
+
+    def on_start_crawl(self, button, spider, profile_dropdown=None):
+        """Queue a spider crawl"""
+        profile = None
+        if profile_dropdown is not None and profile_dropdown.get_selected() > 0:
+            profile = PROFILES[profile_dropdown.get_selected() - 1]
+
+        job = self.scheduler.submit(spider['name'], profile=profile)
+
+        print(f"🕷️  Queued crawl: {spider['name']} (job {job['id']})")
+        self._add_crawl_to_ui(job)
+
+        if job['id'] in self.scheduler.running:
+            self.show_toast(f"Starting {spider['name']}...")
+        else:
+            self.show_toast(f"{spider['name']} queued")
+
+    def _launch_job(self, job):
+        """Start a job handed out by the scheduler"""
+        thread = threading.Thread(target=self._run_job, args=(job,), daemon=True)
+        thread.start()
 
-                print(f"📂 Working directory: {work_dir}")
-                print(f"🕷️  Spider name: {spider['name']}")
+    def _run_job(self, job):
+        """Run a crawl job and follow its output"""
+        name = job['spider']
+        run_id = f"{datetime.now():%Y%m%d-%H%M%S}-{job['id']}"
+        job['run_id'] = run_id
 
-                # Usar python -m scrapy
+        try:
+            # Diretório de trabalho deve ser o PAI do neo_spiders
+            work_dir = str(self.project_path)
+
+            print(f"📂 Working directory: {work_dir}")
+            print(f"🕷️  Spider name: {name}")
+            print(f"🏷️  Run ID: {run_id}")
+
+            log_path = self.project_path / "logs" / name / f"{run_id}.log"
+            crawl_log = CrawlLog(log_path)
+
+            # Estatísticas ao vivo enviadas pela extensão do projeto
+            stats_path = Path(GLib.get_user_runtime_dir()) / "neo" / f"stats-{run_id}.sock"
+            stats_receiver = StatsReceiver(stats_path)
+
+            spider_name, spider_args, crawl_settings = self._spider_launch(name, run_id)
+            crawl_settings['NEO_STATS_SOCKET'] = str(stats_path)
+
+            # Estatísticas finais servem de base para comparar replays
+            stats_dir = self.project_path / "stats" / name
+            stats_dir.mkdir(parents=True, exist_ok=True)
+            crawl_settings['NEO_STATS_DUMP'] = str(stats_dir / f"{run_id}.json")
+            if job.get('profile'):
+                # Perfil escolhido para este crawl vale sobre os demais
+                crawl_settings.update(profile_settings(job['profile']))
+            job_dir = crawl_settings.get('JOBDIR')
+
+            mode = self.neo_settings.load_scrapy_settings()['NEO_CRAWL_MODE']
+            if mode == 'engine':
+                # Crawl roda no engine compartilhado, já aquecido
+                process = self.crawl_engine.submit(job['id'], spider_name, crawl_settings, spider_args)
+            elif mode == 'pool':
+                # Worker ocioso já importou o Scrapy e carregou o projeto
+                process = self.worker_pool.run(spider_name, crawl_settings, spider_args)
+            else:
+                # Usar python -m scrapy; log do Scrapy vai para stderr
                 process = subprocess.Popen(
-                    [sys.executable, '-m', 'scrapy', 'crawl', spider['name']],
+                    self._crawl_command(spider_name, crawl_settings, spider_args),
                     cwd=work_dir,
                     stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1
                 )
 
-                self.active_crawls[spider['name']] = process
-
-                GLib.idle_add(self._add_crawl_to_ui, spider)
-
-                stdout, stderr = process.communicate()
-
-                print(f"✅ Crawl finished: {spider['name']}")
-                if stdout:
-                    print("Output:", stdout[:1000])
-                if stderr and 'Traceback' not in stderr:
-                    # Só mostrar stderr se não for erro
-                    print("Scrapy log:", stderr[:500])
-                elif 'Traceback' in stderr:
-                    print("❌ Error:", stderr[:1000])
-
-                if spider['name'] in self.active_crawls:
-                    del self.active_crawls[spider['name']]
-
-                GLib.idle_add(self._remove_crawl_from_ui, spider)
-                GLib.idle_add(self._load_results, spider)
-                GLib.idle_add(self.show_toast, f"Crawl '{spider['name']}' finished")
-
-            except FileNotFoundError as e:
-                print(f"❌ Command not found: {e}")
-                GLib.idle_add(self.show_toast, "Python or Scrapy not found")
-            except Exception as e:
-                print(f"❌ Error running spider: {e}")
-                GLib.idle_add(self.show_toast, f"Error: {e}")
-
-        thread = threading.Thread(target=run_spider, daemon=True)
-        thread.start()
+            self.active_crawls[job['id']] = process
+            self.crawl_stats[job['id']] = stats_receiver.stats
+
+            GLib.idle_add(self._mark_crawl_running, job)
+            GLib.idle_add(self._start_results_tail, {'name': name}, run_id)
+            GLib.idle_add(self._show_crawl_log, crawl_log)
+
+            # Ler linha a linha, mantendo só as últimas em memória
+            for line in process.stdout:
+                crawl_log.append(line.rstrip('\n'))
+            returncode = process.wait()
+            crawl_log.close()
+            stats_receiver.close()
+            if job_dir is not None:
+                shutil.rmtree(job_dir, ignore_errors=True)
+
+            if returncode != 0 and not job.get('stopped'):
+                # Ex.: reactor errado, spider inexistente, config inválida
+                print(f"❌ Crawl failed: {name} (job {job['id']}, exit code {returncode})")
+                print(f"📄 Log: {log_path}")
+                GLib.idle_add(self._finish_results_tail, run_id)
+                GLib.idle_add(self.show_toast, f"Crawl '{name}' failed, see the log", 5)
+                return
+
+            print(f"✅ Crawl finished: {name} (job {job['id']})")
+            if crawl_log.errors:
+                print(f"❌ {crawl_log.errors} error(s) logged")
+            print(f"📄 Log: {log_path}")
+
+            GLib.idle_add(self._finish_results_tail, run_id)
+            details = [
+                summary for summary in (stats_receiver.stats.delta_summary(),
+                                        stats_receiver.stats.revalidation_summary())
+                if summary
+            ]
+            if details:
+                print(f"📊 {'; '.join(details)}")
+                GLib.idle_add(self.show_toast, f"Crawl '{name}' finished: {'; '.join(details)}", 5)
+            else:
+                GLib.idle_add(self.show_toast, f"Crawl '{name}' finished")
+
+            self._apply_retention()
+
+        except FileNotFoundError as e:
+            print(f"❌ Command not found: {e}")
+            GLib.idle_add(self.show_toast, "Python or Scrapy not found")
+        except Exception as e:
+            print(f"❌ Error running spider: {e}")
+            GLib.idle_add(self.show_toast, f"Error: {e}")
+        finally:
+            self.active_crawls.pop(job['id'], None)
+            self.crawl_stats.pop(job['id'], None)
+            GLib.idle_add(self._remove_crawl_from_ui, job)
+            self.scheduler.job_finished(job['id'])
+
+    def _spider_launch(self, name, run_id):
+        """Return the spider, arguments and settings that run a Neo spider"""
+        crawl_settings = {'NEO_RUN_ID': run_id}
+
+        # Cada run grava seu próprio arquivo de resultados
+        compression = self._feed_compression()
+        feed = self._run_feed(name, run_id, compression)
+        crawl_settings['FEEDS'] = {str(feed.relative_to(self.project_path)): feed_options(compression)}
+
+        config = self.neo_settings.get_spider_config(name)
+        if config is None:
+            # Módulo antigo; só esses módulos são importados, e o
+            # FEED_URI gerado por eles deixaria de acumular runs
+            crawl_settings['SPIDER_MODULES'] = 'neo_spiders.spiders'
+            crawl_settings['FEED_URI'] = ''
+            return name, {}, crawl_settings
+
+        # Valores ajustados para o spider (ex.: pelo tuner) valem só para ele
+        crawl_settings.update(config.get('settings') or {})
+
+        # Spider genérico lê a config do banco na hora do crawl
+        crawl_settings['NEO_CONFIG_DB'] = str(self.neo_settings.spiders_db)
+
+        if config.get('dedup'):
+            # Listas vão como texto separado por vírgulas
+            crawl_settings['NEO_DEDUP'] = True
+            crawl_settings['NEO_DEDUP_KEYS'] = ','.join(config['dedup'].get('keys', []))
+
+        if config.get('delta'):
+            crawl_settings['NEO_DELTA'] = True
+            crawl_settings['NEO_DELTA_KEYS'] = ','.join(config['delta']['keys'])
+
+        if config.get('follow_links'):
+            # Fila e filtro de duplicados ficam no disco
+            job_dir = self.project_path / "jobs" / run_id
+            crawl_settings.update(frontier_settings(config['follow_links'], job_dir))
+
+        return 'neo', {'config': name}, crawl_settings
+
+    def _run_feed(self, name, run_id, compression='none'):
+        """Return the results file of one run"""
+        return self.project_path / "results" / name / f"{run_id}{FEED_SUFFIXES[compression]}"
+
+    def _feed_compression(self):
+        """Return the compression new run feeds are written with"""
+        compression = self.neo_settings.load_scrapy_settings()['NEO_FEED_COMPRESSION']
+        if compression not in FEED_SUFFIXES:
+            return 'none'
+        if compression == 'zstd' and not zstd_available():
+            print("⚠️  zstandard not installed, writing uncompressed results")
+            return 'none'
+        return compression
+
+    def _apply_retention(self):
+        """Compact and delete old runs; skipped if a pass is already running"""
+        if not self.retention_lock.acquire(blocking=False):
+            return
 
-    def _add_crawl_to_ui(self, spider):
-        """Add active crawl to UI"""
+        try:
+            settings = self.neo_settings.load_scrapy_settings()
+            active = [job.get('run_id') for job in list(self.scheduler.running.values())]
+            summary = apply_retention(
+                self.project_path, settings['NEO_KEEP_RUNS'], settings['NEO_RESULTS_MAX_GB'] * GB, active
+            )
+        except Exception as e:
+            print(f"⚠️  Results retention failed: {e}")
+            return
+        finally:
+            self.retention_lock.release()
+
+        if summary['compacted'] or summary['deleted']:
+            print(f"🧹 Results: compacted {summary['compacted']} run(s), deleted {summary['deleted']} "
+                  f"run(s), freed {format_bytes(summary['freed'])}")
+            GLib.idle_add(self._refresh_results_runs)
+
+    def _crawl_command(self, name, crawl_settings, spider_args=None):
+        """Build the scrapy crawl command line for a spider"""
+        command = [sys.executable, '-m', 'scrapy', 'crawl', name]
+        for key, value in (spider_args or {}).items():
+            command += ['-a', f'{key}={value}']
+        for key, value in crawl_settings.items():
+            # Dicts (FEEDS etc.) são aceitos como JSON pelo Scrapy
+            if isinstance(value, dict):
+                value = json.dumps(value)
+            command += ['-s', f'{key}={value}']
+        return command
+
+    def _add_crawl_to_ui(self, job):
+        """Add a queued crawl to the UI"""
         row = Adw.ActionRow()
-        row.set_title(spider['name'])
-        row.set_subtitle("Crawling...")
+        row.set_title(job['spider'])
+        if job.get('profile'):
+            row.set_title(f"{job['spider']} ({PROFILE_LABELS[PROFILES.index(job['profile'])]})")
+        row.set_subtitle(f"Queued · job {job['id']}")
 
         spinner = Gtk.Spinner()
-        spinner.set_spinning(True)
         spinner.set_valign(Gtk.Align.CENTER)
+        spinner.set_visible(False)
         row.add_suffix(spinner)
 
         stop_btn = Gtk.Button()
         stop_btn.set_icon_name("media-playback-stop-symbolic")
         stop_btn.set_valign(Gtk.Align.CENTER)
+        stop_btn.set_tooltip_text("Cancel crawl")
         stop_btn.add_css_class("destructive-action")
         stop_btn.add_css_class("circular")
-        stop_btn.connect("clicked", self.on_stop_crawl, spider)
+        stop_btn.connect("clicked", self.on_stop_crawl, job)
         row.add_suffix(stop_btn)
 
-        row.set_name(f"crawl_{spider['name']}")
         self.crawls_listbox.append(row)
+        self.crawl_rows[job['id']] = {'row': row, 'spinner': spinner}
 
         self.view_stack.set_visible_child_name("crawls")
 
-    def _remove_crawl_from_ui(self, spider):
+    def _mark_crawl_running(self, job):
+        """Switch a crawl row from queued to running"""
+        widgets = self.crawl_rows.get(job['id'])
+        if widgets is None:
+            return
+
+        widgets['row'].set_subtitle("Crawling...")
+        widgets['spinner'].set_visible(True)
+        widgets['spinner'].set_spinning(True)
+
+        if not self.stats_timer:
+            self.stats_timer = GLib.timeout_add(STATS_REFRESH_INTERVAL, self._refresh_crawl_stats)
+
+    def _refresh_crawl_stats(self):
+        """Show live throughput on each active crawl row"""
+        if not self.crawl_stats:
+            self.stats_timer = None
+            return GLib.SOURCE_REMOVE
+
+        for job_id, stats in list(self.crawl_stats.items()):
+            widgets = self.crawl_rows.get(job_id)
+            if widgets is not None and stats.samples:
+                widgets['row'].set_subtitle(stats.summary())
+
+        return GLib.SOURCE_CONTINUE
+
+    def _remove_crawl_from_ui(self, job):
         """Remove crawl from UI"""
-        child = self.crawls_listbox.get_first_child()
-        while child:
-            if child.get_name() == f"crawl_{spider['name']}":
-                self.crawls_listbox.remove(child)
-                break
-            child = child.get_next_sibling()
+        widgets = self.crawl_rows.pop(job['id'], None)
+        if widgets is not None:
+            self.crawls_listbox.remove(widgets['row'])
+
+    def _show_crawl_log(self, crawl_log):
+        """Follow a crawl's log in the live log panel"""
+        self.log_shown = crawl_log
+        self.log_shown_total = -1
+        self._refresh_log_view()
+
+        if not self.log_timer:
+            self.log_timer = GLib.timeout_add(LOG_REFRESH_INTERVAL, self._refresh_log_view)
+
+    def on_log_level_changed(self, dropdown, param):
+        """Re-filter the live log"""
+        self.log_shown_total = -1
+        self._refresh_log_view()
+
+    def _refresh_log_view(self):
+        """Render the buffered lines of the followed crawl"""
+        crawl_log = self.log_shown
+        if crawl_log is None:
+            self.log_timer = None
+            return GLib.SOURCE_REMOVE
+
+        if crawl_log.total != self.log_shown_total:
+            self.log_shown_total = crawl_log.total
+            min_level = LOG_LEVELS[self.log_level_dropdown.get_selected()]
+
+            buffer = self.log_view.get_buffer()
+            buffer.set_text("\n".join(crawl_log.snapshot(min_level)))
+            buffer.place_cursor(buffer.get_end_iter())
+            self.log_view.scroll_to_mark(buffer.get_insert(), 0, False, 0, 0)
+
+        # Crawl terminou: parar de atualizar após a última renderização
+        if crawl_log.closed:
+            self.log_timer = None
+            return GLib.SOURCE_REMOVE
+
+        return GLib.SOURCE_CONTINUE
+
+    def on_stop_crawl(self, button, job):
+        """Stop a running crawl or drop it from the queue"""
+        if self.scheduler.cancel(job['id']):
+            self._remove_crawl_from_ui(job)
+            print(f"🗑️  Unqueued: {job['spider']} (job {job['id']})")
+            self.show_toast(f"Removed {job['spider']} from queue")
+            return
 
-    def on_stop_crawl(self, button, spider):
-        """Stop active crawl"""
-        if spider['name'] in self.active_crawls:
-            process = self.active_crawls[spider['name']]
+        process = self.active_crawls.get(job['id'])
+        if process is not None:
+            job['stopped'] = True
             process.terminate()
-            print(f"🛑 Stopped: {spider['name']}")
-            self.show_toast(f"Stopped {spider['name']}")
+            print(f"🛑 Stopped: {job['spider']} (job {job['id']})")
+            self.show_toast(f"Stopped {job['spider']}")
+
+    def _results_source(self, name, run_id, stored):
+        """Return the source holding the items of one run"""
+        if stored:
+            return StoreSource(self.project_path / "results" / f"{name}.db", run_id)
+
+        # Run ao vivo pode ainda não ter criado o arquivo
+        feed = run_feeds(self.project_path / "results" / name).get(run_id)
+        if feed is None:
+            feed = self._run_feed(name, run_id, self._feed_compression())
+        return open_feed_source(feed)
+
+    def _start_results_tail(self, spider, run_id, finished=False, stored=None):
+        """Start following the results of a crawl run"""
+        self._stop_results_tail()
+
+        if stored is None:
+            stored = self.neo_settings.load_scrapy_settings()['NEO_RESULTS_STORE']
+        source = self._results_source(spider['name'], run_id, stored)
+        print(f"📂 Following results: {source.path}")
+
+        if self.results_model is not None:
+            self.results_model.close()
+
+        self.results_model = ResultsModel(source)
+        self.results_selection.set_model(self.results_model)
+        self.results_spider = spider['name']
+        self.results_run_id = run_id
+        self.results_finished = finished
+        self._set_results_columns(self._spider_fields(spider['name']))
+        self._refresh_results_runs()
+
+        self._show_results_status(
+            "Waiting for Items", f"Items from {spider['name']} will appear here"
+        )
 
-    def _load_results(self, spider):
-        """Load spider results"""
-        # Arquivo fica no diretório do projeto
-        results_file = self.project_path / f"results_{spider['name']}.jsonl"
+        self.results_timer = GLib.timeout_add(
+            RESULTS_POLL_INTERVAL, self._poll_results
+        )
 
-        print(f"📂 Looking for results: {results_file}")
+    def _refresh_results_runs(self):
+        """List the stored runs in the results run selector"""
+        runs = list_feed_runs(self.project_path / "results")
+
+        # Itens no banco de resultados, por spider
+        stored = {}
+        for run in runs:
+            if run['spider'] not in stored:
+                db_path = self.project_path / "results" / f"{run['spider']}.db"
+                stored[run['spider']] = {info['run_id']: info for info in list_runs(db_path)}
+            run['stored'] = stored[run['spider']].get(run['run_id'])
+
+        # Run acompanhado agora pode ainda não ter arquivo
+        current = (self.results_spider, self.results_run_id)
+        if self.results_run_id and current not in {(run['spider'], run['run_id']) for run in runs}:
+            runs.insert(0, {'spider': self.results_spider, 'run_id': self.results_run_id, 'stored': None})
+
+        self.results_runs = runs
+
+        self._selecting_run = True
+        self.runs_dropdown.set_model(Gtk.StringList.new([self._run_label(run) for run in runs]))
+        for position, run in enumerate(runs):
+            if (run['spider'], run['run_id']) == current:
+                self.runs_dropdown.set_selected(position)
+                break
+        else:
+            self.runs_dropdown.set_selected(Gtk.INVALID_LIST_POSITION)
+        self._selecting_run = False
 
-        if not results_file.exists():
-            print(f"⚠️  No results file found")
-            self.show_toast("No results found - check if spider ran correctly")
+    def _run_label(self, run):
+        try:
+            started = datetime.strptime(run['run_id'][:15], "%Y%m%d-%H%M%S")
+            label = f"{run['spider']} · {started:%Y-%m-%d %H:%M:%S}"
+        except ValueError:
+            label = f"{run['spider']} · {run['run_id']}"
+
+        if run['stored']:
+            label += f" · {run['stored']['item_count']} items"
+        return label
+
+    def on_results_run_selected(self, dropdown, pspec):
+        """Open the items of the chosen run"""
+        position = dropdown.get_selected()
+        if self._selecting_run or position >= len(self.results_runs):
+            return
+
+        run = self.results_runs[position]
+        if (run['spider'], run['run_id']) == (self.results_spider, self.results_run_id):
+            return
 
-            # Mostrar mensagem no view
-            buffer = self.results_view.get_buffer()
-            buffer.set_text("// No results file found\n// Spider may have failed or found no items")
+        live = run['run_id'] in {job.get('run_id') for job in list(self.scheduler.running.values())}
+        stored = run['stored'] is not None or (live and self.neo_settings.load_scrapy_settings()['NEO_RESULTS_STORE'])
+        self._start_results_tail({'name': run['spider']}, run['run_id'], finished=not live, stored=stored)
+
+    def _stop_results_tail(self):
+        """Stop polling the current results feed"""
+        if self.results_timer:
+            GLib.source_remove(self.results_timer)
+            self.results_timer = None
+
+    def _poll_results(self):
+        """Index a batch of newly written items"""
+        count = self._read_results_batch()
+
+        # Ainda há linhas pendentes: continuar lendo sem esperar o timer
+        if count == RESULTS_BATCH_SIZE:
+            GLib.idle_add(self._drain_results)
+            return GLib.SOURCE_CONTINUE
+
+        if self.results_finished:
+            self.results_timer = None
+            self._report_results()
+            return GLib.SOURCE_REMOVE
+
+        return GLib.SOURCE_CONTINUE
+
+    def _drain_results(self):
+        """Read pending lines in batches between main loop iterations"""
+        if self.results_model is None:
+            return GLib.SOURCE_REMOVE
+
+        return self._read_results_batch() == RESULTS_BATCH_SIZE
+
+    def _read_results_batch(self):
+        """Add newly written lines to the results model"""
+        had_items = self.results_model.get_n_items() > 0
+        count = self.results_model.poll(RESULTS_BATCH_SIZE)
+
+        if count and not had_items:
+            # Sem campos configurados: usar as chaves do primeiro item
+            if not self.results_fields:
+                item = self.results_model.first_item() or {}
+                self._set_results_columns(item.keys())
+
+            self.results_stack.set_visible_child_name("items")
             self.view_stack.set_visible_child_name("results")
+
+        return count
+
+    def _finish_results_tail(self, run_id):
+        """Read the remaining items once the crawl has finished"""
+        self._refresh_results_runs()
+        if run_id != self.results_run_id:
             return
 
-        items = []
-        try:
-            with open(results_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    try:
-                        items.append(json.loads(line))
-                    except Exception as e:
-                        print(f"⚠️  Failed to parse line: {e}")
-        except Exception as e:
-            print(f"❌ Error reading results: {e}")
-            self.show_toast(f"Error reading results: {e}")
+        self.results_finished = True
+
+        # Timer já parado: fazer a leitura final agora
+        if not self.results_timer:
+            self.results_timer = GLib.idle_add(self._poll_results)
+
+    def _report_results(self):
+        """Report the outcome of the followed crawl"""
+        name = self.results_spider
+        count = self.results_model.get_n_items()
+
+        if not self.results_model.source.exists():
+            print(f"⚠️  No results file found")
+            self.show_toast("No results found - check if spider ran correctly")
+
+            self._show_results_status(
+                "No Results File", "Spider may have failed or found no items"
+            )
+            self.view_stack.set_visible_child_name("results")
             return
 
-        if not items:
+        if not count:
             print("⚠️  No items extracted")
             self.show_toast("No items were extracted - check selectors")
 
-            # Mostrar mensagem vazia no view
-            buffer = self.results_view.get_buffer()
-            buffer.set_text("// No items extracted\n// Check if CSS selectors are correct")
+            self._show_results_status(
+                "No Items Extracted", "Check if CSS selectors are correct"
+            )
             self.view_stack.set_visible_child_name("results")
             return
 
-        buffer = self.results_view.get_buffer()
-        results_text = json.dumps(items, indent=2, ensure_ascii=False)
-        buffer.set_text(results_text)
-
-        print(f"📦 Loaded {len(items)} items from {spider['name']}")
-        self.show_toast(f"Loaded {len(items)} items")
-
-        self.view_stack.set_visible_child_name("results")
+        print(f"📦 Loaded {count} items from {name}")
+        self.show_toast(f"Loaded {count} items")
 
     def on_settings(self, action, param):
         """Open Scrapy settings dialog"""
-        dialog = ScrapySettingsDialog()
+        dialog = ScrapySettingsDialog(callback=self.on_settings_saved)
         dialog.present()
 
+    def on_settings_saved(self, settings):
+        """Apply settings that affect the running application"""
+        self.scheduler.set_max_running(settings['NEO_MAX_CRAWLS'])
+        self._reload_project_settings(settings)
+
+    def _reload_project_settings(self, settings):
+        """Make crawls started from now on use the current settings.py"""
+        # Workers ociosos carregaram os settings antigos; o engine
+        # compartilhado relê o settings.py a cada crawl
+        if settings['NEO_CRAWL_MODE'] == 'pool':
+            self.worker_pool.restart(settings['NEO_WORKER_POOL_SIZE'])
+        else:
+            self.worker_pool.shutdown()
+
     def on_export_results(self, button):
         """Export results to file"""
-        buffer = self.results_view.get_buffer()
-        start = buffer.get_start_iter()
-        end = buffer.get_end_iter()
-        results_text = buffer.get_text(start, end, False)
-
-        if not results_text or results_text.startswith('// No results'):
+        if self.results_model is None or not self.results_model.get_n_items():
             self.show_toast("No results to export")
             return
 
         dialog = Gtk.FileDialog()
         dialog.set_title("Export Results")
-        dialog.set_initial_name("results.json")
+        dialog.set_initial_name(f"results_{self.results_spider}_{self.results_run_id}.json")
 
         filters = Gio.ListStore.new(Gtk.FileFilter)
 
-        json_filter = Gtk.FileFilter()
-        json_filter.set_name
         json_filter = Gtk.FileFilter()
         json_filter.set_name("JSON files")
         json_filter.add_pattern("*.json")
         filters.append(json_filter)
 
+        jsonl_filter = Gtk.FileFilter()
+        jsonl_filter.set_name("JSON Lines files")
+        jsonl_filter.add_pattern("*.jsonl")
+        filters.append(jsonl_filter)
+
         csv_filter = Gtk.FileFilter()
         csv_filter.set_name("CSV files")
         csv_filter.add_pattern("*.csv")
         filters.append(csv_filter)
 
         dialog.set_filters(filters)
-        dialog.save(self, None, self.on_export_response, results_text)
+        dialog.save(self, None, self.on_export_response, self.results_model.source)
 
-    def on_export_response(self, dialog, result, results_text):
+    def on_export_response(self, dialog, result, source):
         """Callback for export file chooser"""
         try:
             file = dialog.save_finish(result)
-            if file:
-                filepath = file.get_path()
-
-                if filepath.endswith('.json'):
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(results_text)
-
-                elif filepath.endswith('.csv'):
-                    import csv
-                    items = json.loads(results_text)
-
-                    if items:
-                        keys = items[0].keys()
-                        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                            writer = csv.DictWriter(f, fieldnames=keys)
-                            writer.writeheader()
-                            writer.writerows(items)
+        except GLib.Error:
+            # Diálogo cancelado
+            return
 
-                print(f"💾 Exported to: {filepath}")
-                self.show_toast("Results exported successfully")
+        if not file:
+            return
 
-        except Exception as e:
-            print(f"❌ Export error: {e}")
-            self.show_toast(f"Export failed: {e}")
+        exporter = ResultsExporter(source.iter_items, file.get_path())
+        export_dialog = ExportDialog(exporter, self._on_export_finished)
+        export_dialog.present(self)
+
+    def _on_export_finished(self, count, error):
+        """Report the outcome of a background export"""
+        if error:
+            print(f"❌ Export error: {error}")
+            self.show_toast(f"Export failed: {error}")
+        elif count is None:
+            print("🛑 Export cancelled")
+            self.show_toast("Export cancelled")
+        else:
+            print(f"💾 Exported {count} items")
+            self.show_toast(f"Exported {count} items")
@@ -0,0 +1,89 @@
+import json
+import subprocess
+import sys
+import threading
+
+
+class WorkerPool:
+    """Pool of pre-started crawl workers
+
+    Each worker (`neo_spiders.worker` in the Scrapy project) imports Scrapy
+    and loads the project while idle, so a job handed to it skips the cold
+    interpreter start. A worker runs one crawl and exits; the pool starts a
+    replacement right away.
+    """
+
+    def __init__(self, project_path, size=2):
+        self.project_path = project_path
+        self.size = size
+        self.idle = []
+        self.lock = threading.Lock()
+
+    def _spawn(self):
+        return subprocess.Popen(
+            [sys.executable, '-m', 'neo_spiders.worker'],
+            cwd=str(self.project_path),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+
+    def fill(self):
+        """Start workers until the pool has `size` idle ones"""
+        with self.lock:
+            # Descartar workers que morreram enquanto ociosos
+            self.idle = [worker for worker in self.idle if worker.poll() is None]
+            while len(self.idle) < self.size:
+                self.idle.append(self._spawn())
+
+    def run(self, spider_name, settings, args=None):
+        """Hand a crawl to an idle worker and return its process"""
+        worker = None
+        with self.lock:
+            while self.idle:
+                candidate = self.idle.pop(0)
+                if candidate.poll() is None:
+                    worker = candidate
+                    break
+
+        if worker is None:
+            print("⚠️  No warm worker available, starting a cold one")
+            worker = self._spawn()
+
+        job = {'spider': spider_name, 'settings': settings, 'args': args or {}}
+        worker.stdin.write(json.dumps(job) + '\n')
+        worker.stdin.close()
+
+        threading.Thread(target=self.fill, daemon=True).start()
+        return worker
+
+    def restart(self, size=None):
+        """Replace idle workers, e.g. after the project settings changed"""
+        with self.lock:
+            if size is not None:
+                self.size = size
+            stale, self.idle = self.idle, []
+        self._stop(stale)
+        self.fill()
+
+    def shutdown(self):
+        """Let idle workers exit"""
+        with self.lock:
+            stale, self.idle = self.idle, []
+        self._stop(stale)
+
+    def _stop(self, workers):
+        # stdin vazio faz o worker sair sem rodar nada
+        for worker in workers:
+            try:
+                worker.stdin.close()
+            except OSError:
+                pass
+            threading.Thread(target=self._reap, args=(worker,), daemon=True).start()
+
+    def _reap(self, worker):
+        for _ in worker.stdout:
+            pass
+        worker.wait()